@@ -10,9 +10,6 @@ import argparse
 import logging
 from datetime import datetime, timedelta
 
-from src.analysis.pipeline import AnalysisPipeline
-from src.visualization.plots import ResultsVisualizer
-from src.data.storage import DataStorage
 from src.config import get_config
 
 logging.basicConfig(
@@ -22,6 +19,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def visualize_latest_results():
+    """Generate figures from the latest stored analysis results."""
+    from src.visualization.plots import ResultsVisualizer
+    from src.data.storage import DataStorage
+
+    logger.info("Generating visualizations from latest results")
+    storage = DataStorage()
+    visualizer = ResultsVisualizer()
+
+    # Load latest results
+    latest_results_file = storage.get_latest_analysis('event_studies')
+    if not latest_results_file:
+        logger.error("No analysis results found. Run analysis first.")
+        return
+
+    results = storage.load_event_study_results('full_analysis')
+
+    # Create visualizations
+    if results is not None and not results.empty:
+        fig_car = visualizer.plot_car_distribution(results)
+        storage.save_figure(fig_car, 'car_distribution', 'latest')
+
+        fig_ar = visualizer.plot_ar_by_event_type(results)
+        storage.save_figure(fig_ar, 'ar_by_type', 'latest')
+        storage.wait_for_figures()
+
+        print("\nVisualizations saved to data/processed/figures/")
+
+
 def main():
     """Main entry point for CommitTrader."""
     parser = argparse.ArgumentParser(
@@ -64,7 +90,9 @@ def main():
     parser.add_argument(
         '--github-token',
         type=str,
-        help='GitHub personal access token (or set GITHUB_TOKEN env var)'
+        nargs='+',
+        help='GitHub personal access token(s), rotated across requests '
+             '(or set GITHUB_TOKEN / comma-separated GITHUB_TOKENS env vars)'
     )
 
     parser.add_argument(
@@ -76,7 +104,7 @@ def main():
     parser.add_argument(
         '--events-file',
         type=str,
-        help='Path to events CSV file (if --skip-collection)'
+        help='Path to events Parquet or CSV file (if --skip-collection)'
     )
 
     parser.add_argument(
@@ -85,6 +113,12 @@ def main():
         help='Path to custom config file'
     )
 
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached stock prices and GitHub events and refetch them'
+    )
+
     parser.add_argument(
         '--no-reports',
         action='store_true',
@@ -95,6 +129,8 @@ def main():
 
     # Load configuration
     config = get_config(args.config)
+    if args.refresh:
+        config.set('collection.refresh', True)
 
     # Parse dates
     start_date = None
@@ -111,17 +147,30 @@ def main():
     else:
         end_date = datetime.now()
 
-    # Get GitHub token
-    github_token = args.github_token or os.environ.get('GITHUB_TOKEN')
+    # Get GitHub tokens
+    github_tokens = args.github_token
+    if not github_tokens and os.environ.get('GITHUB_TOKENS'):
+        github_tokens = [t.strip() for t in os.environ['GITHUB_TOKENS'].split(',') if t.strip()]
+    if not github_tokens and os.environ.get('GITHUB_TOKEN'):
+        github_tokens = [os.environ['GITHUB_TOKEN']]
 
-    if not github_token:
+    if not github_tokens:
         logger.warning(
             "No GitHub token provided. API rate limit will be 60 requests/hour. "
             "Set GITHUB_TOKEN environment variable or use --github-token for 5000/hour."
         )
 
+    # Visualize mode only needs stored results; skip the analysis stack
+    if args.mode == 'visualize':
+        visualize_latest_results()
+        logger.info("CommitTrader completed successfully!")
+        return
+
+    # Heavy analysis imports deferred until after argument parsing
+    from src.analysis.pipeline import AnalysisPipeline
+
     # Initialize pipeline
-    pipeline = AnalysisPipeline(github_token=github_token)
+    pipeline = AnalysisPipeline(github_tokens=github_tokens)
 
     # Run analysis based on mode
     if args.mode == 'full':
@@ -192,29 +241,6 @@ def main():
             events_file=args.events_file
         )
 
-    elif args.mode == 'visualize':
-        logger.info("Generating visualizations from latest results")
-        storage = DataStorage()
-        visualizer = ResultsVisualizer()
-
-        # Load latest results
-        latest_results_file = storage.get_latest_analysis('event_studies')
-        if not latest_results_file:
-            logger.error("No analysis results found. Run analysis first.")
-            return
-
-        results = storage.load_event_study_results('full_analysis')
-
-        # Create visualizations
-        if results is not None and not results.empty:
-            fig_car = visualizer.plot_car_distribution(results)
-            storage.save_figure(fig_car, 'car_distribution', 'latest')
-
-            fig_ar = visualizer.plot_ar_by_event_type(results)
-            storage.save_figure(fig_ar, 'ar_by_type', 'latest')
-
-            print("\nVisualizations saved to data/processed/figures/")
-
     logger.info("CommitTrader completed successfully!")
 
 
@@ -0,0 +1,193 @@
+"""Compiled numeric kernels for batched event studies.
+
+numba is optional: when it is not installed ``NUMBA_AVAILABLE`` is False and
+callers use their NumPy implementation instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# fastmath flags without 'nnan'/'ninf': missing days are NaN and must stay detectable
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def compute_ars(y_est, m_est, y_evt, m_evt, car_bounds, min_obs):
+        """
+        Fit the market model and compute abnormal returns and CARs per event.
+
+        Args:
+            y_est: (n_events, L) stock returns in each estimation window
+            m_est: (n_events, L) market returns in each estimation window
+            y_evt: (n_events, W) stock returns in each event window
+            m_evt: (n_events, W) market returns in each event window
+            car_bounds: (n_windows, 2) inclusive event-window column bounds
+            min_obs: Minimum estimation observations for the market model
+
+        Returns:
+            Tuple of (alphas, betas, abnormal_returns, cars, insufficient)
+        """
+        n_events, est_len = y_est.shape
+        evt_len = y_evt.shape[1]
+        n_windows = car_bounds.shape[0]
+
+        alphas = np.zeros(n_events)
+        betas = np.ones(n_events)
+        abnormal = np.empty((n_events, evt_len))
+        cars = np.empty((n_events, n_windows))
+        insufficient = np.zeros(n_events, dtype=np.bool_)
+
+        for i in prange(n_events):
+            # Closed-form OLS over the finite estimation days
+            n = 0
+            sum_x = 0.0
+            sum_y = 0.0
+            for j in range(est_len):
+                x = m_est[i, j]
+                y = y_est[i, j]
+                if np.isfinite(x) and np.isfinite(y):
+                    n += 1
+                    sum_x += x
+                    sum_y += y
+
+            alpha = 0.0
+            beta = 1.0
+            fitted = False
+            if n >= min_obs:
+                x_mean = sum_x / n
+                y_mean = sum_y / n
+                sxx = 0.0
+                sxy = 0.0
+                for j in range(est_len):
+                    x = m_est[i, j]
+                    y = y_est[i, j]
+                    if np.isfinite(x) and np.isfinite(y):
+                        dx = x - x_mean
+                        sxx += dx * dx
+                        sxy += dx * (y - y_mean)
+                if sxx > 0.0:
+                    beta = sxy / sxx
+                    alpha = y_mean - beta * x_mean
+                    fitted = True
+
+            # Fall back to market-adjusted returns
+            if not fitted:
+                alpha = 0.0
+                beta = 1.0
+                insufficient[i] = True
+            alphas[i] = alpha
+            betas[i] = beta
+
+            for j in range(evt_len):
+                abnormal[i, j] = y_evt[i, j] - (alpha + beta * m_evt[i, j])
+
+            # NaN-skipping window sums; NaN when a window has no data
+            for k in range(n_windows):
+                total = 0.0
+                has_data = False
+                for j in range(car_bounds[k, 0], car_bounds[k, 1] + 1):
+                    value = abnormal[i, j]
+                    if np.isfinite(value):
+                        total += value
+                        has_data = True
+                cars[i, k] = total if has_data else np.nan
+
+        return alphas, betas, abnormal, cars, insufficient
+
+else:
+    compute_ars = None
+
+
+def _min_gap_mask_numpy(group_codes, times, min_gap):
+    """NumPy version of min_gap_mask."""
+    keep = np.ones(len(times), dtype=np.bool_)
+    keep[1:] = (group_codes[1:] != group_codes[:-1]) | (np.diff(times) >= min_gap)
+    return keep
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def min_gap_mask(group_codes, times, min_gap):
+        """
+        Keep-mask dropping events that follow the previous one in their group too soon.
+
+        Each event is compared with the event just before it (kept or not), and
+        the first event of every group is always kept.
+
+        Args:
+            group_codes: Integer group code per event, sorted by group then time
+            times: Event times as integers, sorted within each group
+            min_gap: Minimum gap to the previous event, in the units of times
+
+        Returns:
+            Boolean mask of events to keep
+        """
+        n = len(times)
+        keep = np.ones(n, dtype=np.bool_)
+        for i in range(1, n):
+            if group_codes[i] == group_codes[i - 1] and times[i] - times[i - 1] < min_gap:
+                keep[i] = False
+        return keep
+
+else:
+    min_gap_mask = _min_gap_mask_numpy
+
+
+def _group_moments_numpy(codes, values, n_groups):
+    """NumPy version of group_moments."""
+    counts = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.bincount(codes, weights=values, minlength=n_groups) / counts
+        centered = values - means[codes]
+        variances = np.bincount(codes, weights=centered * centered, minlength=n_groups) / (counts - 1)
+    return means, np.sqrt(variances), counts
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def group_moments(codes, values, n_groups):
+        """
+        Per-group mean, sample standard deviation and count in two tight passes.
+
+        Args:
+            codes: Group code per value, in [0, n_groups)
+            values: Finite values to reduce
+            n_groups: Number of groups
+
+        Returns:
+            Tuple of (means, stds, counts); NaN where a group has too few values
+        """
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(len(values)):
+            sums[codes[i]] += values[i]
+            counts[codes[i]] += 1
+
+        means = np.full(n_groups, np.nan)
+        for g in range(n_groups):
+            if counts[g] > 0:
+                means[g] = sums[g] / counts[g]
+
+        # Centered second pass keeps the variance accurate for small returns
+        squares = np.zeros(n_groups)
+        for i in range(len(values)):
+            d = values[i] - means[codes[i]]
+            squares[codes[i]] += d * d
+
+        stds = np.full(n_groups, np.nan)
+        for g in range(n_groups):
+            if counts[g] > 1:
+                stds[g] = np.sqrt(squares[g] / (counts[g] - 1))
+        return means, stds, counts
+
+else:
+    group_moments = _group_moments_numpy
@@ -1,20 +1,33 @@
 """Event study methodology for analyzing abnormal returns."""
 
 import logging
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import pandas as pd
 import numpy as np
-from scipy import stats
-import statsmodels.api as sm
 
 from ..config import get_config
-from ..data.stock_collector import StockCollector
+from ..data.stock_collector import StockCollector, EVENT_WINDOW_BUFFER_DAYS, to_naive_dates
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CAR windows reported for every event: name -> (start_day, end_day)
+CAR_WINDOWS = [
+    ('CAR_0_0', (0, 0)),    # Event day only
+    ('CAR_0_1', (0, 1)),    # Event day + 1
+    ('CAR_-1_1', (-1, 1)),  # 3-day window
+    ('CAR_0_5', (0, 5)),    # Post-event week
+    ('CAR_-5_5', (-5, 5)),  # Full event window
+]
+
+# Minimum estimation-window observations for a reliable market model
+MIN_ESTIMATION_OBS = 30
+
 
 class EventStudy:
     """Implements event study methodology for analyzing stock price reactions."""
@@ -24,63 +37,175 @@ class EventStudy:
         self.config = get_config()
         self.stock_collector = StockCollector()
 
+        # Price history fetched during this run: ticker -> (start, end, data)
+        self._price_cache: Dict[str, Tuple[pd.Timestamp, pd.Timestamp, pd.DataFrame]] = {}
+        self._price_cache_lock = threading.Lock()
+
+        # Market index returns for the current range, see _prepare_market_cache
+        self._market_range: Optional[Tuple[pd.Timestamp, pd.Timestamp]] = None
+        self._market_dates = pd.DatetimeIndex([])
+        self._market_returns_np = np.array([], dtype=np.float64)
+
+    def _get_price_history(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> pd.DataFrame:
+        """
+        Get price data for a ticker, reusing history already fetched in this run.
+
+        A request outside the cached range refetches the union of both ranges,
+        so each ticker's cached history only ever grows.
+
+        Args:
+            ticker: Stock or index ticker
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            DataFrame with price data for the requested range
+        """
+        start = to_naive_dates(start_date)
+        end = to_naive_dates(end_date)
+
+        with self._price_cache_lock:
+            cached = self._price_cache.get(ticker)
+        if cached is not None:
+            cached_start, cached_end, data = cached
+            if cached_start <= start and end <= cached_end:
+                return data.loc[start:end] if not data.empty else data
+            start = min(start, cached_start)
+            end = max(end, cached_end)
+
+        data = self.stock_collector.get_stock_data(ticker, start, end)
+        with self._price_cache_lock:
+            self._price_cache[ticker] = (start, end, data)
+
+        if data.empty:
+            return data
+        return data.loc[to_naive_dates(start_date):to_naive_dates(end_date)]
+
+    def _prepare_market_cache(self, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Compute market index returns once for a date range and keep them as an array.
+
+        Does nothing if the current cache already covers the range.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            True if market returns are available
+        """
+        start = to_naive_dates(start_date)
+        end = to_naive_dates(end_date)
+
+        if self._market_range is not None:
+            cached_start, cached_end = self._market_range
+            if cached_start <= start and end <= cached_end:
+                return len(self._market_returns_np) > 0
+
+        market_ticker = self.config.market_index
+        self._get_price_history(market_ticker, start, end)
+        with self._price_cache_lock:
+            cached_start, cached_end, market_data = self._price_cache[market_ticker]
+
+        self._market_range = (cached_start, cached_end)
+        if market_data.empty:
+            self._market_dates = pd.DatetimeIndex([])
+            self._market_returns_np = np.array([], dtype=np.float64)
+            return False
+
+        self._market_dates = market_data.index
+        self._market_returns_np = self._simple_returns(market_data['close'].to_numpy(dtype=np.float64))
+        return True
+
+    def _market_returns_on(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Look up cached market returns for the given trading days (NaN where missing).
+
+        Args:
+            dates: Trading days to look up
+
+        Returns:
+            Array of market returns aligned with dates
+        """
+        positions = self._market_dates.get_indexer(dates)
+        if len(self._market_returns_np) == 0:
+            return np.full(len(dates), np.nan)
+        return np.where(positions >= 0, self._market_returns_np[positions], np.nan)
+
     def calculate_market_model_parameters(
         self,
-        stock_returns: pd.Series,
-        market_returns: pd.Series
+        stock_returns: np.ndarray,
+        market_returns: np.ndarray
     ) -> Tuple[float, float, float]:
         """
-        Estimate market model parameters using OLS regression.
+        Estimate market model parameters using closed-form OLS.
 
         Market Model: R_it = α_i + β_i * R_mt + ε_it
 
         Args:
             stock_returns: Stock returns during estimation period
-            market_returns: Market returns during estimation period
+            market_returns: Market returns during estimation period (aligned with stock_returns)
 
         Returns:
             Tuple of (alpha, beta, residual_std)
         """
-        # Align the series and drop NaN
-        df = pd.DataFrame({
-            'stock': stock_returns,
-            'market': market_returns
-        }).dropna()
+        x = np.asarray(market_returns, dtype=np.float64)
+        y = np.asarray(stock_returns, dtype=np.float64)
 
-        if len(df) < 30:  # Minimum observations for reliable estimation
-            logger.warning(f"Insufficient data for market model: {len(df)} observations")
+        # Drop days where either return is missing
+        mask = np.isfinite(x) & np.isfinite(y)
+        x = x[mask]
+        y = y[mask]
+
+        if len(x) < MIN_ESTIMATION_OBS:
+            logger.warning(f"Insufficient data for market model: {len(x)} observations")
             return 0.0, 1.0, np.nan
 
-        # OLS regression
-        X = sm.add_constant(df['market'])
-        y = df['stock']
+        x_mean = x.mean()
+        y_mean = y.mean()
+        dx = x - x_mean
+        dy = y - y_mean
 
-        try:
-            model = sm.OLS(y, X).fit()
-            alpha = model.params['const']
-            beta = model.params['market']
-            residual_std = np.sqrt(model.mse_resid)
-
-            return alpha, beta, residual_std
-        except Exception as e:
-            logger.error(f"Error in market model estimation: {e}")
+        sxx = dx @ dx
+        if sxx == 0:
+            logger.error("Error in market model estimation: zero market variance")
             return 0.0, 1.0, np.nan
 
+        beta = (dx @ dy) / sxx
+        alpha = y_mean - beta * x_mean
+        residuals = y - alpha - beta * x
+        residual_std = np.sqrt((residuals @ residuals) / (len(x) - 2))
+
+        return alpha, beta, residual_std
+
     def calculate_expected_returns(
         self,
         event_window_data: pd.DataFrame,
         estimation_window_data: pd.DataFrame,
-        market_data: pd.DataFrame,
-        model: str = 'market'
+        market_data: Optional[pd.DataFrame] = None,
+        model: str = 'market',
+        est_stock_returns: Optional[np.ndarray] = None,
+        market_returns_event: Optional[np.ndarray] = None,
+        est_market_returns: Optional[np.ndarray] = None
     ) -> pd.Series:
         """
         Calculate expected returns for event window.
 
+        Returns that are not passed in precomputed are derived from the price data.
+
         Args:
             event_window_data: Stock data for event window
             estimation_window_data: Stock data for estimation window
-            market_data: Market index data
+            market_data: Market index data (None uses the prepared market cache)
             model: Model type ('market', 'mean_adjusted', 'market_adjusted')
+            est_stock_returns: Stock returns for the estimation window
+            market_returns_event: Market returns for the event window
+            est_market_returns: Market returns for the estimation window
 
         Returns:
             Series with expected returns for event window
@@ -88,51 +213,80 @@ class EventStudy:
         if event_window_data.empty:
             return pd.Series()
 
-        # Calculate returns
-        stock_returns_event = event_window_data['close'].pct_change()
+        event_index = event_window_data.index
+
+        if market_returns_event is None or est_market_returns is None:
+            if market_data is None:
+                market_returns_on = self._market_returns_on
+            else:
+                market_returns = pd.Series(
+                    self._simple_returns(market_data['close'].to_numpy(dtype=np.float64)),
+                    index=market_data.index
+                )
+
+                def market_returns_on(dates):
+                    return market_returns.reindex(dates).to_numpy(dtype=np.float64)
+
+            if market_returns_event is None:
+                market_returns_event = market_returns_on(event_index)
+            if est_market_returns is None:
+                est_market_returns = market_returns_on(estimation_window_data.index)
+
+        if est_stock_returns is None:
+            est_stock_returns = self._simple_returns(
+                estimation_window_data['close'].to_numpy(dtype=np.float64)
+            )
 
         if model == 'mean_adjusted':
             # Expected return = mean return during estimation period
             if estimation_window_data.empty:
                 expected_return = 0.0
             else:
-                est_returns = estimation_window_data['close'].pct_change()
-                expected_return = est_returns.mean()
+                finite_returns = est_stock_returns[np.isfinite(est_stock_returns)]
+                expected_return = finite_returns.mean() if len(finite_returns) else np.nan
 
-            expected_returns = pd.Series(expected_return, index=stock_returns_event.index)
+            expected_returns = pd.Series(expected_return, index=event_index)
 
         elif model == 'market_adjusted':
             # Expected return = market return
-            market_returns = market_data['close'].pct_change()
-            expected_returns = market_returns.reindex(stock_returns_event.index)
+            expected_returns = pd.Series(market_returns_event, index=event_index)
 
         elif model == 'market':
             # Expected return from market model
             if estimation_window_data.empty:
                 # Fallback to market-adjusted
-                market_returns = market_data['close'].pct_change()
-                expected_returns = market_returns.reindex(stock_returns_event.index)
+                expected_returns = pd.Series(market_returns_event, index=event_index)
             else:
                 # Estimate market model parameters
-                est_returns = estimation_window_data['close'].pct_change()
-                est_market_returns = market_data['close'].pct_change()
-                est_market_returns = est_market_returns.reindex(estimation_window_data.index)
-
                 alpha, beta, _ = self.calculate_market_model_parameters(
-                    est_returns, est_market_returns
+                    est_stock_returns, est_market_returns
                 )
 
                 # Calculate expected returns for event window
-                event_market_returns = market_data['close'].pct_change()
-                event_market_returns = event_market_returns.reindex(event_window_data.index)
-
-                expected_returns = alpha + beta * event_market_returns
+                expected_returns = pd.Series(
+                    alpha + beta * market_returns_event, index=event_index
+                )
 
         else:
             raise ValueError(f"Unknown model type: {model}")
 
         return expected_returns
 
+    @staticmethod
+    def _simple_returns(prices: np.ndarray) -> np.ndarray:
+        """
+        Daily simple returns of a price series (NaN on the first day).
+
+        Args:
+            prices: Closing prices ordered by trading day
+
+        Returns:
+            Array of returns aligned with prices
+        """
+        returns = np.full(len(prices), np.nan)
+        returns[1:] = np.diff(prices) / prices[:-1]
+        return returns
+
     def calculate_abnormal_returns(
         self,
         ticker: str,
@@ -168,55 +322,66 @@ class EventStudy:
         if estimation_end is None:
             estimation_end = self.config.estimation_window_end
 
-        # Get stock data for event and estimation windows
+        # Get stock data for event and estimation windows (prices use naive dates
+        # and windows start from the event's calendar day, as in the batch path;
+        # the result keeps the caller's event_date)
+        event_day = to_naive_dates(event_date).normalize()
+        data_start = event_day + pd.Timedelta(days=estimation_start - EVENT_WINDOW_BUFFER_DAYS)
+        data_end = event_day + pd.Timedelta(days=post_days + EVENT_WINDOW_BUFFER_DAYS)
+        stock_data = self._get_price_history(ticker, data_start, data_end)
         event_window, estimation_window = self.stock_collector.get_event_window_data(
-            ticker, event_date, pre_days, post_days, estimation_start, estimation_end
+            ticker, event_day, pre_days, post_days, estimation_start, estimation_end,
+            stock_data=stock_data
         )
 
         if event_window.empty:
             logger.warning(f"No event window data for {ticker} on {event_date}")
             return pd.DataFrame()
 
-        # Get market data
-        market_start = event_date + pd.Timedelta(days=estimation_start - 10)
-        market_end = event_date + pd.Timedelta(days=post_days + 10)
-        market_data = self.stock_collector.get_market_data(market_start, market_end)
-
-        if market_data.empty:
+        # Get market returns over the same range as the stock data
+        if not self._prepare_market_cache(data_start, data_end):
             logger.warning("No market data available")
             return pd.DataFrame()
 
+        # Stock returns computed once over the full history, then sliced per window
+        stock_returns = self._simple_returns(stock_data['close'].to_numpy(dtype=np.float64))
+        actual_returns = stock_returns[stock_data.index.get_indexer(event_window.index)]
+        est_stock_returns = stock_returns[stock_data.index.get_indexer(estimation_window.index)]
+
         # Calculate expected returns
         expected_returns = self.calculate_expected_returns(
-            event_window, estimation_window, market_data, model
+            event_window, estimation_window, model=model,
+            est_stock_returns=est_stock_returns,
+            market_returns_event=self._market_returns_on(event_window.index),
+            est_market_returns=self._market_returns_on(estimation_window.index)
         )
 
-        # Calculate actual and abnormal returns
-        actual_returns = event_window['close'].pct_change()
-
-        # Create results DataFrame
-        results = pd.DataFrame({
-            'date': event_window.index,
-            'actual_return': actual_returns.values,
-            'expected_return': expected_returns.values,
-        })
-
-        results['abnormal_return'] = results['actual_return'] - results['expected_return']
+        # Abnormal returns on the aligned arrays, no pandas index alignment
+        expected_returns = expected_returns.to_numpy(dtype=np.float64)
+        abnormal_returns = np.subtract(actual_returns, expected_returns)
 
-        # Add event time (days relative to event)
+        # Event time (days relative to event)
         event_trading_day = self.stock_collector.align_event_to_trading_day(
-            event_date, event_window.index, 'forward'
+            event_day, event_window.index, 'forward'
         )
 
+        n_days = len(event_window)
         if event_trading_day is not None:
             event_idx = event_window.index.get_loc(event_trading_day)
-            results['event_time'] = range(-event_idx, len(results) - event_idx)
+            event_time = np.arange(-event_idx, n_days - event_idx)
         else:
-            results['event_time'] = range(len(results))
+            event_time = np.arange(n_days)
 
-        # Add metadata
-        results['ticker'] = ticker
-        results['event_date'] = event_date
+        # Create results DataFrame in one shot
+        results = pd.DataFrame({
+            'date': event_window.index,
+            'actual_return': actual_returns,
+            'expected_return': expected_returns,
+            'abnormal_return': abnormal_returns,
+            'event_time': event_time,
+            'ticker': ticker,
+            'event_date': event_date,
+        })
 
         return results
 
@@ -241,16 +406,48 @@ class EventStudy:
             return pd.DataFrame()
 
         # Filter to CAR window
-        mask = abnormal_returns['event_time'] >= start_day
+        event_time = abnormal_returns['event_time'].to_numpy()
+        mask = event_time >= start_day
         if end_day is not None:
-            mask = mask & (abnormal_returns['event_time'] <= end_day)
+            mask &= event_time <= end_day
+
+        # Build the window frame once from column slices, CAR included
+        car_data = {col: abnormal_returns[col].array[mask] for col in abnormal_returns.columns}
+        car_data['CAR'] = pd.Series(car_data['abnormal_return']).cumsum().to_numpy()
 
-        car_data = abnormal_returns[mask].copy()
+        return pd.DataFrame(car_data, index=abnormal_returns.index[mask])
 
-        # Calculate CAR
-        car_data['CAR'] = car_data['abnormal_return'].cumsum()
+    @staticmethod
+    def _car_value(
+        abnormal_returns: np.ndarray,
+        event_time: np.ndarray,
+        start_day: int,
+        end_day: int
+    ) -> Optional[float]:
+        """
+        Sum abnormal returns over a CAR window without building a DataFrame.
 
-        return car_data
+        Args:
+            abnormal_returns: Abnormal returns ordered by event time
+            event_time: Sorted trading-day offsets relative to the event
+            start_day: Start day of CAR window (inclusive)
+            end_day: End day of CAR window (inclusive)
+
+        Returns:
+            CAR value (NaN if the window has no finite returns), or None if no
+            day falls inside the window
+        """
+        # event_time is sorted, so the window is a contiguous slice (a view)
+        i0 = np.searchsorted(event_time, start_day, side='left')
+        i1 = np.searchsorted(event_time, end_day, side='right')
+        if i1 <= i0:
+            return None
+
+        window = abnormal_returns[i0:i1]
+        finite = np.isfinite(window)
+        if not finite.any():
+            return np.nan
+        return float(window[finite].sum())
 
     def analyze_event(
         self,
@@ -289,27 +486,25 @@ class EventStudy:
                 'reason': 'Insufficient data'
             }
 
-        # Calculate CAR for different windows
+        # Calculate CAR for different windows on the underlying arrays
+        ar = ar_df['abnormal_return'].to_numpy(dtype=np.float64)
+        event_time = ar_df['event_time'].to_numpy()
+
         car_results = {}
-        for window_name, (start, end) in [
-            ('CAR_0_0', (0, 0)),    # Event day only
-            ('CAR_0_1', (0, 1)),    # Event day + 1
-            ('CAR_-1_1', (-1, 1)),  # 3-day window
-            ('CAR_0_5', (0, 5)),    # Post-event week
-            ('CAR_-5_5', (-5, 5)),  # Full event window
-        ]:
-            car_df = self.calculate_cumulative_abnormal_returns(ar_df, start, end)
-            if not car_df.empty:
-                car_results[window_name] = car_df['CAR'].iloc[-1]
+        for window_name, (start, end) in CAR_WINDOWS:
+            car = self._car_value(ar, event_time, start, end)
+            if car is not None:
+                car_results[window_name] = car
 
         # Calculate statistics
         mean_ar = ar_df['abnormal_return'].mean()
         std_ar = ar_df['abnormal_return'].std()
         median_ar = ar_df['abnormal_return'].median()
 
-        # Event day AR (day 0)
-        event_day_ar = ar_df[ar_df['event_time'] == 0]['abnormal_return']
-        ar_day_0 = event_day_ar.iloc[0] if not event_day_ar.empty else np.nan
+        # Event day AR (day 0); event_time is a contiguous range, so day 0
+        # sits at a fixed offset from its first value
+        day_0_pos = -event_time[0]
+        ar_day_0 = ar[day_0_pos] if 0 <= day_0_pos < len(ar) else np.nan
 
         return {
             'ticker': ticker,
@@ -330,36 +525,577 @@ class EventStudy:
         events: pd.DataFrame,
         ticker_col: str = 'ticker',
         date_col: str = 'date',
-        type_col: str = 'event_type'
+        type_col: str = 'event_type',
+        output_parquet: Optional[str] = None,
+        batch_size: int = 4096
     ) -> pd.DataFrame:
         """
         Analyze multiple events in batch.
 
+        With output_parquet set, events are analyzed batch_size at a time and each
+        batch of results is appended to the Parquet file before the next one runs.
+
         Args:
             events: DataFrame with event information
             ticker_col: Column name for ticker
             date_col: Column name for event date
             type_col: Column name for event type
+            output_parquet: Path of a Parquet file to stream results into
+            batch_size: Events per batch when streaming to Parquet
 
         Returns:
             DataFrame with analysis results for all events
         """
-        results = []
+        if output_parquet is None or events.empty:
+            return self.analyze_events_vectorized(events, ticker_col, date_col, type_col)
 
-        for idx, row in events.iterrows():
-            try:
-                result = self.analyze_event(
-                    ticker=row[ticker_col],
-                    event_date=pd.to_datetime(row[date_col]),
-                    event_type=row[type_col],
-                    event_metadata=row.to_dict()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Later batches are served from the price cache
+        self.prefetch_price_data(events, ticker_col, date_col)
+
+        metadata_type = pa.struct(list(pa.Schema.from_pandas(events, preserve_index=False)))
+        writer = None
+        try:
+            for start in range(0, len(events), batch_size):
+                batch = self.analyze_events_vectorized(
+                    events.iloc[start:start + batch_size], ticker_col, date_col, type_col
+                )
+                if batch.empty:
+                    continue
+
+                if writer is None:
+                    schema = self._results_schema(batch, metadata_type)
+                    writer = pq.ParquetWriter(output_parquet, schema)
+                writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            return pd.DataFrame()
+
+        logger.info(f"Saved event study results to {output_parquet}")
+        return pq.read_table(output_parquet).to_pandas()
+
+    @staticmethod
+    def _results_schema(results: pd.DataFrame, metadata_type):
+        """
+        Arrow schema for streamed event results.
+
+        Columns that can be all-null within one batch get explicit types so
+        every batch matches the schema of the first.
+
+        Args:
+            results: First batch of event results
+            metadata_type: Arrow struct type of the event metadata
+
+        Returns:
+            pyarrow.Schema for the results file
+        """
+        import pyarrow as pa
+
+        explicit_types = {
+            'ticker': pa.string(),
+            'event_type': pa.string(),
+            'valid': pa.bool_(),
+            'metadata': metadata_type,
+            'reason': pa.string(),
+        }
+        inferred = pa.Schema.from_pandas(results, preserve_index=False)
+        return pa.schema([
+            pa.field(field.name, explicit_types.get(
+                field.name, pa.float64() if pa.types.is_floating(field.type) else field.type
+            ))
+            for field in inferred
+        ])
+
+    def _event_data_range(self, event_days: np.ndarray) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Price-history range covering the estimation and event windows of events.
+
+        Args:
+            event_days: Event dates as datetime64[D]
+
+        Returns:
+            Tuple of (start, end) timestamps
+        """
+        data_start = event_days.min() + np.timedelta64(
+            self.config.estimation_window_start - EVENT_WINDOW_BUFFER_DAYS, 'D'
+        )
+        data_end = event_days.max() + np.timedelta64(
+            self.config.event_window_post + EVENT_WINDOW_BUFFER_DAYS, 'D'
+        )
+        return pd.Timestamp(data_start), pd.Timestamp(data_end)
+
+    def prefetch_price_data(
+        self,
+        events: pd.DataFrame,
+        ticker_col: str = 'ticker',
+        date_col: str = 'date'
+    ) -> None:
+        """
+        Fetch market data and each ticker's full price range for events up front.
+
+        Fetches run concurrently; later analyses of any subset of these events
+        are then served from the price cache.
+
+        Args:
+            events: DataFrame with event information
+            ticker_col: Column name for ticker
+            date_col: Column name for event date
+        """
+        if events.empty:
+            return
+
+        event_days = pd.to_datetime(events[date_col]).values.astype('datetime64[D]')
+        self._prepare_market_cache(*self._event_data_range(event_days))
+
+        groups = events.groupby(ticker_col, sort=False, observed=True).indices.items()
+        with ThreadPoolExecutor(max_workers=self.config.get('event_study.max_workers', 8)) as executor:
+            for ticker, positions in groups:
+                executor.submit(
+                    self._get_price_history, ticker, *self._event_data_range(event_days[positions])
+                )
+
+    def analyze_events_batch(
+        self,
+        ticker: str,
+        event_dates: np.ndarray,
+        event_types: np.ndarray,
+        event_metadata: Optional[List[Dict]] = None
+    ) -> pd.DataFrame:
+        """
+        Analyze all events of one ticker with a single price fetch.
+
+        Args:
+            ticker: Stock ticker
+            event_dates: Event dates
+            event_types: Event type of each event
+            event_metadata: Optional metadata dict per event
+
+        Returns:
+            DataFrame with analysis results (same order as the input events)
+        """
+        n_events = len(event_dates)
+        if n_events == 0:
+            return pd.DataFrame()
+
+        model = self.config.get('event_study.expected_return_model', 'market')
+        event_dates = pd.DatetimeIndex(pd.to_datetime(event_dates))
+        windows = self.get_event_windows_batch(ticker, event_dates)
+
+        columns = self._empty_result_columns(n_events)
+        valid = np.zeros(n_events, dtype=bool)
+        if windows is not None:
+            valid = windows['valid']
+            summary = self._abnormal_return_summary(windows, model)
+            for name, values in columns.items():
+                values[:] = summary[name]
+
+        metadata = np.full(n_events, None, dtype=object)
+        for i in np.flatnonzero(valid):
+            metadata[i] = event_metadata[i] if event_metadata is not None else {}
+
+        return self._results_frame(
+            np.full(n_events, ticker, dtype=object), event_dates.array,
+            np.asarray(event_types, dtype=object), valid, columns, metadata
+        )
+
+    def get_event_windows_batch(
+        self,
+        ticker: str,
+        event_dates: pd.DatetimeIndex
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Get stacked event and estimation windows for many events of one ticker.
+
+        Prices are fetched once for the range covering every event and all events
+        are aligned in one pass, instead of one get_event_window_data call per event.
+        Window lengths come from the event study config.
+
+        Args:
+            ticker: Stock ticker
+            event_dates: Event dates
+
+        Returns:
+            Dictionary of per-event arrays: 'valid' (n_events,), 'stock_event' and
+            'market_event' returns of shape (n_events, pre + post + 1), 'stock_est'
+            and 'market_est' returns of shape (n_events, estimation window length),
+            and the 'in_range' mask of the event window; None if no price data
+            is available
+        """
+        event_days = to_naive_dates(pd.DatetimeIndex(event_dates)).values.astype('datetime64[D]')
+
+        has_market_data = self._prepare_market_cache(*self._event_data_range(event_days))
+        if not has_market_data:
+            logger.warning("No market data available")
+
+        return self._ticker_event_windows(ticker, event_days, has_market_data)
+
+    @staticmethod
+    def _empty_result_columns(n_events: int) -> Dict[str, np.ndarray]:
+        """NaN-filled numeric result columns for n_events events."""
+        names = ['ar_day_0', 'mean_ar', 'median_ar', 'std_ar']
+        names += [name for name, _ in CAR_WINDOWS] + ['num_observations']
+        return {name: np.full(n_events, np.nan) for name in names}
+
+    @staticmethod
+    def _results_frame(
+        tickers: np.ndarray,
+        event_dates,
+        event_types: np.ndarray,
+        valid: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        metadata: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Assemble per-event result columns into one results DataFrame.
+
+        Args:
+            tickers: Ticker of each event
+            event_dates: Event dates
+            event_types: Event type of each event
+            valid: Whether each event could be analyzed
+            columns: Numeric result columns from _empty_result_columns
+            metadata: Metadata of each event (None for invalid events)
+
+        Returns:
+            DataFrame with one row per event
+        """
+        for values in columns.values():
+            values[~valid] = np.nan
+
+        return pd.DataFrame({
+            'ticker': tickers,
+            'event_date': event_dates,
+            'event_type': event_types,
+            'valid': valid,
+            **{name: columns[name] for name in ['ar_day_0', 'mean_ar', 'median_ar', 'std_ar']},
+            **{name: columns[name] for name, _ in CAR_WINDOWS},
+            'metadata': metadata,
+            'num_observations': columns['num_observations'],
+            'reason': np.where(valid, None, 'Insufficient data'),
+        })
+
+    def analyze_events_vectorized(
+        self,
+        events: pd.DataFrame,
+        ticker_col: str = 'ticker',
+        date_col: str = 'date',
+        type_col: str = 'event_type'
+    ) -> pd.DataFrame:
+        """
+        Analyze multiple events with one price fetch per ticker and one batched solve.
+
+        Events are grouped by ticker; each ticker's price history is fetched once
+        over the union of its event windows, and the estimation/event windows of
+        all its events are sliced by integer position. The windows of every ticker
+        are then stacked and all market models are estimated in a single pass.
+
+        Args:
+            events: DataFrame with event information
+            ticker_col: Column name for ticker
+            date_col: Column name for event date
+            type_col: Column name for event type
+
+        Returns:
+            DataFrame with analysis results for all events (same order as input)
+        """
+        if events.empty:
+            return pd.DataFrame()
+
+        model = self.config.get('event_study.expected_return_model', 'market')
+
+        # Convert dates once; window bounds are integer day arithmetic from here on
+        event_dates = pd.to_datetime(events[date_col])
+        event_days = event_dates.values.astype('datetime64[D]')
+
+        # Market data for the whole batch, fetched once
+        has_market_data = self._prepare_market_cache(*self._event_data_range(event_days))
+        if not has_market_data:
+            logger.warning("No market data available")
+
+        # Gather windows for every ticker; price fetches overlap across threads
+        groups = list(events.groupby(ticker_col, sort=False, observed=True).indices.items())
+        max_workers = self.config.get('event_study.max_workers', 8)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._ticker_event_windows, ticker, event_days[ticker_positions], has_market_data
                 )
-                results.append(result)
+                for ticker, ticker_positions in groups
+            ]
+
+        n_events = len(events)
+        included = np.zeros(n_events, dtype=bool)
+        valid = np.zeros(n_events, dtype=bool)
+        data_positions = []
+        windows = []
+        for (ticker, ticker_positions), future in zip(groups, futures):
+            try:
+                ticker_windows = future.result()
             except Exception as e:
-                logger.error(f"Error analyzing event {idx}: {e}")
+                logger.error(f"Error analyzing events for {ticker}: {e}")
                 continue
 
-        return pd.DataFrame(results)
+            included[ticker_positions] = True
+            if ticker_windows is not None:
+                valid[ticker_positions] = ticker_windows['valid']
+                data_positions.append(ticker_positions)
+                windows.append(ticker_windows)
+
+        # Result columns, written by event position
+        columns = self._empty_result_columns(n_events)
+
+        # Solve all events at once
+        if windows:
+            stacked = {
+                key: np.concatenate([w[key] for w in windows])
+                for key in ('stock_est', 'market_est', 'stock_event', 'market_event', 'in_range')
+            }
+            summary = self._abnormal_return_summary(stacked, model)
+            stacked_positions = np.concatenate(data_positions)
+            for name, values in columns.items():
+                values[stacked_positions] = summary[name]
+
+        valid_positions = np.flatnonzero(valid)
+        metadata = np.full(n_events, None, dtype=object)
+        metadata[valid_positions] = events.iloc[valid_positions].to_dict('records')
+
+        results = self._results_frame(
+            events[ticker_col].to_numpy(), event_dates.array, events[type_col].to_numpy(),
+            valid, columns, metadata
+        )
+
+        return results[included].reset_index(drop=True)
+
+    def _ticker_event_windows(
+        self,
+        ticker: str,
+        event_days: np.ndarray,
+        has_market_data: bool = True
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Slice estimation and event windows for all events of one ticker.
+
+        Args:
+            ticker: Stock ticker
+            event_days: Event dates for this ticker as datetime64[D]
+            has_market_data: Whether the market cache covering all event windows is populated
+
+        Returns:
+            Dictionary of per-event window arrays, or None if no price data is available
+        """
+        pre_days = self.config.event_window_pre
+        post_days = self.config.event_window_post
+        estimation_start = self.config.estimation_window_start
+        estimation_end = self.config.estimation_window_end
+
+        if not has_market_data:
+            return None
+
+        logger.info(f"Analyzing {len(event_days)} events for {ticker}")
+
+        # One fetch covering every event window of this ticker
+        stock_data = self._get_price_history(ticker, *self._event_data_range(event_days))
+        if stock_data.empty:
+            logger.warning(f"No stock data for {ticker}")
+            return None
+
+        trading_days = stock_data.index.values.astype('datetime64[D]')
+        n_days = len(trading_days)
+
+        stock_returns = self._simple_returns(stock_data['close'].to_numpy(dtype=np.float64))
+        market_returns = self._market_returns_on(stock_data.index)
+
+        # Align every event to the next trading day in one searchsorted call;
+        # the aligned day must fall inside the event's own data range
+        event_idx = np.searchsorted(trading_days, event_days, side='left')
+        valid = event_idx < n_days
+        aligned_days = trading_days[np.minimum(event_idx, n_days - 1)]
+        valid &= aligned_days <= event_days + np.timedelta64(post_days + EVENT_WINDOW_BUFFER_DAYS, 'D')
+
+        # Each event only sees history from the start of its own data range, as
+        # a single-event analysis would, so results do not depend on which
+        # other events share the batch
+        range_start = event_days + np.timedelta64(estimation_start - EVENT_WINDOW_BUFFER_DAYS, 'D')
+        first_idx = np.searchsorted(trading_days, range_start, side='left')[:, None]
+
+        # Event window: (n_events, pre + post + 1)
+        event_offsets = np.arange(-pre_days, post_days + 1)
+        stock_event, in_range = self._gather_windows(stock_returns, event_idx, event_offsets)
+        market_event, _ = self._gather_windows(market_returns, event_idx, event_offsets)
+        event_positions = event_idx[:, None] + event_offsets
+        in_range &= event_positions >= first_idx
+        stock_event[event_positions <= first_idx] = np.nan
+
+        # Estimation window: (n_events, estimation_end - estimation_start + 1)
+        est_offsets = np.arange(estimation_start, estimation_end + 1)
+        stock_est, _ = self._gather_windows(stock_returns, event_idx, est_offsets)
+        market_est, _ = self._gather_windows(market_returns, event_idx, est_offsets)
+        stock_est[event_idx[:, None] + est_offsets <= first_idx] = np.nan
+
+        return {
+            'valid': valid,
+            'stock_event': stock_event,
+            'market_event': market_event,
+            'stock_est': stock_est,
+            'market_est': market_est,
+            'in_range': in_range,
+        }
+
+    def _abnormal_return_summary(
+        self,
+        windows: Dict[str, np.ndarray],
+        model: str = 'market'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute abnormal returns, CARs and summary statistics for stacked event windows.
+
+        Args:
+            windows: Stacked window arrays from _ticker_event_windows
+            model: Expected return model
+
+        Returns:
+            Dictionary of per-event result arrays
+        """
+        stock_event = windows['stock_event']
+        market_event = windows['market_event']
+        stock_est = windows['stock_est']
+        day_0 = self.config.event_window_pre  # column of event_time == 0
+        cars = None
+
+        # Deferred: importing numba is slow and only the batch path needs it
+        from ._kernels import NUMBA_AVAILABLE, compute_ars
+
+        if model == 'market' and NUMBA_AVAILABLE:
+            car_bounds = np.array(
+                [(day_0 + start, day_0 + end) for _, (start, end) in CAR_WINDOWS], dtype=np.int64
+            )
+            _, _, abnormal, cars, insufficient = compute_ars(
+                np.ascontiguousarray(stock_est, dtype=np.float64),
+                np.ascontiguousarray(windows['market_est'], dtype=np.float64),
+                np.ascontiguousarray(stock_event, dtype=np.float64),
+                np.ascontiguousarray(market_event, dtype=np.float64),
+                car_bounds,
+                MIN_ESTIMATION_OBS,
+            )
+            if insufficient.any():
+                logger.warning(
+                    f"Insufficient data for market model in {insufficient.sum()} events"
+                )
+        else:
+            if model == 'market':
+                alphas, betas, _ = self.estimate_market_model_batch(stock_est, windows['market_est'])
+                expected = alphas[:, None] + betas[:, None] * market_event
+            elif model == 'market_adjusted':
+                expected = market_event
+            elif model == 'mean_adjusted':
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    mean_est = np.nanmean(stock_est, axis=1)
+                expected = np.broadcast_to(np.nan_to_num(mean_est)[:, None], stock_event.shape)
+            else:
+                raise ValueError(f"Unknown model type: {model}")
+
+            abnormal = stock_event - expected
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            summary = {
+                'ar_day_0': abnormal[:, day_0],
+                'mean_ar': np.nanmean(abnormal, axis=1),
+                'median_ar': np.nanmedian(abnormal, axis=1),
+                'std_ar': np.nanstd(abnormal, axis=1, ddof=1),
+                'num_observations': windows['in_range'].sum(axis=1),
+            }
+
+        if cars is not None:
+            for k, (name, _) in enumerate(CAR_WINDOWS):
+                summary[name] = cars[:, k]
+            return summary
+
+        finite = np.isfinite(abnormal)
+        for name, (start, end) in CAR_WINDOWS:
+            cols = slice(day_0 + start, day_0 + end + 1)
+            has_data = finite[:, cols].any(axis=1)
+            car = np.where(finite[:, cols], abnormal[:, cols], 0.0).sum(axis=1)
+            summary[name] = np.where(has_data, car, np.nan)
+
+        return summary
+
+    @staticmethod
+    def _gather_windows(
+        values: np.ndarray,
+        anchor_idx: np.ndarray,
+        offsets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Slice fixed-offset windows around anchor positions, NaN-padding out-of-range days.
+
+        Args:
+            values: 1-D array indexed by trading day
+            anchor_idx: Anchor position for each window
+            offsets: Offsets relative to the anchor
+
+        Returns:
+            Tuple of (windows, in_range mask), each of shape (len(anchor_idx), len(offsets))
+        """
+        positions = anchor_idx[:, None] + offsets[None, :]
+        in_range = (positions >= 0) & (positions < len(values))
+        windows = np.where(in_range, values[np.clip(positions, 0, len(values) - 1)], np.nan)
+        return windows, in_range
+
+    def estimate_market_model_batch(
+        self,
+        stock_returns: np.ndarray,
+        market_returns: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Estimate market model parameters for many events with one matrix pass.
+
+        Each row is one event's estimation window. Rows are centered and the
+        closed-form OLS slopes are computed for all events together; missing
+        days are masked out per row.
+
+        Args:
+            stock_returns: (n_events, L) stock returns in each estimation window
+            market_returns: (n_events, L) market returns in each estimation window
+
+        Returns:
+            Tuple of (alphas, betas, residual_stds) arrays
+        """
+        mask = np.isfinite(stock_returns) & np.isfinite(market_returns)
+        n_obs = mask.sum(axis=1)
+        x = np.where(mask, market_returns, 0.0)
+        y = np.where(mask, stock_returns, 0.0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = x.sum(axis=1) / n_obs
+            y_mean = y.sum(axis=1) / n_obs
+            dx = np.where(mask, x - x_mean[:, None], 0.0)
+            dy = np.where(mask, y - y_mean[:, None], 0.0)
+
+            betas = np.einsum('ij,ij->i', dx, dy) / np.einsum('ij,ij->i', dx, dx)
+            alphas = y_mean - betas * x_mean
+
+            residuals = np.where(mask, dy - betas[:, None] * dx, 0.0)
+            residual_stds = np.sqrt(np.einsum('ij,ij->i', residuals, residuals) / (n_obs - 2))
+
+        # Same fallback as the single-event estimator: market-adjusted returns
+        insufficient = (n_obs < MIN_ESTIMATION_OBS) | ~np.isfinite(betas)
+        if insufficient.any():
+            logger.warning(
+                f"Insufficient data for market model in {insufficient.sum()} events"
+            )
+        alphas = np.where(insufficient, 0.0, alphas)
+        betas = np.where(insufficient, 1.0, betas)
+        residual_stds = np.where(insufficient, np.nan, residual_stds)
+
+        return alphas, betas, residual_stds
 
     def aggregate_results(
         self,
@@ -380,29 +1116,68 @@ class EventStudy:
             return pd.DataFrame()
 
         # Filter valid results
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid'] == True]
 
         if valid_results.empty:
             logger.warning("No valid results to aggregate")
             return pd.DataFrame()
 
-        # Aggregate by group
-        agg_funcs = {
-            'ar_day_0': ['mean', 'median', 'std', 'count'],
-            'mean_ar': 'mean',
-            'CAR_0_0': ['mean', 'median', 'std'],
-            'CAR_0_1': ['mean', 'median', 'std'],
-            'CAR_-1_1': ['mean', 'median', 'std'],
-            'CAR_0_5': ['mean', 'median', 'std'],
-            'CAR_-5_5': ['mean', 'median', 'std'],
-        }
+        if self.config.get('event_study.winsorize', False):
+            valid_results = self._winsorize_returns(valid_results)
 
-        # Only aggregate columns that exist
-        agg_funcs = {k: v for k, v in agg_funcs.items() if k in valid_results.columns}
+        # Named aggregations per source column
+        agg_specs = [
+            ('ar_day_0', ['mean', 'median', 'std', 'count']),
+            ('mean_ar', ['mean']),
+        ] + [(name, ['mean', 'median', 'std']) for name, _ in CAR_WINDOWS]
 
-        aggregated = valid_results.groupby(group_by).agg(agg_funcs)
+        # Only aggregate columns that exist
+        agg_specs = [(col, funcs) for col, funcs in agg_specs if col in valid_results.columns]
+
+        # One grouped reduction per statistic over all the columns that need it
+        columns_by_func = {}
+        for col, funcs in agg_specs:
+            for func in funcs:
+                columns_by_func.setdefault(func, []).append(col)
+
+        grouped = valid_results.groupby(group_by)
+        reduced = {
+            func: getattr(grouped[columns], func)()
+            for func, columns in columns_by_func.items()
+        }
 
-        # Flatten column names
-        aggregated.columns = ['_'.join(col).strip('_') for col in aggregated.columns]
+        aggregated = pd.DataFrame({
+            f"{col}_{func}": reduced[func][col]
+            for col, funcs in agg_specs
+            for func in funcs
+        })
 
         return aggregated.reset_index()
+
+    def _winsorize_returns(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clip abnormal-return columns to their configured quantiles.
+
+        All columns are clipped in one vectorized pass over the array.
+
+        Args:
+            results: DataFrame with valid event results
+
+        Returns:
+            DataFrame with winsorized AR and CAR columns
+        """
+        lower, upper = self.config.get('event_study.winsorize_quantiles', [0.05, 0.95])
+        columns = [
+            col for col in ['ar_day_0', 'mean_ar'] + [name for name, _ in CAR_WINDOWS]
+            if col in results.columns
+        ]
+        if not columns:
+            return results
+
+        values = results[columns].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            lo, hi = np.nanquantile(values, [lower, upper], axis=0)
+
+        clipped = np.clip(values, lo, hi)
+        return results.assign(**{col: clipped[:, i] for i, col in enumerate(columns)})
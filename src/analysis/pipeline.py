@@ -1,9 +1,17 @@
 """Main analysis pipeline for CommitTrader."""
 
+import hashlib
+import itertools
+import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
@@ -18,19 +26,41 @@ from .statistics import StatisticalTests
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DAY_NS = 86_400_000_000_000
+
+# Columns of a labeled repository event (releases leave the spike fields empty and vice versa)
+EVENT_COLUMNS = ['repo', 'date', 'event_type', 'tag_name', 'name', 'num_commits', 'z_score']
+
 
 class AnalysisPipeline:
     """Main pipeline for running complete analysis."""
 
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        github_tokens: Optional[List[str]] = None
+    ):
         """
         Initialize analysis pipeline.
 
         Args:
             github_token: GitHub personal access token
+            github_tokens: Several tokens to rotate across repositories (each has
+                its own rate limit); takes precedence over github_token
         """
         self.config = get_config()
-        self.github_collector = GitHubCollector(github_token)
+
+        # One collector per token, handed out round-robin; each token also
+        # caps how many repositories use it at once
+        tokens = github_tokens or [github_token]
+        per_token = self.config.get('collection.max_workers', 8)
+        self._collectors = [
+            (GitHubCollector(token), threading.Semaphore(per_token)) for token in tokens
+        ]
+        self._collector_cycle = itertools.cycle(self._collectors)
+        self._collector_lock = threading.Lock()
+        self.github_collector = self._collectors[0][0]
+
         self.stock_collector = StockCollector()
         self.company_mapper = CompanyMapper()
         self.storage = DataStorage()
@@ -60,49 +90,56 @@ class AnalysisPipeline:
 
         logger.info(f"Collecting data for {len(tickers)} companies")
 
-        all_events = []
-
-        for ticker in tqdm(tickers, desc="Collecting GitHub data"):
-            # Get repositories for this ticker
+        # (ticker, repo) pairs to collect
+        pairs = []
+        for ticker in tickers:
             repos = self.company_mapper.get_repos_for_ticker(ticker)
 
             if not repos:
                 logger.warning(f"No repositories mapped for {ticker}")
                 continue
 
-            # Collect events from each repository
-            for repo in repos:
-                try:
-                    events = self.github_collector.collect_all_events(
-                        repo, start_date, end_date
-                    )
-
-                    # Process releases
-                    if 'releases' in events and not events['releases'].empty:
-                        releases = events['releases'].copy()
-                        releases['ticker'] = ticker
-                        releases['event_type'] = 'release'
-                        releases['date'] = releases['published_at']
-                        all_events.append(releases[['ticker', 'repo', 'date', 'event_type', 'tag_name', 'name']])
-
-                    # Process commit spikes
-                    if 'commit_spikes' in events and not events['commit_spikes'].empty:
-                        spikes = events['commit_spikes'].copy()
-                        spikes['ticker'] = ticker
-                        spikes['event_type'] = 'commit_spike'
-                        all_events.append(spikes[['ticker', 'repo', 'date', 'event_type', 'num_commits', 'z_score']])
+            pairs.extend((ticker, repo) for repo in repos)
+
+        # Collection is network-bound, so repositories are fetched concurrently
+        max_workers = self.config.get('collection.max_workers', 8) * len(self._collectors)
+        collected = [[] for _ in pairs]
 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._collect_repo_events, ticker, repo, start_date, end_date): i
+                for i, (ticker, repo) in enumerate(pairs)
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Collecting GitHub data"):
+                i = futures[future]
+                try:
+                    collected[i] = future.result()
                 except Exception as e:
-                    logger.error(f"Error collecting events for {repo}: {e}")
-                    continue
+                    logger.error(f"Error collecting events for {pairs[i][1]}: {e}")
+
+        # Keep the (ticker, repo) order regardless of completion order
+        all_events = [record for records in collected for record in records]
 
         if not all_events:
             logger.warning("No events collected")
             return pd.DataFrame()
 
-        # Combine all events
-        events_df = pd.concat(all_events, ignore_index=True)
-        events_df['date'] = pd.to_datetime(events_df['date'])
+        # Build all events in one go
+        events_df = pd.DataFrame(all_events, columns=['ticker'] + EVENT_COLUMNS)
+        # GitHub timestamps are ISO 8601; parse on the fast path, normalized to UTC
+        events_df['date'] = pd.to_datetime(events_df['date'], format='ISO8601', utc=True, cache=True)
+
+        # Spike statistics only need single precision; commit counts stay exact in
+        # float32 and keep NaN (rather than pd.NA) for releases
+        events_df = events_df.astype({'num_commits': 'float32', 'z_score': 'float32'})
+
+        # Low-cardinality labels as categoricals: grouping and filtering work on small codes.
+        # Free-text release fields are kept in Arrow string arrays, which Parquet
+        # stores and loads without building Python string objects
+        events_df = events_df.astype({
+            'ticker': 'category', 'repo': 'category', 'event_type': 'category',
+            'tag_name': 'string[pyarrow]', 'name': 'string[pyarrow]',
+        })
 
         logger.info(f"Collected {len(events_df)} total events")
 
@@ -111,6 +148,191 @@ class AnalysisPipeline:
 
         return events_df
 
+    def _collect_repo_events(
+        self,
+        ticker: str,
+        repo: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List[Dict]:
+        """
+        Collect and label the events of one repository.
+
+        Labeled events are cached on disk per (repo, date range, event
+        settings), so unchanged reruns skip the GitHub API.
+
+        Args:
+            ticker: Ticker the repository is mapped to
+            repo: Repository name in format 'owner/repo'
+            start_date: Start date for collection
+            end_date: End date for collection
+
+        Returns:
+            List of event records (releases and/or commit spikes)
+        """
+        cache_file = self._event_cache_file(repo, start_date, end_date)
+        repo_events = self._load_cached_events(cache_file, end_date)
+
+        if repo_events is None:
+            logger.info(f"Event cache miss for {repo}")
+            events = self._fetch_repo_events(repo, start_date, end_date)
+            records = []
+
+            # Process releases
+            if 'releases' in events and not events['releases'].empty:
+                releases = events['releases'][['published_at', 'tag_name', 'name']]
+                records.extend(
+                    {'repo': repo, 'date': date, 'event_type': 'release', 'tag_name': tag_name,
+                     'name': name, 'num_commits': np.nan, 'z_score': np.nan}
+                    for date, tag_name, name in releases.itertuples(index=False, name=None)
+                )
+
+            # Process commit spikes
+            if 'commit_spikes' in events and not events['commit_spikes'].empty:
+                spikes = events['commit_spikes'][['date', 'num_commits', 'z_score']]
+                records.extend(
+                    {'repo': repo, 'date': date, 'event_type': 'commit_spike', 'tag_name': None,
+                     'name': None, 'num_commits': num_commits, 'z_score': z_score}
+                    for date, num_commits, z_score in spikes.itertuples(index=False, name=None)
+                )
+
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                pd.DataFrame(records, columns=EVENT_COLUMNS).to_parquet(cache_file, index=False)
+                self._prune_event_cache(cache_file)
+        else:
+            logger.info(f"Event cache hit for {repo}")
+            records = repo_events.to_dict('records')
+
+        return [{'ticker': ticker, **record} for record in records]
+
+    def _event_cache_file(
+        self,
+        repo: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Optional[Path]:
+        """
+        Cache file for a repository's events over a date range.
+
+        Args:
+            repo: Repository name in format 'owner/repo'
+            start_date: Start date for collection
+            end_date: End date for collection
+
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if not self.config.get('collection.cache_enabled'):
+            return None
+
+        # The event settings change which events are collected, so they are part of the key.
+        # Dates are keyed by calendar day (the CLI defaults to now()); the TTL handles freshness
+        days = [None if date is None else pd.Timestamp(date).date().isoformat() for date in (start_date, end_date)]
+        key = json.dumps([repo, *days, self.config.get('events')], default=str)
+        digest = hashlib.md5(key.encode()).hexdigest()
+        # The end day leads the name so stale files can be pruned without reading them
+        return self.config.raw_data_dir / "github" / "events" / repo.replace('/', '_') / f"{days[1]}_{digest}.parquet"
+
+    @staticmethod
+    def _is_settled(end_date) -> bool:
+        """Whether a collected range ended long enough ago that its events no longer change."""
+        return end_date is not None and pd.Timestamp(end_date) < pd.Timestamp.now() - pd.Timedelta(days=7)
+
+    def _is_expired(self, cache_file: Path) -> bool:
+        """Whether a cache file is older than 'collection.event_cache_ttl' seconds."""
+        age = time.time() - cache_file.stat().st_mtime
+        return age > self.config.get('collection.event_cache_ttl', 86400)
+
+    def _prune_event_cache(self, cache_file: Path) -> None:
+        """
+        Delete a repository's cached event files that can no longer be hit.
+
+        The default date range moves every day, so each run keys a new file; older
+        files whose range is still recent have expired and will never be read again.
+
+        Args:
+            cache_file: Cache file just written for the repository
+        """
+        for stale_file in cache_file.parent.glob('*.parquet'):
+            end_day = stale_file.stem.split('_')[0]
+            if stale_file == cache_file or self._is_settled(None if end_day == 'None' else end_day):
+                continue
+            if self._is_expired(stale_file):
+                logger.debug(f"Removing stale event cache {stale_file}")
+                stale_file.unlink(missing_ok=True)
+
+    def _load_cached_events(
+        self,
+        cache_file: Optional[Path],
+        end_date: Optional[datetime]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load cached repository events if they are still fresh.
+
+        Ranges that ended more than a week ago no longer change and never
+        expire; recent ranges expire after 'collection.event_cache_ttl' seconds.
+
+        Args:
+            cache_file: Cache file from _event_cache_file
+            end_date: End date of the collected range
+
+        Returns:
+            Cached events, or None on a miss
+        """
+        if cache_file is None or self.config.get('collection.refresh') or not cache_file.exists():
+            return None
+
+        if not self._is_settled(end_date) and self._is_expired(cache_file):
+            return None
+
+        return pd.read_parquet(cache_file)
+
+    def _next_collector(self) -> Tuple[GitHubCollector, threading.Semaphore]:
+        """Next GitHub collector in the token rotation, with its concurrency slots."""
+        with self._collector_lock:
+            return next(self._collector_cycle)
+
+    def _fetch_repo_events(
+        self,
+        repo: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch a repository's events, backing off when the rate limit is hit.
+
+        Each attempt draws the next token from the rotation. Honors the
+        Retry-After header when GitHub sends one and otherwise waits
+        exponentially longer between attempts.
+
+        Args:
+            repo: Repository name in format 'owner/repo'
+            start_date: Start date for collection
+            end_date: End date for collection
+
+        Returns:
+            Dictionary with DataFrames for each event type
+        """
+        from github import RateLimitExceededException
+
+        max_retries = self.config.get('github.max_retries', 3)
+
+        for attempt in range(max_retries + 1):
+            collector, token_slots = self._next_collector()
+            try:
+                with token_slots:
+                    return collector.collect_all_events(repo, start_date, end_date)
+            except RateLimitExceededException as e:
+                if attempt == max_retries:
+                    raise
+
+                headers = {k.lower(): v for k, v in (e.headers or {}).items()}
+                retry_after = headers.get('retry-after')
+                delay = float(retry_after) if retry_after else 60 * 2 ** attempt
+                logger.warning(f"Rate limited collecting {repo}; retrying in {delay:.0f} seconds")
+                time.sleep(delay)
+
     def validate_event_data(
         self,
         events: pd.DataFrame,
@@ -128,23 +350,38 @@ class AnalysisPipeline:
         """
         logger.info("Validating event data")
 
-        # Count events per ticker
-        event_counts = events.groupby('ticker').size()
-        valid_tickers = event_counts[event_counts >= min_events_per_ticker].index
+        # Count events per ticker and broadcast each count back to its rows
+        event_counts = events['ticker'].value_counts()
+        num_valid_tickers = int((event_counts >= min_events_per_ticker).sum())
 
-        logger.info(f"Found {len(valid_tickers)} tickers with at least {min_events_per_ticker} events")
+        logger.info(f"Found {num_valid_tickers} tickers with at least {min_events_per_ticker} events")
 
         # Filter events
-        filtered = events[events['ticker'].isin(valid_tickers)].copy()
+        mask = events['ticker'].map(event_counts).to_numpy() >= min_events_per_ticker
+        filtered = events[mask].copy()
 
         # Remove events too close together (if configured)
         if self.config.get('events.releases.enabled'):
             min_days = self.config.get('events.releases.min_days_between', 1)
             if min_days > 0:
+                from ._kernels import min_gap_mask
+
                 filtered = filtered.sort_values(['ticker', 'date'])
-                filtered['days_since_last'] = filtered.groupby('ticker')['date'].diff().dt.days
-                filtered = filtered[(filtered['days_since_last'].isna()) |
-                                  (filtered['days_since_last'] >= min_days)]
+
+                # Gap to the previous event of the same ticker, in one pass
+                ticker_codes = pd.factorize(filtered['ticker'])[0]
+                times = filtered['date'].values.astype('datetime64[ns]').view(np.int64)
+                keep = min_gap_mask(ticker_codes, times, min_days * DAY_NS)
+                filtered = filtered[keep]
+
+        # Tickers filtered out above should not linger as empty categories
+        categorical = [
+            col for col in ('ticker', 'repo', 'event_type')
+            if col in filtered.columns and isinstance(filtered[col].dtype, pd.CategoricalDtype)
+        ]
+        filtered = filtered.assign(
+            **{col: filtered[col].cat.remove_unused_categories() for col in categorical}
+        )
 
         logger.info(f"After validation: {len(filtered)} events")
 
@@ -173,27 +410,31 @@ class AnalysisPipeline:
             events = events.sample(n=max_events, random_state=42)
 
         results = []
+        metadata_columns = ['repo', 'tag_name', 'num_commits', 'z_score']
+
+        # Price fetches are network-bound and independent, so they run concurrently
+        # up front; the batches below then read prices from the cache
+        self.event_study.prefetch_price_data(events)
 
-        for idx, event in tqdm(events.iterrows(), total=len(events), desc="Analyzing events"):
+        # One batch per ticker: a single price fetch covers all of its events
+        grouped = events.groupby('ticker', sort=False, observed=True)
+        for ticker, ticker_events in tqdm(grouped, total=grouped.ngroups, desc="Analyzing events"):
             try:
-                result = self.event_study.analyze_event(
-                    ticker=event['ticker'],
-                    event_date=event['date'],
-                    event_type=event['event_type'],
-                    event_metadata={
-                        'repo': event.get('repo'),
-                        'tag_name': event.get('tag_name'),
-                        'num_commits': event.get('num_commits'),
-                        'z_score': event.get('z_score'),
-                    }
+                result = self.event_study.analyze_events_batch(
+                    ticker=ticker,
+                    event_dates=ticker_events['date'].to_numpy(),
+                    event_types=ticker_events['event_type'].to_numpy(),
+                    event_metadata=ticker_events.reindex(columns=metadata_columns).to_dict('records')
                 )
                 results.append(result)
 
             except Exception as e:
-                logger.error(f"Error analyzing event {idx}: {e}")
+                logger.error(f"Error analyzing events for {ticker}: {e}")
                 continue
 
-        results_df = pd.DataFrame(results)
+        results_df = pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+        if 'valid' in results_df.columns:
+            results_df['valid'] = results_df['valid'].fillna(False).astype(bool)
         logger.info(f"Completed {len(results_df)} event studies")
 
         # Save results
@@ -267,7 +508,19 @@ class AnalysisPipeline:
         Returns:
             Summary dictionary
         """
-        valid_results = results[results['valid'] == True]
+        valid_results = results[results['valid'].to_numpy() == True]
+
+        # Day-0 statistics from one array: NaN days are skipped by the mean and
+        # median but still count towards the share of positive ARs
+        ar_stats = {'mean': None, 'median': None, 'pct_positive': None}
+        if 'ar_day_0' in valid_results.columns:
+            ar0 = valid_results['ar_day_0'].to_numpy(dtype=np.float64)
+            finite = ar0[~np.isnan(ar0)]
+            ar_stats = {
+                'mean': finite.mean() if finite.size else np.nan,
+                'median': np.median(finite) if finite.size else np.nan,
+                'pct_positive': np.count_nonzero(ar0 > 0) / ar0.size * 100 if ar0.size else np.nan,
+            }
 
         summary = {
             'analysis_date': datetime.now().isoformat(),
@@ -277,10 +530,10 @@ class AnalysisPipeline:
             'valid_event_studies': len(valid_results),
             'event_types': events['event_type'].value_counts().to_dict(),
             'overall_statistics': {
-                'mean_ar_day_0': valid_results['ar_day_0'].mean() if 'ar_day_0' in valid_results.columns else None,
-                'median_ar_day_0': valid_results['ar_day_0'].median() if 'ar_day_0' in valid_results.columns else None,
+                'mean_ar_day_0': ar_stats['mean'],
+                'median_ar_day_0': ar_stats['median'],
                 'mean_car_5_5': valid_results['CAR_-5_5'].mean() if 'CAR_-5_5' in valid_results.columns else None,
-                'pct_positive_ar': (valid_results['ar_day_0'] > 0).mean() * 100 if 'ar_day_0' in valid_results.columns else None,
+                'pct_positive_ar': ar_stats['pct_positive'],
             },
             'statistical_significance': {
                 test_name: {
@@ -299,6 +552,27 @@ class AnalysisPipeline:
 
         return summary
 
+    def _read_events_file(self, events_file: str) -> pd.DataFrame:
+        """
+        Load events from a Parquet file, or a CSV file as a fallback.
+
+        Parquet files are read with only the columns the analysis uses.
+
+        Args:
+            events_file: Path to a .parquet or .csv events file
+
+        Returns:
+            DataFrame with events
+        """
+        if Path(events_file).suffix != '.parquet':
+            return pd.read_csv(events_file, parse_dates=['date'], date_format='ISO8601')
+
+        import pyarrow.parquet as pq
+
+        available = set(pq.read_schema(events_file).names)
+        columns = [col for col in ['ticker'] + EVENT_COLUMNS if col in available and col != 'name']
+        return pd.read_parquet(events_file, columns=columns)
+
     def run_full_analysis(
         self,
         tickers: Optional[List[str]] = None,
@@ -318,7 +592,7 @@ class AnalysisPipeline:
             end_date: End date for analysis
             max_events: Maximum events to analyze (for testing)
             skip_collection: Skip data collection and use cached data
-            events_file: Path to events CSV file (if skip_collection=True)
+            events_file: Path to events Parquet or CSV file (if skip_collection=True)
             generate_reports: Generate HTML reports and website
 
         Returns:
@@ -328,54 +602,56 @@ class AnalysisPipeline:
         logger.info("Starting CommitTrader Analysis Pipeline")
         logger.info("="*80)
 
-        # Step 1: Collect data
-        if skip_collection and events_file:
-            logger.info(f"Loading events from {events_file}")
-            events = pd.read_csv(events_file, parse_dates=['date'])
-        elif skip_collection:
-            logger.info("Loading cached events")
-            events = self.storage.load_events('all_events')
-            if events is None:
-                raise ValueError("No cached events found. Run collection first.")
-        else:
-            events = self.collect_all_data(tickers, start_date, end_date)
-
-        if events.empty:
-            logger.error("No events to analyze")
-            return {}
-
-        # Step 2: Validate data
-        events = self.validate_event_data(
-            events,
-            min_events_per_ticker=self.config.get('analysis.min_events_per_company', 5)
-        )
+        # Every file of this run shares one timestamp suffix
+        with self.storage.analysis_run():
+            # Step 1: Collect data
+            if skip_collection and events_file:
+                logger.info(f"Loading events from {events_file}")
+                events = self._read_events_file(events_file)
+            elif skip_collection:
+                logger.info("Loading cached events")
+                events = self.storage.load_events('all_events')
+                if events is None:
+                    raise ValueError("No cached events found. Run collection first.")
+            else:
+                events = self.collect_all_data(tickers, start_date, end_date)
+
+            if events.empty:
+                logger.error("No events to analyze")
+                return {}
+
+            # Step 2: Validate data
+            events = self.validate_event_data(
+                events,
+                min_events_per_ticker=self.config.get('analysis.min_events_per_company', 5)
+            )
 
-        # Step 3: Run event studies
-        results = self.run_event_studies(events, max_events)
+            # Step 3: Run event studies
+            results = self.run_event_studies(events, max_events)
 
-        if results.empty:
-            logger.error("No valid event study results")
-            return {}
+            if results.empty:
+                logger.error("No valid event study results")
+                return {}
 
-        # Step 4: Aggregate and analyze
-        aggregated, statistical_tests = self.aggregate_and_analyze(results)
+            # Step 4: Aggregate and analyze
+            aggregated, statistical_tests = self.aggregate_and_analyze(results)
 
-        # Step 5: Generate summary
-        summary = self.generate_summary(events, results, aggregated, statistical_tests)
+            # Step 5: Generate summary
+            summary = self.generate_summary(events, results, aggregated, statistical_tests)
 
-        # Step 6: Create snapshot
-        snapshot_dir = self.storage.create_analysis_snapshot(
-            'full_analysis',
-            results,
-            aggregated,
-            statistical_tests,
-            summary
-        )
+            # Step 6: Create snapshot
+            snapshot_dir = self.storage.create_analysis_snapshot(
+                'full_analysis',
+                results,
+                aggregated,
+                statistical_tests,
+                summary
+            )
 
-        # Step 7: Generate reports (if requested)
-        if generate_reports:
-            logger.info("Generating HTML reports...")
-            self.generate_html_reports(events, results, aggregated, statistical_tests, summary)
+            # Step 7: Generate reports (if requested)
+            if generate_reports:
+                logger.info("Generating HTML reports...")
+                self.generate_html_reports(events, results, aggregated, statistical_tests, summary)
 
         logger.info("="*80)
         logger.info("Analysis Complete!")
@@ -5,7 +5,6 @@ from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 
 from ..config import get_config
 
@@ -39,13 +38,33 @@ class StatisticalTests:
             abnormal_returns: Series of abnormal returns
             null_hypothesis: Null hypothesis value
 
+        Returns:
+            Dictionary with test results
+        """
+        return self._t_test_numpy(
+            np.asarray(abnormal_returns, dtype=np.float64), null_hypothesis
+        )
+
+    def _t_test_numpy(
+        self,
+        ar: np.ndarray,
+        null_hypothesis: float = 0.0
+    ) -> Dict:
+        """
+        t-test on an array of abnormal returns (NaN values are ignored).
+
+        Args:
+            ar: Array of abnormal returns
+            null_hypothesis: Null hypothesis value
+
         Returns:
             Dictionary with test results
         """
         # Remove NaN values
-        ar = abnormal_returns.dropna()
+        ar = ar[~np.isnan(ar)]
+        n = ar.size
 
-        if len(ar) == 0:
+        if n == 0:
             return {
                 'test': 't-test',
                 'valid': False,
@@ -54,8 +73,7 @@ class StatisticalTests:
 
         # Calculate t-statistic
         mean_ar = ar.mean()
-        std_ar = ar.std()
-        n = len(ar)
+        std_ar = ar.std(ddof=1) if n > 1 else np.nan
 
         if std_ar == 0 or n < 2:
             return {
@@ -68,7 +86,7 @@ class StatisticalTests:
         df = n - 1
 
         # Two-tailed p-value
-        p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
+        p_value = self._two_sided_t_p(t_stat, df)
 
         # Determine significance
         significance = self._get_significance_level(p_value)
@@ -97,12 +115,13 @@ class StatisticalTests:
         H1: Median abnormal return ≠ 0
 
         Args:
-            abnormal_returns: Series of abnormal returns
+            abnormal_returns: Series or array of abnormal returns
 
         Returns:
             Dictionary with test results
         """
-        ar = abnormal_returns.dropna()
+        ar = np.asarray(abnormal_returns, dtype=np.float64)
+        ar = ar[~np.isnan(ar)]
 
         if len(ar) == 0:
             return {
@@ -124,11 +143,9 @@ class StatisticalTests:
             }
 
         # Under H0, probability of positive return is 0.5
-        # Use binomial test
-        p_value = 2 * min(
-            stats.binom.cdf(n_positive, n_total, 0.5),
-            1 - stats.binom.cdf(n_positive - 1, n_total, 0.5)
-        )
+        # Use exact two-sided binomial test
+        from scipy import stats
+        p_value = stats.binomtest(int(n_positive), int(n_total), 0.5).pvalue
 
         significance = self._get_significance_level(p_value)
 
@@ -154,12 +171,13 @@ class StatisticalTests:
         H1: Median abnormal return ≠ 0
 
         Args:
-            abnormal_returns: Series of abnormal returns
+            abnormal_returns: Series or array of abnormal returns
 
         Returns:
             Dictionary with test results
         """
-        ar = abnormal_returns.dropna()
+        ar = np.asarray(abnormal_returns, dtype=np.float64)
+        ar = ar[~np.isnan(ar)]
 
         if len(ar) < 3:
             return {
@@ -170,6 +188,7 @@ class StatisticalTests:
 
         try:
             # Perform Wilcoxon signed-rank test
+            from scipy import stats
             statistic, p_value = stats.wilcoxon(ar, alternative='two-sided')
 
             significance = self._get_significance_level(p_value)
@@ -179,7 +198,7 @@ class StatisticalTests:
                 'valid': True,
                 'statistic': statistic,
                 'p_value': p_value,
-                'median': ar.median(),
+                'median': np.median(ar),
                 'n': len(ar),
                 'significant': p_value < 0.05,
                 'significance_level': significance,
@@ -194,7 +213,8 @@ class StatisticalTests:
     def cross_sectional_test(
         self,
         event_results: pd.DataFrame,
-        ar_column: str = 'ar_day_0'
+        ar_column: str = 'ar_day_0',
+        already_filtered: bool = False
     ) -> Dict:
         """
         Perform cross-sectional t-test across multiple events.
@@ -202,6 +222,7 @@ class StatisticalTests:
         Args:
             event_results: DataFrame with event study results
             ar_column: Column name for abnormal returns to test
+            already_filtered: Whether event_results holds only valid events
 
         Returns:
             Dictionary with test results
@@ -213,10 +234,29 @@ class StatisticalTests:
                 'reason': 'No data or column not found'
             }
 
+        ar = event_results[ar_column].to_numpy(dtype=np.float64)
+
         # Filter valid events
-        valid_events = event_results[event_results['valid'] == True].copy()
+        if not already_filtered:
+            ar = ar[event_results['valid'].to_numpy() == True]
+        return self._cross_sectional_numpy(ar)
+
+    def _cross_sectional_numpy(
+        self,
+        ar: np.ndarray,
+        t_test: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Cross-sectional t-test on the ARs of the valid events.
+
+        Args:
+            ar: Abnormal returns of the valid events (may contain NaN)
+            t_test: Result of _t_test_numpy on the same ARs, reused if given
 
-        if len(valid_events) < 2:
+        Returns:
+            Dictionary with test results
+        """
+        if len(ar) < 2:
             return {
                 'test': 'cross-sectional',
                 'valid': False,
@@ -224,7 +264,9 @@ class StatisticalTests:
             }
 
         # Perform t-test on cross-section of ARs
-        return self.t_test_abnormal_return(valid_events[ar_column])
+        if t_test is not None:
+            return dict(t_test)
+        return self._t_test_numpy(ar)
 
     def car_significance_test(
         self,
@@ -281,7 +323,7 @@ class StatisticalTests:
         # t-statistic
         t_stat = weighted_mean_car / std_weighted_mean
         df = len(aligned) - 1
-        p_value = 2 * (1 - stats.t.cdf(abs(t_stat), df))
+        p_value = self._two_sided_t_p(t_stat, df)
 
         significance = self._get_significance_level(p_value)
 
@@ -302,7 +344,8 @@ class StatisticalTests:
         self,
         event_results: pd.DataFrame,
         type_column: str = 'event_type',
-        ar_column: str = 'ar_day_0'
+        ar_column: str = 'ar_day_0',
+        already_filtered: bool = False
     ) -> Dict:
         """
         Compare abnormal returns across different event types.
@@ -313,13 +356,35 @@ class StatisticalTests:
             event_results: DataFrame with event study results
             type_column: Column name for event type
             ar_column: Column name for abnormal returns
+            already_filtered: Whether event_results holds only valid events
 
         Returns:
             Dictionary with comparison results
         """
         # Filter valid events
-        valid_events = event_results[event_results['valid'] == True].copy()
+        if already_filtered:
+            valid_events = event_results
+        else:
+            valid_events = event_results[event_results['valid'].to_numpy() == True]
+        return self._anova_by_type(valid_events, type_column, ar_column)
+
+    def _anova_by_type(
+        self,
+        valid_events: pd.DataFrame,
+        type_column: str,
+        ar_column: str
+    ) -> Dict:
+        """
+        One-way ANOVA of abnormal returns across event types.
+
+        Args:
+            valid_events: Valid event study results
+            type_column: Column name for event type
+            ar_column: Column name for abnormal returns
 
+        Returns:
+            Dictionary with comparison results
+        """
         if valid_events.empty:
             return {
                 'test': 'ANOVA',
@@ -327,10 +392,10 @@ class StatisticalTests:
                 'reason': 'No valid events'
             }
 
-        # Get event types
-        event_types = valid_events[type_column].unique()
+        # Split into event types in one pass
+        grouped = valid_events.groupby(type_column, sort=False)[ar_column]
 
-        if len(event_types) < 2:
+        if grouped.ngroups < 2:
             return {
                 'test': 'ANOVA',
                 'valid': False,
@@ -338,10 +403,7 @@ class StatisticalTests:
             }
 
         # Prepare groups
-        groups = [
-            valid_events[valid_events[type_column] == et][ar_column].dropna()
-            for et in event_types
-        ]
+        groups = [g.dropna().to_numpy() for _, g in grouped]
 
         # Filter out empty groups
         groups = [g for g in groups if len(g) > 0]
@@ -355,13 +417,11 @@ class StatisticalTests:
 
         # Perform one-way ANOVA
         try:
+            from scipy import stats
             f_stat, p_value = stats.f_oneway(*groups)
 
             # Calculate means for each group
-            group_means = {
-                et: valid_events[valid_events[type_column] == et][ar_column].mean()
-                for et in event_types
-            }
+            group_means = grouped.mean().to_dict()
 
             significance = self._get_significance_level(p_value)
 
@@ -397,40 +457,71 @@ class StatisticalTests:
         Returns:
             Dictionary with all test results
         """
-        # Filter valid events
-        valid_events = event_results[event_results['valid'] == True].copy()
+        # Filter valid events once; every test reads from this mask/matrix
+        valid_mask = event_results['valid'].to_numpy() == True
+        valid_events = event_results[valid_mask]
 
         if valid_events.empty:
             logger.warning("No valid events for statistical testing")
             return {}
 
-        ar_values = valid_events[ar_column].dropna()
+        car_cols = [
+            col for col in ['CAR_0_0', 'CAR_0_1', 'CAR_-1_1', 'CAR_0_5', 'CAR_-5_5']
+            if col in valid_events.columns
+        ]
+        matrix = valid_events[[ar_column] + car_cols].to_numpy(dtype=np.float64)
+        present = ~np.isnan(matrix)
+
+        ar_values = matrix[present[:, 0], 0]
 
         results = {}
 
         # Parametric tests
-        results['t_test'] = self.t_test_abnormal_return(ar_values)
+        results['t_test'] = self._t_test_numpy(ar_values)
 
         # Non-parametric tests
         results['sign_test'] = self.sign_test(ar_values)
         results['wilcoxon_test'] = self.wilcoxon_signed_rank_test(ar_values)
 
-        # Cross-sectional test
-        results['cross_sectional'] = self.cross_sectional_test(event_results, ar_column)
+        # Cross-sectional test: the t-test above already covers these ARs
+        results['cross_sectional'] = self._cross_sectional_numpy(
+            matrix[:, 0], t_test=results['t_test']
+        )
 
         # Compare event types if available
         if 'event_type' in event_results.columns:
-            results['anova'] = self.compare_event_types(event_results, 'event_type', ar_column)
+            results['anova'] = self.compare_event_types(
+                valid_events, 'event_type', ar_column, already_filtered=True
+            )
 
         # Test different CAR windows
-        for car_col in ['CAR_0_0', 'CAR_0_1', 'CAR_-1_1', 'CAR_0_5', 'CAR_-5_5']:
-            if car_col in valid_events.columns:
-                car_values = valid_events[car_col].dropna()
-                if len(car_values) > 0:
-                    results[f'{car_col}_test'] = self.t_test_abnormal_return(car_values)
+        for k, car_col in enumerate(car_cols, start=1):
+            if present[:, k].any():
+                results[f'{car_col}_test'] = self._t_test_numpy(matrix[present[:, k], k])
 
         return results
 
+    @staticmethod
+    def _two_sided_t_p(t_stat: float, df: int) -> float:
+        """
+        Two-sided p-value of a t-statistic.
+
+        Evaluates the lower tail at -|t| directly with the t distribution
+        function, which avoids the cancellation of 1 - cdf far in the tails
+        and the per-call overhead of scipy.stats distribution objects.
+
+        Args:
+            t_stat: t-statistic
+            df: Degrees of freedom
+
+        Returns:
+            Two-sided p-value
+        """
+        # scipy imported lazily to keep CLI startup fast
+        from scipy import special
+
+        return float(2 * special.stdtr(df, -abs(t_stat)))
+
     def _get_significance_level(self, p_value: float) -> str:
         """
         Get significance level label based on p-value.
@@ -1,14 +1,26 @@
 """Configuration management for CommitTrader."""
 
+import json
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 class Config:
     """Configuration manager for CommitTrader."""
 
+    __slots__ = (
+        'config_path', 'config', '_flat', 'project_root', 'data_dir',
+        'raw_data_dir', 'processed_data_dir', 'mappings_dir',
+    )
+
     def __init__(self, config_path: str = None):
         """
         Initialize configuration.
@@ -23,6 +35,7 @@ class Config:
 
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._flat = self._flatten(self.config)
 
         # Set up project paths
         self.project_root = Path(__file__).parent.parent
@@ -36,12 +49,81 @@ class Config:
             directory.mkdir(parents=True, exist_ok=True)
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+
+        The parsed config is cached in a JSON sidecar next to the YAML file and
+        reused while the YAML file's modification time is unchanged.
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        cache_path = self.config_path.with_name(self.config_path.name + '.cache.json')
+
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.load(f)
+            if cached.get('_src_mtime_ns') == mtime_ns:
+                return cached['data']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+        # Bytes straight to libyaml, which decodes UTF-8 itself
+        with open(self.config_path, 'rb') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+
+        self._write_config_cache(cache_path, mtime_ns, config)
+        return config
+
+    def _write_config_cache(self, cache_path: Path, mtime_ns: int, config: Dict[str, Any]):
+        """
+        Atomically write the JSON sidecar for a parsed config.
+
+        Skipped when the config does not survive a JSON round trip unchanged
+        (e.g. YAML dates or non-string keys) or the directory is not writable.
+
+        Args:
+            cache_path: Sidecar file path
+            mtime_ns: Modification time of the YAML file the config came from
+            config: Parsed configuration
+        """
+        try:
+            payload = json.dumps({'_src_mtime_ns': mtime_ns, 'data': config})
+        except (TypeError, ValueError):
+            return
+        if json.loads(payload)['data'] != config:
+            return
+
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _flatten(config: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """
+        Map every dot-notation key of a nested config to its value.
+
+        Sections are included as well as leaves, so 'events' maps to the
+        events dict and 'events.releases.enabled' to a single setting.
+
+        Args:
+            config: Nested configuration
+            prefix: Dot-notation path of config within the root
+
+        Returns:
+            Flat dictionary of dot-notation keys
+        """
+        flat = {}
+        for k, value in config.items():
+            key = f"{prefix}{k}"
+            flat[key] = value
+            if isinstance(value, dict):
+                flat.update(Config._flatten(value, f"{key}."))
+        return flat
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -54,18 +136,27 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
+        value = self._flat.get(key)
+        return default if value is None else value
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
+    def set(self, key: str, value: Any):
+        """
+        Set configuration value using dot notation.
 
-        return value
+        Args:
+            key: Configuration key (e.g., 'collection.refresh')
+            value: Value to set
+        """
+        *parents, last = key.split('.')
+        section = self.config
+
+        for k in parents:
+            if not isinstance(section.get(k), dict):
+                section[k] = {}
+            section = section[k]
+
+        section[last] = value
+        self._flat = self._flatten(self.config)
 
     def get_github_token(self) -> str:
         """
@@ -109,19 +200,24 @@ class Config:
 
 # Global config instance
 _config = None
+_config_lock = threading.Lock()
 
 
 def get_config(config_path: str = None) -> Config:
     """
     Get global configuration instance.
 
+    Safe to call from several threads: the config is loaded exactly once.
+
     Args:
-        config_path: Path to config file (only used on first call)
+        config_path: Path to config file (only honored on the first call)
 
     Returns:
         Config instance
     """
     global _config
     if _config is None:
-        _config = Config(config_path)
+        with _config_lock:
+            if _config is None:
+                _config = Config(config_path)
     return _config
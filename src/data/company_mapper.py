@@ -6,6 +6,7 @@ from pathlib import Path
 import json
 import csv
 
+import numpy as np
 import pandas as pd
 
 from ..config import get_config
@@ -13,16 +14,24 @@ from ..config import get_config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Low-cardinality columns stored as categoricals
+CATEGORY_COLUMNS = ('ticker', 'sector', 'repo_type')
+
 
 class CompanyMapper:
     """Maps GitHub repositories to publicly traded companies."""
 
+    __slots__ = (
+        'config', 'mappings_dir', 'mappings_file', '_mappings', '_pending', '_indexed',
+        '_by_ticker', '_by_sector', '_repo_to_ticker', '_repo_names', '_is_primary',
+    )
+
     def __init__(self, mappings_file: Optional[str] = None):
         """
         Initialize company mapper.
 
         Args:
-            mappings_file: Path to mappings file (CSV or JSON)
+            mappings_file: Path to mappings file (CSV, JSON, Parquet or Feather)
         """
         self.config = get_config()
         self.mappings_dir = self.config.mappings_dir
@@ -31,8 +40,54 @@ class CompanyMapper:
             mappings_file = self.mappings_dir / "company_repo_mappings.csv"
 
         self.mappings_file = Path(mappings_file)
+        self._pending: List[Dict] = []
+        self._indexed = False
         self.mappings = self._load_mappings()
 
+    @property
+    def mappings(self) -> pd.DataFrame:
+        """All mappings, including any added since the DataFrame was last built."""
+        if self._pending:
+            added = pd.DataFrame(self._pending)
+            if self._mappings.empty:
+                mappings = added
+            else:
+                mappings = pd.concat([self._mappings, added], ignore_index=True)
+            self._mappings = self._categorize(mappings)
+            self._pending.clear()
+            self._indexed = False
+        return self._mappings
+
+    @mappings.setter
+    def mappings(self, mappings: pd.DataFrame):
+        self._mappings = mappings
+        self._pending.clear()
+        self._indexed = False
+
+    @staticmethod
+    def _categorize(mappings: pd.DataFrame) -> pd.DataFrame:
+        """Convert the low-cardinality columns of mappings to categoricals."""
+        return mappings.astype({col: 'category' for col in CATEGORY_COLUMNS if col in mappings.columns})
+
+    def _ensure_indices(self):
+        """Build the ticker, repository and sector lookups if the mappings changed."""
+        mappings = self.mappings
+        if self._indexed:
+            return
+
+        # Row positions per ticker and sector, in file order
+        self._by_ticker = mappings.groupby('ticker', sort=False, observed=True).indices
+        self._by_sector = mappings.groupby('sector', sort=False, observed=True).indices
+
+        # First ticker listed for each repository
+        self._repo_to_ticker = {}
+        for repo, ticker in zip(mappings['repo_full_name'].tolist(), mappings['ticker'].tolist()):
+            self._repo_to_ticker.setdefault(repo, ticker)
+
+        self._repo_names = mappings['repo_full_name'].to_numpy()
+        self._is_primary = mappings['primary_repo'].fillna(False).to_numpy(dtype=bool)
+        self._indexed = True
+
     def _load_mappings(self) -> pd.DataFrame:
         """Load company-repository mappings from file."""
         if not self.mappings_file.exists():
@@ -45,15 +100,46 @@ class CompanyMapper:
 
         # Load based on file type
         if self.mappings_file.suffix == '.csv':
-            df = pd.read_csv(self.mappings_file)
+            df = self._load_csv_mappings()
         elif self.mappings_file.suffix == '.json':
-            df = pd.read_json(self.mappings_file)
+            df = self._categorize(pd.read_json(self.mappings_file))
+        elif self.mappings_file.suffix == '.parquet':
+            df = pd.read_parquet(self.mappings_file)
+        elif self.mappings_file.suffix == '.feather':
+            df = pd.read_feather(self.mappings_file)
         else:
             raise ValueError(f"Unsupported file format: {self.mappings_file.suffix}")
 
         logger.info(f"Loaded {len(df)} repository mappings for {df['ticker'].nunique()} companies")
         return df
 
+    def _load_csv_mappings(self) -> pd.DataFrame:
+        """
+        Load CSV mappings through a Parquet copy kept next to the CSV.
+
+        The CSV stays the editable source; the Parquet copy is rewritten
+        whenever the CSV is newer, and skipped if pyarrow is not installed.
+
+        Returns:
+            Mappings DataFrame
+        """
+        cache_file = self.mappings_file.with_name(self.mappings_file.name + '.cache.parquet')
+
+        try:
+            if cache_file.stat().st_mtime_ns > self.mappings_file.stat().st_mtime_ns:
+                return pd.read_parquet(cache_file)
+        except (OSError, ImportError, ValueError):
+            pass
+
+        df = pd.read_csv(self.mappings_file, dtype={col: 'category' for col in CATEGORY_COLUMNS})
+
+        try:
+            df.to_parquet(cache_file, index=False)
+        except (OSError, ImportError) as e:
+            logger.debug(f"Could not write mappings cache {cache_file}: {e}")
+
+        return df
+
     def save_mappings(self, file_path: Optional[str] = None):
         """
         Save mappings to file.
@@ -71,6 +157,10 @@ class CompanyMapper:
             self.mappings.to_csv(file_path, index=False)
         elif file_path.suffix == '.json':
             self.mappings.to_json(file_path, orient='records', indent=2)
+        elif file_path.suffix == '.parquet':
+            self.mappings.to_parquet(file_path, index=False)
+        elif file_path.suffix == '.feather':
+            self.mappings.reset_index(drop=True).to_feather(file_path)
 
         logger.info(f"Saved mappings to {file_path}")
 
@@ -94,16 +184,15 @@ class CompanyMapper:
             sector: Company sector
             primary_repo: Whether this is the primary repo for the company
         """
-        new_mapping = pd.DataFrame([{
+        # Rows are buffered and joined onto the DataFrame on its next read
+        self._pending.append({
             'ticker': ticker.upper(),
             'company_name': company_name,
             'repo_full_name': repo_full_name,
             'repo_type': repo_type,
             'sector': sector,
             'primary_repo': primary_repo
-        }])
-
-        self.mappings = pd.concat([self.mappings, new_mapping], ignore_index=True)
+        })
         logger.info(f"Added mapping: {ticker} -> {repo_full_name}")
 
     def get_repos_for_ticker(self, ticker: str, primary_only: bool = False) -> List[str]:
@@ -118,13 +207,16 @@ class CompanyMapper:
             List of repository full names
         """
         ticker = ticker.upper()
-        mask = self.mappings['ticker'] == ticker
+        self._ensure_indices()
+
+        positions = self._by_ticker.get(ticker)
+        if positions is None:
+            return []
 
         if primary_only:
-            mask = mask & self.mappings['primary_repo']
+            positions = positions[self._is_primary[positions]]
 
-        repos = self.mappings[mask]['repo_full_name'].tolist()
-        return repos
+        return self._repo_names[positions].tolist()
 
     def get_ticker_for_repo(self, repo_full_name: str) -> Optional[str]:
         """
@@ -136,12 +228,8 @@ class CompanyMapper:
         Returns:
             Stock ticker or None if not found
         """
-        matches = self.mappings[self.mappings['repo_full_name'] == repo_full_name]
-
-        if matches.empty:
-            return None
-
-        return matches.iloc[0]['ticker']
+        self._ensure_indices()
+        return self._repo_to_ticker.get(repo_full_name)
 
     def get_all_tickers(self) -> List[str]:
         """Get list of all tickers in mappings."""
@@ -162,13 +250,14 @@ class CompanyMapper:
             Dictionary with company information
         """
         ticker = ticker.upper()
-        matches = self.mappings[self.mappings['ticker'] == ticker]
+        self._ensure_indices()
 
-        if matches.empty:
+        positions = self._by_ticker.get(ticker)
+        if positions is None:
             return {}
 
-        first_match = matches.iloc[0]
-        repos = self.get_repos_for_ticker(ticker)
+        first_match = self.mappings.iloc[positions[0]]
+        repos = self._repo_names[positions].tolist()
 
         return {
             'ticker': ticker,
@@ -188,7 +277,9 @@ class CompanyMapper:
         Returns:
             DataFrame with mappings for that sector
         """
-        return self.mappings[self.mappings['sector'] == sector]
+        self._ensure_indices()
+        positions = self._by_sector.get(sector, np.array([], dtype=np.intp))
+        return self.mappings.iloc[positions]
 
     def validate_mappings(self) -> Dict[str, any]:
         """
@@ -198,27 +289,40 @@ class CompanyMapper:
             Dictionary with validation results
         """
         issues = []
+        mappings = self.mappings
+
+        # Integer codes let every check run on plain arrays in one pass each
+        ticker_codes, tickers = pd.factorize(mappings['ticker'], sort=True, use_na_sentinel=False)
+        repo_codes, repos = pd.factorize(mappings['repo_full_name'], use_na_sentinel=False)
+        primary = mappings['primary_repo'].to_numpy(dtype=bool, na_value=False)
 
         # Check for duplicates
-        duplicate_repos = self.mappings[self.mappings.duplicated(subset=['ticker', 'repo_full_name'], keep=False)]
-        if not duplicate_repos.empty:
-            issues.append(f"Found {len(duplicate_repos)} duplicate ticker-repo pairs")
+        _, pair_codes, pair_counts = np.unique(
+            ticker_codes.astype(np.int64) * len(repos) + repo_codes,
+            return_inverse=True,
+            return_counts=True
+        )
+        num_duplicates = int((pair_counts[pair_codes] > 1).sum())
+        if num_duplicates:
+            issues.append(f"Found {num_duplicates} duplicate ticker-repo pairs")
 
         # Check for tickers without primary repo
-        tickers = self.mappings.groupby('ticker')['primary_repo'].any()
-        tickers_without_primary = tickers[~tickers].index.tolist()
+        has_primary = np.bincount(ticker_codes, weights=primary, minlength=len(tickers)) > 0
+        valid_tickers = pd.notna(tickers)
+        tickers_without_primary = list(tickers[~has_primary & valid_tickers])
         if tickers_without_primary:
             issues.append(f"Tickers without primary repo: {tickers_without_primary}")
 
         # Check for invalid repo format
-        invalid_format = self.mappings[~self.mappings['repo_full_name'].str.contains('/')]
-        if not invalid_format.empty:
-            issues.append(f"Found {len(invalid_format)} repos with invalid format (missing '/')")
+        invalid_repos = np.char.find(np.asarray(repos, dtype=str), '/') < 0
+        num_invalid = int(invalid_repos[repo_codes].sum())
+        if num_invalid:
+            issues.append(f"Found {num_invalid} repos with invalid format (missing '/')")
 
         return {
             'valid': len(issues) == 0,
-            'num_companies': self.mappings['ticker'].nunique(),
-            'num_repos': len(self.mappings),
+            'num_companies': int(valid_tickers.sum()),
+            'num_repos': len(mappings),
             'issues': issues
         }
 
@@ -1,24 +1,74 @@
 """GitHub data collection for repository events and activity."""
 
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 import logging
 from pathlib import Path
-import json
 
-from github import Github, GithubException, RateLimitExceededException
-from github.Repository import Repository
-from github.GitRelease import GitRelease
-from github.Commit import Commit
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from ..config import get_config
 
+# PyGithub, requests and tqdm are imported where they are used so that
+# importing this module (and the pipeline) stays cheap
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $branch: String!,
+      $since: GitTimestamp, $until: GitTimestamp, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $branch) { ...History }
+    defaultBranchRef { ...History }
+  }
+}
+
+fragment History on Ref {
+  target {
+    ... on Commit {
+      history(first: 100, after: $cursor, since: $since, until: $until) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          oid
+          messageHeadline
+          additions
+          deletions
+          author { name date user { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class _RequestThrottle:
+    """Spaces out API requests shared by any number of worker threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller's request slot is due."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class GitHubCollector:
     """Collects GitHub repository data for analysis."""
@@ -36,6 +86,9 @@ class GitHubCollector:
         if github_token is None:
             github_token = self.config.get_github_token()
 
+        from github import Github
+
+        self._token = github_token
         if github_token:
             self.github = Github(github_token)
             logger.info("GitHub API initialized with authentication (5000 requests/hour)")
@@ -46,6 +99,9 @@ class GitHubCollector:
         self.cache_dir = self.config.raw_data_dir / "github"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # One throttle per client so threads sharing a token share its budget
+        self._throttle = _RequestThrottle(self._request_delay())
+
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """Get current rate limit status."""
         try:
@@ -73,7 +129,7 @@ class GitHubCollector:
             return {
                 'core_remaining': 5000,
                 'core_limit': 5000,
-                'core_reset': datetime.utcnow(),
+                'core_reset': datetime.now(timezone.utc),
                 'search_remaining': 30,
                 'search_limit': 30,
             }
@@ -94,14 +150,87 @@ class GitHubCollector:
                 reset_time = rate_limit.rate.reset
 
             if remaining is not None and remaining < 10:
-                sleep_time = (reset_time - datetime.utcnow()).total_seconds() + 10
+                # Older PyGithub versions report a naive UTC reset time
+                if reset_time.tzinfo is None:
+                    reset_time = reset_time.replace(tzinfo=timezone.utc)
+                sleep_time = (reset_time - datetime.now(timezone.utc)).total_seconds() + 10
                 if sleep_time > 0:
                     logger.warning(f"Rate limit low. Sleeping for {sleep_time:.0f} seconds...")
                     time.sleep(sleep_time)
         except Exception as e:
             logger.warning(f"Could not check rate limit, continuing anyway: {e}")
 
-    def get_repository(self, repo_full_name: str) -> Repository:
+    def _request_delay(self) -> float:
+        """Seconds to pause between paginated API requests (0 if rate limits are ignored)."""
+        if not self.config.get('collection.respect_rate_limits'):
+            return 0
+        return self.config.get('collection.sleep_between_requests', 0.5)
+
+    def _cache_file(self, repo_full_name: str, kind: str) -> Optional[Path]:
+        """
+        Parquet cache file for a repository's releases or commits.
+
+        Args:
+            repo_full_name: Repository name in format 'owner/repo'
+            kind: Cached data kind ('releases' or 'commits')
+
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if not self.config.get('collection.cache_enabled'):
+            return None
+        return self.cache_dir / f"{repo_full_name.replace('/', '_')}_{kind}.parquet"
+
+    def _load_cache(self, cache_file: Optional[Path], date_col: str) -> Optional[pd.DataFrame]:
+        """
+        Load cached releases or commits of a repository.
+
+        JSON caches written by earlier versions are converted to Parquet on
+        first read.
+
+        Args:
+            cache_file: Parquet cache file, or None if caching is disabled
+            date_col: Date column to parse when converting a JSON cache
+
+        Returns:
+            Cached DataFrame, or None if caching is disabled or nothing is cached
+        """
+        if cache_file is None:
+            return None
+
+        legacy_file = cache_file.with_suffix('.json')
+
+        if cache_file.exists():
+            logger.info(f"Loading from cache: {cache_file}")
+            df = pd.read_parquet(cache_file)
+        elif legacy_file.exists():
+            logger.info(f"Converting cache to Parquet: {legacy_file}")
+            # Parse straight into columns; keep SHAs and tags as strings
+            df = pd.read_json(legacy_file, orient='records', dtype=False, convert_dates=False)
+            if not df.empty:
+                df[date_col] = pd.to_datetime(df[date_col], format='ISO8601', utc=True, cache=True)
+                df = df.sort_values(date_col, kind='stable', ignore_index=True)
+                self._save_cache(df, cache_file)
+        else:
+            return None
+
+        return None if df.empty else df
+
+    def _save_cache(self, df: pd.DataFrame, cache_file: Optional[Path]):
+        """
+        Cache a repository's releases or commits as Parquet.
+
+        Args:
+            df: Releases or commits to cache
+            cache_file: Parquet cache file, or None if caching is disabled
+        """
+        if cache_file is None or df.empty:
+            return
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, compression='zstd', index=False)
+
+    def get_repository(self, repo_full_name: str) -> 'Repository':
         """
         Get repository object.
 
@@ -111,6 +240,8 @@ class GitHubCollector:
         Returns:
             GitHub Repository object
         """
+        from github import GithubException
+
         try:
             return self.github.get_repo(repo_full_name)
         except GithubException as e:
@@ -166,15 +297,12 @@ class GitHubCollector:
         logger.info(f"Collecting releases for {repo_full_name}")
 
         # Check cache
-        cache_file = self.cache_dir / f"{repo_full_name.replace('/', '_')}_releases.json"
-        if self.config.get('collection.cache_enabled') and cache_file.exists():
-            logger.info(f"Loading releases from cache: {cache_file}")
-            with open(cache_file, 'r') as f:
-                releases_data = json.load(f)
-            df = pd.DataFrame(releases_data)
-            if not df.empty:
-                df['published_at'] = pd.to_datetime(df['published_at'])
-                return self._filter_by_date(df, start_date, end_date)
+        cache_file = self._cache_file(repo_full_name, 'releases')
+        cached = self._load_cache(cache_file, 'published_at')
+        if cached is not None:
+            return self._filter_by_date(cached, start_date, end_date)
+
+        from github import GithubException
 
         self._wait_for_rate_limit()
         repo = self.get_repository(repo_full_name)
@@ -205,25 +333,20 @@ class GitHubCollector:
                 }
                 releases.append(release_data)
 
-                # Respect rate limits
-                if self.config.get('collection.respect_rate_limits'):
-                    time.sleep(self.config.get('collection.sleep_between_requests', 0.5))
-
         except GithubException as e:
             logger.error(f"Error collecting releases for {repo_full_name}: {e}")
 
         df = pd.DataFrame(releases)
 
-        # Cache results
-        if self.config.get('collection.cache_enabled') and not df.empty:
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, 'w') as f:
-                json.dump(df.to_dict('records'), f, default=str, indent=2)
-
         if df.empty:
             return df
 
         df['published_at'] = pd.to_datetime(df['published_at'])
+        df = df.sort_values('published_at', kind='stable', ignore_index=True)
+
+        # Cache results
+        self._save_cache(df, cache_file)
+
         return self._filter_by_date(df, start_date, end_date)
 
     def collect_commits(
@@ -248,20 +371,44 @@ class GitHubCollector:
         logger.info(f"Collecting commits for {repo_full_name}")
 
         # Check cache
-        cache_file = self.cache_dir / f"{repo_full_name.replace('/', '_')}_commits.json"
-        if self.config.get('collection.cache_enabled') and cache_file.exists():
-            logger.info(f"Loading commits from cache: {cache_file}")
-            with open(cache_file, 'r') as f:
-                commits_data = json.load(f)
-            df = pd.DataFrame(commits_data)
-            if not df.empty:
-                df['commit_date'] = pd.to_datetime(df['commit_date'])
-                return self._filter_by_date(df, start_date, end_date, 'commit_date')
+        cache_file = self._cache_file(repo_full_name, 'commits')
+        cached = self._load_cache(cache_file, 'commit_date')
+        if cached is not None:
+            return self._filter_by_date(cached, start_date, end_date, 'commit_date')
+
+        commits = self._collect_commits_graphql(repo_full_name, start_date, end_date, branch)
+        if commits is None:
+            commits = self._collect_commits_rest(repo_full_name, start_date, end_date, branch)
+
+        df = pd.DataFrame(commits)
+
+        if df.empty:
+            return df
+
+        df['commit_date'] = pd.to_datetime(df['commit_date'], format='ISO8601', utc=True, cache=True)
+        df = df.sort_values('commit_date', kind='stable', ignore_index=True)
+
+        # Cache results
+        self._save_cache(df, cache_file)
+
+        return df
+
+    def _collect_commits_rest(
+        self,
+        repo_full_name: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        branch: str
+    ) -> List[Dict[str, Any]]:
+        """Collect commits through the REST API (one extra request per commit for stats)."""
+        from github import GithubException
+        from tqdm import tqdm
 
         self._wait_for_rate_limit()
         repo = self.get_repository(repo_full_name)
 
         commits = []
+        self._throttle.interval = self._request_delay()
         try:
             # Try main branch first, fallback to master
             try:
@@ -270,7 +417,17 @@ class GitHubCollector:
                 logger.info(f"Branch '{branch}' not found, trying 'master'")
                 commit_generator = repo.get_commits(sha='master', since=start_date, until=end_date)
 
-            for commit in tqdm(commit_generator, desc=f"Fetching commits"):
+            # Batch progress redraws; disable=None hides the bar when not on a TTY
+            progress = tqdm(
+                commit_generator,
+                desc="Fetching commits",
+                mininterval=1.0,
+                miniters=50,
+                disable=None,
+            )
+            for commit in progress:
+                # commit.stats costs one request per commit
+                self._throttle.wait()
                 commit_data = {
                     'repo': repo_full_name,
                     'sha': commit.sha,
@@ -284,26 +441,92 @@ class GitHubCollector:
                 }
                 commits.append(commit_data)
 
-                # Respect rate limits
-                if self.config.get('collection.respect_rate_limits'):
-                    time.sleep(self.config.get('collection.sleep_between_requests', 0.5))
-
         except GithubException as e:
             logger.error(f"Error collecting commits for {repo_full_name}: {e}")
 
-        df = pd.DataFrame(commits)
+        return commits
 
-        # Cache results
-        if self.config.get('collection.cache_enabled') and not df.empty:
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, 'w') as f:
-                json.dump(df.to_dict('records'), f, default=str, indent=2)
+    def _collect_commits_graphql(
+        self,
+        repo_full_name: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        branch: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Collect commits through the GraphQL API, 100 commits with stats per request.
 
-        if df.empty:
-            return df
+        Returns:
+            List of commit records, or None if GraphQL is unavailable or fails
+        """
+        if not self._token:
+            return None
+
+        import requests
+
+        owner, name = repo_full_name.split('/', 1)
+        variables = {
+            'owner': owner,
+            'name': name,
+            'branch': branch,
+            'since': self._git_timestamp(start_date),
+            'until': self._git_timestamp(end_date),
+            'cursor': None,
+        }
+        headers = {'Authorization': f"bearer {self._token}"}
+        timeout = self.config.get('github.timeout', 30)
 
-        df['commit_date'] = pd.to_datetime(df['commit_date'])
-        return df
+        commits = []
+        try:
+            with requests.Session() as session:
+                while True:
+                    response = session.post(
+                        GRAPHQL_URL,
+                        json={'query': COMMIT_HISTORY_QUERY, 'variables': variables},
+                        headers=headers,
+                        timeout=timeout,
+                    )
+                    response.raise_for_status()
+                    payload = response.json()
+                    if payload.get('errors'):
+                        raise ValueError(payload['errors'][0].get('message'))
+
+                    repository = payload['data']['repository']
+                    target = (repository['ref'] or repository['defaultBranchRef'])['target']
+                    history = target['history']
+
+                    for node in history['nodes']:
+                        author = node['author'] or {}
+                        user = author.get('user') or {}
+                        commits.append({
+                            'repo': repo_full_name,
+                            'sha': node['oid'],
+                            'commit_date': author.get('date'),
+                            'author': author.get('name'),
+                            'author_login': user.get('login'),
+                            'message': node['messageHeadline'],
+                            'additions': node['additions'],
+                            'deletions': node['deletions'],
+                            'total_changes': node['additions'] + node['deletions'],
+                        })
+
+                    if not history['pageInfo']['hasNextPage']:
+                        break
+                    variables['cursor'] = history['pageInfo']['endCursor']
+        except Exception as e:
+            logger.warning(f"GraphQL commit query failed for {repo_full_name}, using REST: {e}")
+            return None
+
+        return commits
+
+    @staticmethod
+    def _git_timestamp(value: Optional[datetime]) -> Optional[str]:
+        """Format a datetime as a GraphQL GitTimestamp, treating naive values as UTC."""
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
 
     def aggregate_daily_commits(self, commits_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -318,16 +541,16 @@ class GitHubCollector:
         if commits_df.empty:
             return pd.DataFrame()
 
-        daily = commits_df.groupby([pd.Grouper(key='commit_date', freq='D'), 'repo']).agg({
-            'sha': 'count',
-            'additions': 'sum',
-            'deletions': 'sum',
-            'total_changes': 'sum',
-            'author_login': 'nunique'
-        }).reset_index()
+        # Calendar day as a plain grouping key; binning through pd.Grouper is far slower
+        day = commits_df['commit_date'].dt.floor('D').rename('date')
 
-        daily.columns = ['date', 'repo', 'num_commits', 'total_additions',
-                        'total_deletions', 'total_changes', 'unique_authors']
+        daily = commits_df.groupby([day, 'repo']).agg(
+            num_commits=('sha', 'size'),
+            total_additions=('additions', 'sum'),
+            total_deletions=('deletions', 'sum'),
+            total_changes=('total_changes', 'sum'),
+            unique_authors=('author_login', 'nunique'),
+        ).reset_index()
 
         return daily
 
@@ -349,21 +572,18 @@ class GitHubCollector:
         if daily_commits.empty:
             return pd.DataFrame()
 
-        # Calculate rolling statistics
-        daily_commits = daily_commits.sort_values('date')
-        daily_commits['rolling_mean'] = daily_commits['num_commits'].rolling(window=30, min_periods=7).mean()
-        daily_commits['rolling_std'] = daily_commits['num_commits'].rolling(window=30, min_periods=7).std()
+        # Calculate rolling statistics on the date-ordered counts
+        order = np.argsort(daily_commits['date'].to_numpy(), kind='stable')
+        counts = daily_commits['num_commits'].to_numpy(dtype=np.float64)[order]
+        rolling = pd.Series(counts).rolling(window=30, min_periods=7)
 
-        # Identify spikes
-        daily_commits['z_score'] = (
-            (daily_commits['num_commits'] - daily_commits['rolling_mean']) /
-            daily_commits['rolling_std']
-        )
+        # Identify spikes; only the kept rows are materialized
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = (counts - rolling.mean().to_numpy()) / rolling.std().to_numpy()
+        spike_idx = np.flatnonzero(z_scores > threshold)
 
-        spikes = daily_commits[daily_commits['z_score'] > threshold].copy()
-        spikes['event_type'] = 'commit_spike'
-
-        return spikes[['date', 'repo', 'num_commits', 'z_score', 'event_type']]
+        spikes = daily_commits[['date', 'repo', 'num_commits']].iloc[order[spike_idx]]
+        return spikes.assign(z_score=z_scores[spike_idx], event_type='commit_spike')
 
     def get_repository_metadata(self, repo_full_name: str) -> Dict[str, Any]:
         """
@@ -400,25 +620,28 @@ class GitHubCollector:
         date_col: str = 'published_at'
     ) -> pd.DataFrame:
         """Filter DataFrame by date range."""
-        if df.empty:
+        if df.empty or not pd.api.types.is_datetime64_any_dtype(df[date_col]):
             return df
 
-        # Make dates timezone-aware if column has timezone info
-        if start_date and pd.api.types.is_datetime64_any_dtype(df[date_col]):
-            if df[date_col].dt.tz is not None:
-                # Column has timezone, make start_date timezone-aware
-                if start_date.tzinfo is None:
-                    import pytz
-                    start_date = pytz.UTC.localize(start_date)
-            df = df[df[date_col] >= start_date]
-
-        if end_date and pd.api.types.is_datetime64_any_dtype(df[date_col]):
-            if df[date_col].dt.tz is not None:
-                # Column has timezone, make end_date timezone-aware
-                if end_date.tzinfo is None:
-                    import pytz
-                    end_date = pytz.UTC.localize(end_date)
-            df = df[df[date_col] <= end_date]
+        dates = df[date_col]
+        if dates.dt.tz is not None:
+            # Column has timezone, make naive bounds timezone-aware
+            if start_date and start_date.tzinfo is None:
+                start_date = start_date.replace(tzinfo=timezone.utc)
+            if end_date and end_date.tzinfo is None:
+                end_date = end_date.replace(tzinfo=timezone.utc)
+
+        if dates.is_monotonic_increasing:
+            # Caches are written in date order, so the range is one contiguous slice
+            lo = dates.searchsorted(start_date, side='left') if start_date else 0
+            hi = dates.searchsorted(end_date, side='right') if end_date else len(df)
+            return df.iloc[lo:hi]
+
+        if start_date:
+            df = df[dates >= start_date]
+            dates = df[date_col]
+        if end_date:
+            df = df[dates <= end_date]
 
         return df
 
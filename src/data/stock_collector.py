@@ -1,9 +1,15 @@
 """Stock price data collection and processing."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple
 from pathlib import Path
+from urllib.parse import quote
 import json
 
 import pandas as pd
@@ -16,77 +22,343 @@ from ..config import get_config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Calendar days fetched beyond the event/estimation windows so they still
+# cover enough trading days around weekends and holidays
+EVENT_WINDOW_BUFFER_DAYS = 50
+
+# Tickers per yf.download call when batch-fetching uncached prices
+DOWNLOAD_BATCH_SIZE = 200
+
+# Market index ranges kept in memory per collector
+MARKET_MEMO_SIZE = 64
+
+# Parsed price cache files kept in memory across collectors
+PRICE_READ_CACHE_SIZE = 256
+
+# Price cache schema version; bump it when the cached columns change to
+# invalidate every cached ticker at once
+PRICE_CACHE_VERSION = 'v1'
+
+# Prices are fetched unadjusted ('adj close' is kept as its own column)
+PRICE_AUTO_ADJUST = False
+
+# Yahoo chart endpoint used by the asyncio fetch path, and its connection limit
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+ASYNC_FETCH_CONCURRENCY = 16
+
+
+def to_naive_dates(dates):
+    """
+    Convert a date or dates to timezone-naive UTC, the form prices are indexed by.
+
+    Event dates are parsed as UTC-aware timestamps while cached prices carry
+    naive trading dates, so dates are normalized where they enter price lookups.
+
+    Args:
+        dates: Timestamp-like value or DatetimeIndex
+
+    Returns:
+        pd.Timestamp or DatetimeIndex without a timezone (naive input is unchanged)
+    """
+    if not isinstance(dates, pd.DatetimeIndex):
+        dates = pd.Timestamp(dates)
+    if dates.tz is not None:
+        dates = dates.tz_convert('UTC').tz_localize(None)
+    return dates
+
+
+@functools.lru_cache(maxsize=PRICE_READ_CACHE_SIZE)
+def _read_price_file(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read a cached price file; the modification time and size in the key pick up rewrites."""
+    return pd.read_parquet(path, engine='pyarrow')
+
 
 class StockCollector:
     """Collects and processes stock price data."""
 
-    def __init__(self):
-        """Initialize stock collector."""
+    def __init__(self, refresh: Optional[bool] = None, session=None):
+        """
+        Initialize stock collector.
+
+        Args:
+            refresh: Ignore cached prices and refetch (defaults to 'collection.refresh')
+            session: HTTP session for every yfinance request (curl_cffi or
+                requests, without response caching). If None, yfinance's own
+                shared session is used.
+        """
+        self.session = session
         self.config = get_config()
         self.cache_dir = self.config.raw_data_dir / "stocks"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh = self.config.get('collection.refresh', False) if refresh is None else refresh
+        self.cache_expire_after = self.config.get('collection.cache_expire_after', 86400)
+
+        # Market data by (start, end); every event asks for the same index ranges
+        self._market_memo: Dict[Tuple[pd.Timestamp, pd.Timestamp], pd.DataFrame] = {}
+        self._market_memo_lock = threading.Lock()
 
     def get_stock_data(
         self,
         ticker: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        timeout: float = 10
     ) -> pd.DataFrame:
         """
         Get stock price data for a ticker.
 
+        Cached prices are reused when they cover the requested range. A range
+        that runs past the last fetch is still served from cache while the
+        fetch is younger than 'collection.cache_expire_after' seconds;
+        otherwise only the missing dates before and after the cached range are
+        fetched and merged into the cache. A stale cache is served if
+        fetching fails.
+
         Args:
             ticker: Stock ticker symbol
             start_date: Start date for data collection
             end_date: End date for data collection
             use_cache: Whether to use cached data
+            timeout: Seconds to wait for the price request
 
         Returns:
             DataFrame with OHLCV data and adjusted close
         """
-        # Set default dates
-        if start_date is None:
-            start_date = datetime.now() - timedelta(days=365 * 3)
-        if end_date is None:
-            end_date = datetime.now()
+        start_date, end_date = self._default_dates(start_date, end_date)
 
         # Check cache
-        cache_file = self.cache_dir / f"{ticker}.csv"
-        if use_cache and cache_file.exists():
+        cache_file = self._cache_file(ticker)
+        cached = None
+        if use_cache and not self.refresh and self._is_cached(ticker):
             logger.info(f"Loading {ticker} from cache")
-            df = pd.read_csv(cache_file, index_col=0, parse_dates=True)
+            cached = self._load_prices(ticker)
 
             # Check if cached data covers requested range
-            if df.index.min() <= pd.Timestamp(start_date) and df.index.max() >= pd.Timestamp(end_date):
-                return df.loc[start_date:end_date]
+            if cached.index.min() <= pd.Timestamp(start_date) and cached.index.max() >= pd.Timestamp(end_date):
+                return cached.loc[start_date:end_date]
+            elif self._cache_is_current(cache_file, start_date, end_date):
+                return cached.loc[start_date:end_date]
             else:
-                logger.info(f"Cached data for {ticker} doesn't cover full range, fetching new data")
+                logger.info(f"Cached data for {ticker} doesn't cover full range, fetching missing dates")
 
         # Fetch from yfinance
         logger.info(f"Fetching stock data for {ticker}")
         try:
-            ticker_obj = yf.Ticker(ticker)
-            df = ticker_obj.history(start=start_date, end=end_date, auto_adjust=False)
+            if cached is not None and not cached.empty:
+                # Only fetch the dates before and after the cached range
+                cached_start, cached_end = self._cached_range(cache_file, cached)
+                parts = [cached]
+                if pd.Timestamp(start_date) < cached_start:
+                    parts.insert(0, self._fetch_prices(ticker, start_date, cached_start, timeout))
+                if pd.Timestamp(end_date) > cached_end:
+                    parts.append(self._fetch_prices(ticker, cached_end, end_date, timeout))
+                df = pd.concat([part for part in parts if not part.empty])
+                df = df[~df.index.duplicated(keep='last')].sort_index()
+                fetched_start = min(pd.Timestamp(start_date), cached_start)
+                fetched_end = max(pd.Timestamp(end_date), cached_end)
+            else:
+                df = self._fetch_prices(ticker, start_date, end_date, timeout)
+                fetched_start, fetched_end = start_date, end_date
 
             if df.empty:
                 logger.warning(f"No data returned for {ticker}")
                 return pd.DataFrame()
 
-            # Rename columns to lowercase
-            df.columns = df.columns.str.lower()
-
             # Cache the data
             if use_cache:
-                df.to_csv(cache_file)
-                logger.info(f"Cached {ticker} data to {cache_file}")
+                self._save_prices(ticker, df, fetched_start, fetched_end)
 
-            return df
+            return df.loc[start_date:end_date]
 
         except Exception as e:
             logger.error(f"Error fetching data for {ticker}: {e}")
+            if cached is not None:
+                logger.warning(f"Serving stale cached data for {ticker}")
+                return cached.loc[start_date:end_date]
             return pd.DataFrame()
 
+    def _fetch_prices(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeout: float = 10
+    ) -> pd.DataFrame:
+        """Fetch a ticker's daily prices from yfinance with lowercase columns and trading-date index."""
+        df = yf.Ticker(ticker, session=self.session).history(start=start_date, end=end_date, auto_adjust=PRICE_AUTO_ADJUST, timeout=timeout)
+        if df.empty:
+            return df
+
+        # Rename columns to lowercase
+        df.columns = df.columns.str.lower()
+        df.index = self._trading_dates(df.index)
+        return df
+
+    def _cached_range(self, cache_file: Path, cached: pd.DataFrame) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Date range a cached price file was fetched for.
+
+        Args:
+            cache_file: Cached price file
+            cached: Cached price data
+
+        Returns:
+            Tuple of (start, end); the data's first and last dates if no fetch metadata exists
+        """
+        meta_file = cache_file.with_suffix('.meta.json')
+        if not meta_file.exists():
+            return cached.index.min(), cached.index.max()
+
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+        return pd.Timestamp(meta['start']), pd.Timestamp(meta['end'])
+
+    @staticmethod
+    def _default_dates(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[datetime, datetime]:
+        """Fill in the default price range (the last three years) as naive timestamps."""
+        if start_date is None:
+            start_date = datetime.now() - timedelta(days=365 * 3)
+        if end_date is None:
+            end_date = datetime.now()
+        return to_naive_dates(start_date), to_naive_dates(end_date)
+
+    @staticmethod
+    def _trading_dates(index: pd.Index) -> pd.DatetimeIndex:
+        """
+        Convert a price index to naive trading dates.
+
+        yfinance stamps daily bars at midnight exchange time; event dates are
+        naive, so the exchange timezone is dropped and the local date kept.
+        Older CSV caches hold these stamps as strings with mixed UTC offsets.
+
+        Args:
+            index: Price index from yfinance or a CSV cache
+
+        Returns:
+            Timezone-naive DatetimeIndex of trading dates
+        """
+        if isinstance(index, pd.DatetimeIndex):
+            return index.tz_localize(None) if index.tz is not None else index
+        dates = pd.to_datetime(index.astype(str).str.slice(0, 10))
+        return pd.DatetimeIndex(dates, name=index.name)
+
+    @staticmethod
+    def _cache_key(ticker: str) -> str:
+        """Content-addressed key for the inputs that determine a ticker's cached prices."""
+        key = f"{ticker}|{PRICE_AUTO_ADJUST}|{PRICE_CACHE_VERSION}"
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    def _cache_file(self, ticker: str) -> Path:
+        """Cached price file for a ticker."""
+        return self.cache_dir / ticker / f"{self._cache_key(ticker)}.parquet"
+
+    def _legacy_cache_file(self, ticker: str) -> Optional[Path]:
+        """Ticker-named price cache from earlier versions (Parquet or CSV), if present."""
+        for suffix in ('.parquet', '.csv'):
+            legacy_file = self.cache_dir / f"{ticker}{suffix}"
+            if legacy_file.exists():
+                return legacy_file
+        return None
+
+    def _is_cached(self, ticker: str) -> bool:
+        """Check whether a ticker has cached prices (including a cache from earlier versions)."""
+        return self._cache_file(ticker).exists() or self._legacy_cache_file(ticker) is not None
+
+    def _load_prices(self, ticker: str) -> pd.DataFrame:
+        """
+        Read a ticker's cached prices.
+
+        Parsed files are reused from memory until the file changes.
+        Ticker-named caches written by earlier versions (Parquet or CSV) were
+        fetched with the same settings, so they are moved under the current
+        cache key on first read along with their fetch metadata.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Cached price DataFrame
+        """
+        cache_file = self._cache_file(ticker)
+        if cache_file.exists():
+            stat = cache_file.stat()
+            return _read_price_file(str(cache_file), stat.st_mtime_ns, stat.st_size)
+
+        legacy_file = self._legacy_cache_file(ticker)
+        logger.info(f"Moving {ticker} cache to {cache_file}")
+        if legacy_file.suffix == '.csv':
+            df = pd.read_csv(legacy_file, index_col=0)
+            df.index = self._trading_dates(df.index)
+        else:
+            df = pd.read_parquet(legacy_file, engine='pyarrow')
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
+        legacy_meta = legacy_file.with_suffix('.meta.json')
+        if legacy_meta.exists():
+            legacy_meta.replace(cache_file.with_suffix('.meta.json'))
+        legacy_file.unlink()
+        return df
+
+    def _save_prices(self, ticker: str, df: pd.DataFrame, start_date: datetime, end_date: datetime):
+        """Cache fetched prices for a ticker along with the range they were fetched for."""
+        cache_file = self._cache_file(ticker)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
+        self._write_cache_meta(cache_file, start_date, end_date)
+        logger.info(f"Cached {ticker} data to {cache_file}")
+
+        if ticker == self.config.market_index:
+            with self._market_memo_lock:
+                self._market_memo.clear()
+
+    def _cache_is_current(self, cache_file: Path, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Check whether a cached price file already holds every row for a range.
+
+        Rows missing at the end of a cached range are non-trading days or days
+        that had not happened yet at fetch time, so a recent fetch that started
+        early enough and ran up to its fetch time covers the request.
+
+        Args:
+            cache_file: Cached price file
+            start_date: Requested start date
+            end_date: Requested end date
+
+        Returns:
+            True if the cached data can be served without refetching
+        """
+        meta_file = cache_file.with_suffix('.meta.json')
+        if not meta_file.exists():
+            return False
+
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
+
+        fetched_at = pd.Timestamp(meta['fetched_at'])
+        if pd.Timestamp(meta['start']) > pd.Timestamp(start_date):
+            return False
+        if pd.Timestamp(meta['end']) >= pd.Timestamp(end_date):
+            return True
+
+        # Range extends past the last fetch: trust it while the fetch is fresh
+        is_fresh = (pd.Timestamp.now() - fetched_at).total_seconds() < self.cache_expire_after
+        return is_fresh and pd.Timestamp(meta['end']) >= fetched_at.normalize()
+
+    def _write_cache_meta(self, cache_file: Path, start_date: datetime, end_date: datetime):
+        """Record the requested range and fetch time of a cached price file."""
+        meta = {
+            'start': pd.Timestamp(start_date).isoformat(),
+            'end': pd.Timestamp(end_date).isoformat(),
+            'fetched_at': pd.Timestamp.now().isoformat(),
+        }
+        with open(cache_file.with_suffix('.meta.json'), 'w') as f:
+            json.dump(meta, f)
+
     def get_market_data(
         self,
         start_date: Optional[datetime] = None,
@@ -95,6 +367,9 @@ class StockCollector:
         """
         Get market index data (e.g., S&P 500).
 
+        Results for explicit date ranges are memoized until the index's
+        cache is rewritten.
+
         Args:
             start_date: Start date
             end_date: End date
@@ -103,7 +378,22 @@ class StockCollector:
             DataFrame with market index data
         """
         market_ticker = self.config.market_index
-        return self.get_stock_data(market_ticker, start_date, end_date)
+        if start_date is None or end_date is None:
+            return self.get_stock_data(market_ticker, start_date, end_date)
+
+        key = (to_naive_dates(start_date), to_naive_dates(end_date))
+        with self._market_memo_lock:
+            data = self._market_memo.get(key)
+        if data is not None:
+            return data
+
+        data = self.get_stock_data(market_ticker, start_date, end_date)
+        if not data.empty:
+            with self._market_memo_lock:
+                if len(self._market_memo) >= MARKET_MEMO_SIZE:
+                    self._market_memo.pop(next(iter(self._market_memo)))
+                self._market_memo[key] = data
+        return data
 
     def calculate_returns(
         self,
@@ -126,6 +416,27 @@ class StockCollector:
         returns = price_data[price_column].pct_change()
         return returns
 
+    def calculate_returns_matrix(self, prices_2d: np.ndarray) -> np.ndarray:
+        """
+        Calculate daily returns for a stacked price matrix.
+
+        Args:
+            prices_2d: Prices with one row per trading day (and one column per
+                ticker, as in the frame from get_multiple_tickers)
+
+        Returns:
+            Array of the same shape with simple returns; the first row is NaN
+        """
+        prices_2d = np.asarray(prices_2d, dtype=np.float64)
+        returns = np.empty_like(prices_2d)
+        if len(prices_2d) == 0:
+            return returns
+        returns[0] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(prices_2d[1:], prices_2d[:-1], out=returns[1:])
+        returns[1:] -= 1.0
+        return returns
+
     def get_trading_days(
         self,
         start_date: datetime,
@@ -161,21 +472,41 @@ class StockCollector:
         Returns:
             Aligned trading day or None if not found
         """
-        event_date = pd.Timestamp(event_date).normalize()
+        aligned = self.align_events_to_trading_days([event_date], trading_days, direction)[0]
+        return None if pd.isna(aligned) else aligned
+
+    def align_events_to_trading_days(
+        self,
+        event_dates: pd.DatetimeIndex,
+        trading_days: pd.DatetimeIndex,
+        direction: str = 'forward'
+    ) -> pd.DatetimeIndex:
+        """
+        Align many event dates to trading days with one binary search.
 
-        if event_date in trading_days:
-            return event_date
+        Args:
+            event_dates: Event dates to align
+            trading_days: Sorted index of trading days
+            direction: 'forward' to find next trading day, 'backward' for previous
 
+        Returns:
+            Aligned trading days, NaT where no trading day exists in that direction
+        """
+        event_dates = to_naive_dates(pd.DatetimeIndex(event_dates)).normalize()
+        n_days = len(trading_days)
+        if n_days == 0:
+            return pd.DatetimeIndex([pd.NaT] * len(event_dates))
+
+        # A trading day on the event date itself is its own alignment
         if direction == 'forward':
-            future_days = trading_days[trading_days > event_date]
-            if len(future_days) > 0:
-                return future_days[0]
+            idx = trading_days.searchsorted(event_dates, side='left')
+            found = idx < n_days
         else:  # backward
-            past_days = trading_days[trading_days < event_date]
-            if len(past_days) > 0:
-                return past_days[-1]
+            idx = trading_days.searchsorted(event_dates, side='right') - 1
+            found = idx >= 0
 
-        return None
+        aligned = trading_days[np.clip(idx, 0, n_days - 1)]
+        return aligned.where(found)
 
     def get_event_window_data(
         self,
@@ -184,7 +515,8 @@ class StockCollector:
         pre_days: int = 5,
         post_days: int = 5,
         estimation_start: int = -130,
-        estimation_end: int = -31
+        estimation_end: int = -31,
+        stock_data: Optional[pd.DataFrame] = None
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Get stock data for event window and estimation period.
@@ -196,17 +528,21 @@ class StockCollector:
             post_days: Days after event in event window
             estimation_start: Start of estimation window (days before event)
             estimation_end: End of estimation window (days before event)
+            stock_data: Already-fetched price history for the ticker (skips the fetch)
 
         Returns:
             Tuple of (event_window_data, estimation_window_data)
         """
-        # Calculate date ranges (add buffer for trading days)
-        buffer_days = 50
-        data_start = event_date + timedelta(days=estimation_start - buffer_days)
-        data_end = event_date + timedelta(days=post_days + buffer_days)
+        # Calculate date ranges from the event's calendar day (add buffer for trading days)
+        event_date = to_naive_dates(event_date).normalize()
+        data_start = event_date + timedelta(days=estimation_start - EVENT_WINDOW_BUFFER_DAYS)
+        data_end = event_date + timedelta(days=post_days + EVENT_WINDOW_BUFFER_DAYS)
 
         # Fetch stock data
-        stock_data = self.get_stock_data(ticker, data_start, data_end)
+        if stock_data is None:
+            stock_data = self.get_stock_data(ticker, data_start, data_end)
+        elif not stock_data.empty:
+            stock_data = stock_data.loc[data_start:data_end]
 
         if stock_data.empty:
             return pd.DataFrame(), pd.DataFrame()
@@ -249,31 +585,290 @@ class StockCollector:
         tickers: List[str],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        price_column: str = 'close'
+        price_column: str = 'close',
+        max_workers: Optional[int] = None,
+        timeout: float = 10
     ) -> pd.DataFrame:
         """
         Get price data for multiple tickers.
 
+        Tickers are fetched concurrently since each fetch waits on the network.
+
         Args:
             tickers: List of ticker symbols
             start_date: Start date
             end_date: End date
             price_column: Which price column to extract
+            max_workers: Concurrent fetches (defaults to 'collection.max_workers')
+            timeout: Seconds to wait for each ticker's price request
 
         Returns:
             DataFrame with tickers as columns and dates as index
         """
+        if max_workers is None:
+            max_workers = self.config.get('collection.max_workers', 8)
+
+        start_date, end_date = self._default_dates(start_date, end_date)
         all_data = {}
 
-        for ticker in tqdm(tickers, desc="Fetching stock data"):
-            data = self.get_stock_data(ticker, start_date, end_date)
-            if not data.empty and price_column in data.columns:
+        # Tickers without a cache file are fetched in batches; the rest (and
+        # any ticker a batch misses) go through get_stock_data's cache path
+        uncached = [t for t in tickers if self.refresh or not self._is_cached(t)]
+        downloaded = self._download_prices(uncached, start_date, end_date, timeout)
+        for ticker, data in downloaded.items():
+            if price_column in data.columns:
                 all_data[ticker] = data[price_column]
+        remaining = [t for t in tickers if t not in downloaded]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_stock_data, ticker, start_date, end_date, timeout=timeout): ticker
+                for ticker in remaining
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching stock data"):
+                ticker = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.warning(f"Skipping {ticker}: {e}")
+                    continue
+                if not data.empty and price_column in data.columns:
+                    all_data[ticker] = data[price_column]
 
         if not all_data:
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_data)
+        # Keep the caller's ticker order regardless of completion order
+        df = pd.DataFrame({ticker: all_data[ticker] for ticker in tickers if ticker in all_data})
+        return df
+
+    def _download_prices(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeout: float = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch prices for many tickers with batched yf.download calls and cache them.
+
+        With 'collection.async_fetch' on (off by default) and aiohttp installed,
+        tickers are first fetched concurrently from Yahoo's chart endpoint; only
+        those it fails for go through yf.download.
+
+        Args:
+            tickers: Ticker symbols to fetch
+            start_date: Start date
+            end_date: End date
+            timeout: Seconds to wait for each batch request
+
+        Returns:
+            Dictionary mapping ticker to its price data (tickers without data are omitted)
+        """
+        prices = {}
+        if tickers and self.config.get('collection.async_fetch', False):
+            prices = self._download_prices_async(tickers, start_date, end_date, timeout)
+            tickers = [t for t in tickers if t not in prices]
+
+        for i in range(0, len(tickers), DOWNLOAD_BATCH_SIZE):
+            batch = tickers[i:i + DOWNLOAD_BATCH_SIZE]
+            logger.info(f"Downloading stock data for {len(batch)} tickers")
+            try:
+                # Same columns and exchange-local index as Ticker.history
+                raw = yf.download(
+                    tickers=' '.join(batch),
+                    start=start_date,
+                    end=end_date,
+                    group_by='ticker',
+                    threads=True,
+                    auto_adjust=PRICE_AUTO_ADJUST,
+                    actions=True,
+                    ignore_tz=False,
+                    progress=False,
+                    timeout=timeout,
+                    session=self.session,
+                )
+            except Exception as e:
+                logger.error(f"Error downloading batch of {len(batch)} tickers: {e}")
+                continue
+
+            if raw is None or raw.empty:
+                continue
+
+            available = set(raw.columns.get_level_values(0))
+            for ticker in batch:
+                if ticker not in available:
+                    continue
+                df = raw[ticker].dropna(how='all')
+                if df.empty:
+                    continue
+                df.columns = df.columns.str.lower()
+                df.index = self._trading_dates(df.index)
+                self._save_prices(ticker, df, start_date, end_date)
+                prices[ticker] = df
+
+        return prices
+
+    def _download_prices_async(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeout: float = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch prices for many tickers on one asyncio event loop and cache them.
+
+        Args:
+            tickers: Ticker symbols to fetch
+            start_date: Start date
+            end_date: End date
+            timeout: Seconds to wait for each request
+
+        Returns:
+            Dictionary mapping ticker to its price data (failed tickers are omitted;
+            empty if aiohttp is not installed or an event loop is already running)
+        """
+        try:
+            import aiohttp  # optional dependency
+        except ImportError:
+            return {}
+
+        # asyncio.run cannot nest (e.g. in Jupyter), so leave those callers to yfinance
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            logger.warning("Event loop already running, fetching stock data with yfinance")
+            return {}
+
+        logger.info(f"Fetching stock data for {len(tickers)} tickers asynchronously")
+        prices = asyncio.run(self._get_many_async(tickers, start_date, end_date, timeout))
+
+        for ticker, df in prices.items():
+            self._save_prices(ticker, df, start_date, end_date)
+        return prices
+
+    async def _get_many_async(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        timeout: float = 10
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch every ticker's history concurrently over one bounded connection pool."""
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=ASYNC_FETCH_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as session:
+            results = await asyncio.gather(
+                *(self._fetch_history_async(session, ticker, start_date, end_date) for ticker in tickers),
+                return_exceptions=True,
+            )
+
+        prices = {}
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Asynchronous fetch failed for {ticker}: {result}")
+            elif result is not None and not result.empty:
+                prices[ticker] = result
+        return prices
+
+    async def _fetch_history_async(
+        self,
+        session,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch one ticker's daily history from Yahoo's chart endpoint.
+
+        Args:
+            session: aiohttp client session
+            ticker: Stock ticker symbol
+            start_date: Start date
+            end_date: End date (exclusive, as in yfinance)
+
+        Returns:
+            Price DataFrame in the _fetch_prices schema, or None on a non-200 response
+        """
+        params = {
+            'period1': int(pd.Timestamp(start_date).timestamp()),
+            'period2': int(pd.Timestamp(end_date).timestamp()),
+            'interval': '1d',
+            'events': 'div,split',
+            'includeAdjustedClose': 'true',
+        }
+        async with session.get(YAHOO_CHART_URL.format(ticker=quote(ticker)), params=params) as response:
+            if response.status != 200:
+                logger.debug(f"Chart request for {ticker} returned HTTP {response.status}")
+                return None
+            payload = await response.json()
+        return self._parse_chart(payload)
+
+    @classmethod
+    def _parse_chart(cls, payload: Dict) -> Optional[pd.DataFrame]:
+        """
+        Convert a chart endpoint response into the _fetch_prices schema.
+
+        Matches Ticker.history(auto_adjust=False): OHLC, 'adj close', volume,
+        dividends and stock splits, indexed by naive trading date.
+
+        Args:
+            payload: Decoded chart JSON
+
+        Returns:
+            Price DataFrame, or None if the response holds no result
+        """
+        results = (payload.get('chart') or {}).get('result') or []
+        if not results:
+            return None
+        result = results[0]
+        timestamps = result.get('timestamp')
+        if not timestamps:
+            return pd.DataFrame()
+
+        exchange_tz = result.get('meta', {}).get('exchangeTimezoneName') or 'UTC'
+
+        def to_dates(seconds) -> pd.DatetimeIndex:
+            dates = pd.to_datetime(seconds, unit='s', utc=True).as_unit('ns')
+            return cls._trading_dates(dates.tz_convert(exchange_tz).normalize())
+
+        dates = to_dates(timestamps)
+        indicators = result.get('indicators', {})
+        quote_data = indicators.get('quote', [{}])[0]
+        adjclose = indicators.get('adjclose', [{}])[0].get('adjclose', quote_data.get('close'))
+
+        df = pd.DataFrame({
+            'open': quote_data.get('open'),
+            'high': quote_data.get('high'),
+            'low': quote_data.get('low'),
+            'close': quote_data.get('close'),
+            'adj close': adjclose,
+            'volume': quote_data.get('volume'),
+        }, index=dates, dtype=np.float64)
+        df = df.dropna(how='all', subset=['open', 'high', 'low', 'close'])
+        df = df[~df.index.duplicated(keep='last')]
+        df['volume'] = df['volume'].fillna(0).astype(np.int64)
+
+        events = result.get('events', {})
+        for column, values in (
+            ('dividends', [(e['date'], e['amount']) for e in events.get('dividends', {}).values()]),
+            ('stock splits', [(e['date'], e['numerator'] / e['denominator'])
+                              for e in events.get('splits', {}).values()]),
+        ):
+            df[column] = 0.0
+            if values:
+                seconds, amounts = zip(*values)
+                by_date = pd.Series(amounts, index=to_dates(list(seconds))).groupby(level=0).sum()
+                df[column] = by_date.reindex(df.index, fill_value=0.0).to_numpy()
+
+        df.index.name = 'Date'
         return df
 
     def validate_data_quality(
@@ -281,7 +876,8 @@ class StockCollector:
         ticker: str,
         start_date: datetime,
         end_date: datetime,
-        min_trading_days: int = 100
+        min_trading_days: int = 100,
+        expected_days: Optional[int] = None
     ) -> Dict[str, any]:
         """
         Validate stock data quality for analysis.
@@ -291,6 +887,8 @@ class StockCollector:
             start_date: Start date
             end_date: End date
             min_trading_days: Minimum required trading days
+            expected_days: Market trading days in the range, if already known
+                (validating many tickers over one range only needs it once)
 
         Returns:
             Dictionary with validation results
@@ -307,16 +905,16 @@ class StockCollector:
             }
 
         # Calculate metrics
-        returns = self.calculate_returns(data, 'close')
+        returns = self.calculate_returns_matrix(data['close'].to_numpy(dtype=np.float64))
         trading_days = len(data)
 
         # Check for missing data (compare to market trading days)
-        market_data = self.get_market_data(start_date, end_date)
-        expected_days = len(market_data)
+        if expected_days is None:
+            expected_days = self._expected_trading_days(start_date, end_date)
         missing_days = expected_days - trading_days
 
         # Check for extreme returns (potential data errors)
-        extreme_returns = (returns.abs() > 0.5).sum()  # >50% daily return
+        extreme_returns = int(np.count_nonzero(np.abs(returns) > 0.5))  # >50% daily return
 
         # Validation
         valid = (
@@ -334,6 +932,70 @@ class StockCollector:
             'reason': 'Valid' if valid else 'Insufficient or poor quality data'
         }
 
+    def validate_data_quality_batch(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        min_trading_days: int = 100
+    ) -> pd.DataFrame:
+        """
+        Validate stock data quality for many tickers over one range.
+
+        Works on the stacked close matrix from get_multiple_tickers, so the
+        extreme-return check is a single broadcast over the whole universe.
+        Returns spanning a gap in a ticker's history are not counted.
+
+        Args:
+            tickers: Stock tickers
+            start_date: Start date
+            end_date: End date
+            min_trading_days: Minimum required trading days
+
+        Returns:
+            DataFrame indexed by ticker with the validate_data_quality fields
+        """
+        columns = ['valid', 'trading_days', 'expected_days', 'missing_days', 'extreme_returns', 'reason']
+        prices = self.get_multiple_tickers(tickers, start_date, end_date, price_column='close')
+        prices = prices.reindex(columns=list(tickers))
+        if prices.empty:
+            results = pd.DataFrame(index=pd.Index(tickers, name='ticker'), columns=columns)
+            results['valid'] = False
+            results['trading_days'] = 0
+            results['missing_days'] = 0
+            results['extreme_returns'] = 0
+            results['reason'] = 'No data available'
+            return results
+
+        close = prices.to_numpy(dtype=np.float64, na_value=np.nan)
+        returns = self.calculate_returns_matrix(close)
+
+        trading_days = np.count_nonzero(~np.isnan(close), axis=0)
+        expected_days = self._expected_trading_days(start_date, end_date)
+        missing_days = expected_days - trading_days
+        extreme_returns = np.count_nonzero(np.abs(returns) > 0.5, axis=0)  # >50% daily return
+
+        valid = (
+            (trading_days >= min_trading_days) &
+            (missing_days < 0.1 * expected_days) &
+            (extreme_returns < 5)
+        )
+        reason = np.where(valid, 'Valid', 'Insufficient or poor quality data')
+        reason[trading_days == 0] = 'No data available'
+
+        return pd.DataFrame({
+            'valid': valid,
+            'trading_days': trading_days,
+            'expected_days': expected_days,
+            'missing_days': missing_days,
+            'extreme_returns': extreme_returns,
+            'reason': reason,
+        }, index=pd.Index(tickers, name='ticker'))
+
+    def _expected_trading_days(self, start_date: datetime, end_date: datetime) -> int:
+        """Number of market trading days in a range (served from the market data memo)."""
+        return len(self.get_market_data(start_date, end_date))
+
     def get_company_info(self, ticker: str) -> Dict[str, any]:
         """
         Get company information for a ticker.
@@ -344,8 +1006,82 @@ class StockCollector:
         Returns:
             Dictionary with company information
         """
+        info = self._fetch_company_info(ticker)
+        return info if info is not None else self._unknown_company(ticker)
+
+    def get_company_info_batch(
+        self,
+        tickers: List[str],
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Get company information for many tickers, fetching uncached ones concurrently.
+
+        Fetched information is kept in 'company_info.parquet' in the stock
+        cache, so repeat calls only fetch tickers not seen before.
+
+        Args:
+            tickers: List of ticker symbols
+            max_workers: Concurrent fetches (defaults to 'collection.max_workers')
+
+        Returns:
+            DataFrame with one row of company information per ticker
+        """
+        if max_workers is None:
+            max_workers = self.config.get('collection.max_workers', 8)
+
+        cache_file = self.cache_dir / "company_info.parquet"
+        cached = pd.DataFrame()
+        if not self.refresh and cache_file.exists():
+            cached = pd.read_parquet(cache_file)
+
+        known = set(cached['ticker']) if not cached.empty else set()
+        to_fetch = [t for t in dict.fromkeys(tickers) if t not in known]
+
+        fetched = []
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._fetch_company_info, t): t for t in to_fetch}
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching company info"):
+                    info = future.result()
+                    if info is not None:
+                        fetched.append(info)
+
+        if fetched:
+            cached = pd.concat([cached, pd.DataFrame(fetched)], ignore_index=True)
+            cached.to_parquet(cache_file, compression='zstd', index=False)
+
+        # Tickers whose fetch failed get the same placeholders as get_company_info
+        info_by_ticker = {row['ticker']: row for row in cached.to_dict('records')}
+        return pd.DataFrame([info_by_ticker.get(t) or self._unknown_company(t) for t in tickers])
+
+    @staticmethod
+    def _unknown_company(ticker: str) -> Dict[str, any]:
+        """Placeholder company information for a ticker whose lookup failed."""
+        return {
+            'ticker': ticker,
+            'name': ticker,
+            'sector': 'Unknown',
+            'industry': 'Unknown',
+            'market_cap': 0,
+            'country': 'Unknown',
+        }
+
+    def _fetch_company_info(self, ticker: str) -> Optional[Dict[str, any]]:
+        """
+        Fetch company information from yfinance.
+
+        yfinance's fast_info has no name, sector, industry or country, so the
+        full info lookup is still needed and supplies the market cap as well.
+
+        Args:
+            ticker: Stock ticker
+
+        Returns:
+            Dictionary with company information, or None if the lookup failed
+        """
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = yf.Ticker(ticker, session=self.session)
             info = ticker_obj.info
 
             return {
@@ -358,11 +1094,4 @@ class StockCollector:
             }
         except Exception as e:
             logger.error(f"Error fetching info for {ticker}: {e}")
-            return {
-                'ticker': ticker,
-                'name': ticker,
-                'sector': 'Unknown',
-                'industry': 'Unknown',
-                'market_cap': 0,
-                'country': 'Unknown',
-            }
+            return None
@@ -1,20 +1,88 @@
 """Data storage and persistence for analysis results."""
 
+import functools
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 import json
 import pickle
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the json module
+    orjson = None
+
 from ..config import get_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _clean_json_value(obj: Any) -> Any:
+    """Convert a value (recursively) into JSON-serializable Python types."""
+    return _json_converter(type(obj))(obj)
+
+
+def _none_if_na(obj: Any) -> Any:
+    """Map missing values (None, NaN, NaT) to None and pass everything else through."""
+    return None if pd.isna(obj) else obj
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+# JSON conversion by type; other types resolve through their MRO in _json_converter
+_JSON_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    dict: lambda obj: {key: _clean_json_value(value) for key, value in obj.items()},
+    list: lambda obj: [_clean_json_value(item) for item in obj],
+    str: _identity,
+    bool: bool,
+    int: _identity,
+    np.bool_: bool,
+    np.integer: int,
+    np.floating: float,
+    np.ndarray: np.ndarray.tolist,
+    pd.Timestamp: pd.Timestamp.isoformat,
+}
+
+
+def _write_json(obj: Any, file_path: Path):
+    """
+    Write an object as indented JSON.
+
+    orjson, when installed, serializes numpy scalars, arrays and datetimes
+    natively; anything else it cannot encode goes through _clean_json_value.
+
+    Args:
+        obj: Object to write
+        file_path: Output file
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(obj, default=_clean_json_value, option=options))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(_clean_json_value(obj), f, indent=2)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_converter(obj_type: type) -> Callable[[Any], Any]:
+    """Find the JSON converter for a type, checking its base classes in MRO order."""
+    for base in obj_type.__mro__:
+        converter = _JSON_CONVERTERS.get(base)
+        if converter is not None:
+            return converter
+    return _none_if_na
+
+
 class DataStorage:
     """Manages storage and retrieval of analysis data."""
 
@@ -24,6 +92,39 @@ class DataStorage:
         self.raw_dir = self.config.raw_data_dir
         self.processed_dir = self.config.processed_data_dir
 
+        # Timestamp suffix shared by every file of the current analysis run
+        self.run_timestamp: Optional[str] = None
+        self._ensured_dirs: set = set()
+
+        # Figures render and encode in the background (savefig releases the GIL)
+        self._fig_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='savefig')
+        self._pending_figures: List[Future] = []
+
+    @contextmanager
+    def analysis_run(self):
+        """
+        Give every file saved inside the block the same timestamp suffix.
+
+        Yields:
+            The run's timestamp
+        """
+        self.run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        try:
+            yield self.run_timestamp
+        finally:
+            self.run_timestamp = None
+
+    def _timestamp(self) -> str:
+        """Timestamp suffix for a saved file: the current run's, or now."""
+        return self.run_timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    def _ensure_dir(self, directory: Path) -> Path:
+        """Create a directory once per process rather than on every save."""
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
+        return directory
+
     def save_events(
         self,
         events: pd.DataFrame,
@@ -36,26 +137,92 @@ class DataStorage:
         Args:
             events: DataFrame with event data
             event_type: Type of events (e.g., 'releases', 'commits')
-            ticker: Optional ticker symbol for organization
+            ticker: Ticker of the events, if they lack a 'ticker' column
 
         Returns:
-            Path to saved file
+            Path to the event type's dataset directory
         """
-        # Create filename
-        timestamp = datetime.now().strftime('%Y%m%d')
-        if ticker:
-            filename = f"{ticker}_{event_type}_{timestamp}.csv"
-        else:
-            filename = f"all_{event_type}_{timestamp}.csv"
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        timestamp = self._timestamp()
+        base_dir = self._events_dataset_dir(event_type)
+        self._ensure_dir(base_dir)
+
+        if 'ticker' not in events.columns:
+            events = events.assign(ticker=ticker or 'all')
+
+        # Each run adds its own files under ticker=<ticker>/ and never rewrites
+        # earlier runs; loads then read only the partitions they ask for
+        table = pa.Table.from_pandas(events.astype({'ticker': 'string'}), preserve_index=False)
+        ds.write_dataset(
+            table,
+            base_dir,
+            format='parquet',
+            partitioning=self._events_partitioning(),
+            existing_data_behavior='overwrite_or_ignore',
+            basename_template=f"run_{timestamp}_{{i}}.parquet",
+        )
+        logger.info(f"Saved {len(events)} {event_type} events to {base_dir}")
+
+        return base_dir
+
+    def _events_dataset_dir(self, event_type: str) -> Path:
+        """Root of the Parquet dataset holding every run's events of a type."""
+        return self.raw_dir / "events" / event_type
+
+    @staticmethod
+    def _events_partitioning():
+        """Hive-style ticker partitioning of event datasets (tickers always read as strings)."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        return ds.partitioning(pa.schema([('ticker', pa.string())]), flavor='hive')
+
+    def _load_events_dataset(
+        self,
+        event_type: str,
+        ticker: Optional[str],
+        latest: bool
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load one run's events from the Parquet dataset, reading only the ticker's partition.
 
-        file_path = self.raw_dir / "events" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            event_type: Type of events
+            ticker: Optional ticker symbol
+            latest: If True, load the most recent run, otherwise the first
 
-        # Save to CSV
-        events.to_csv(file_path, index=False)
-        logger.info(f"Saved {len(events)} {event_type} events to {file_path}")
+        Returns:
+            DataFrame with events or None if the dataset has no runs
+        """
+        import pyarrow.dataset as ds
 
-        return file_path
+        base_dir = self._events_dataset_dir(event_type)
+        if not base_dir.is_dir():
+            return None
+
+        dataset = ds.dataset(base_dir, format='parquet', partitioning=self._events_partitioning())
+        runs = sorted({Path(f).name.rsplit('_', 1)[0] for f in dataset.files})
+        if not runs:
+            return None
+
+        run = runs[-1] if latest else runs[0]
+        run_files = [f for f in dataset.files if Path(f).name.startswith(f"{run}_")]
+        logger.info(f"Loading {event_type} events from {base_dir} ({run})")
+
+        run_dataset = ds.dataset(
+            run_files,
+            format='parquet',
+            partitioning=self._events_partitioning(),
+            partition_base_dir=str(base_dir),
+        )
+        row_filter = ds.field('ticker') == ticker if ticker else None
+        events = run_dataset.to_table(filter=row_filter).to_pandas()
+
+        # The partition column comes back last; restore it to the front as a category
+        events['ticker'] = events['ticker'].astype('category')
+        return events[['ticker'] + [col for col in events.columns if col != 'ticker']]
 
     def load_events(
         self,
@@ -74,18 +241,24 @@ class DataStorage:
         Returns:
             DataFrame with events or None if not found
         """
+        events = self._load_events_dataset(event_type, ticker, latest)
+        if events is not None:
+            return events
+
         events_dir = self.raw_dir / "events"
         if not events_dir.exists():
             logger.warning(f"Events directory not found: {events_dir}")
             return None
 
-        # Find matching files
+        # Fall back to single files written by older versions (Parquet or CSV)
         if ticker:
-            pattern = f"{ticker}_{event_type}_*.csv"
+            pattern = f"{ticker}_{event_type}_*"
         else:
-            pattern = f"all_{event_type}_*.csv"
+            pattern = f"all_{event_type}_*"
 
-        files = sorted(events_dir.glob(pattern))
+        files = sorted(
+            path for path in events_dir.glob(pattern) if path.suffix in ('.parquet', '.csv')
+        )
 
         if not files:
             logger.warning(f"No event files found matching: {pattern}")
@@ -95,35 +268,54 @@ class DataStorage:
         file_to_load = files[-1] if latest else files[0]
         logger.info(f"Loading events from {file_to_load}")
 
-        return pd.read_csv(file_to_load, parse_dates=['date'] if 'date' in pd.read_csv(file_to_load, nrows=0).columns else None)
+        if file_to_load.suffix == '.parquet':
+            return pd.read_parquet(file_to_load)
+
+        # One read of the CSV; dates are parsed afterwards instead of peeking at the header
+        events = pd.read_csv(file_to_load)
+        if 'date' in events.columns:
+            events['date'] = pd.to_datetime(events['date'], format='ISO8601')
+        return events
 
     def save_event_study_results(
         self,
         results: pd.DataFrame,
-        analysis_name: str
+        analysis_name: str,
+        write_json: bool = False
     ) -> Path:
         """
         Save event study analysis results.
 
+        Results are written as CSV and as a Parquet copy that keeps dtypes.
+
         Args:
             results: DataFrame with event study results
             analysis_name: Name for this analysis run
+            write_json: Also write the full results as JSON records
 
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         filename = f"event_study_{analysis_name}_{timestamp}.csv"
 
         file_path = self.processed_dir / "event_studies" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
         results.to_csv(file_path, index=False)
         logger.info(f"Saved event study results to {file_path}")
 
-        # Also save as JSON for easier inspection
-        json_path = file_path.with_suffix('.json')
-        results.to_json(json_path, orient='records', indent=2, date_format='iso')
+        # Parquet copy keeps dtypes (dates, metadata dicts) for fast reloads
+        try:
+            results.to_parquet(
+                file_path.with_suffix('.parquet'), engine='pyarrow', compression='zstd', index=False
+            )
+        except (ValueError, TypeError, NotImplementedError, ImportError) as e:
+            logger.warning(f"Could not save Parquet copy of event study results: {e}")
+
+        if write_json:
+            json_path = file_path.with_suffix('.json')
+            results.to_json(json_path, orient='records', indent=2, date_format='iso')
 
         return file_path
 
@@ -154,9 +346,21 @@ class DataStorage:
             return None
 
         file_to_load = files[-1] if latest else files[0]
-        logger.info(f"Loading results from {file_to_load}")
 
-        return pd.read_csv(file_to_load)
+        # Prefer the run's Parquet copy when one was written
+        parquet_file = file_to_load.with_suffix('.parquet')
+        if parquet_file.exists():
+            logger.info(f"Loading results from {parquet_file}")
+            results = pd.read_parquet(parquet_file)
+        else:
+            logger.info(f"Loading results from {file_to_load}")
+            results = pd.read_csv(file_to_load)
+
+        # Consumers filter with results[results['valid']], so keep the column boolean
+        if 'valid' in results.columns:
+            results['valid'] = results['valid'].fillna(False).astype(bool)
+
+        return results
 
     def save_aggregated_results(
         self,
@@ -175,11 +379,11 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         filename = f"aggregated_{analysis_name}_by_{group_by}_{timestamp}.csv"
 
         file_path = self.processed_dir / "aggregated" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
         results.to_csv(file_path, index=False)
         logger.info(f"Saved aggregated results to {file_path}")
@@ -201,17 +405,13 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         filename = f"statistical_tests_{analysis_name}_{timestamp}.json"
 
         file_path = self.processed_dir / "statistics" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
-        # Convert numpy types to native Python types for JSON serialization
-        cleaned_results = self._clean_for_json(test_results)
-
-        with open(file_path, 'w') as f:
-            json.dump(cleaned_results, f, indent=2)
+        _write_json(test_results, file_path)
 
         logger.info(f"Saved statistical test results to {file_path}")
         return file_path
@@ -231,16 +431,13 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         filename = f"summary_{analysis_name}_{timestamp}.json"
 
         file_path = self.processed_dir / "summaries" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
-        cleaned_summary = self._clean_for_json(summary)
-
-        with open(file_path, 'w') as f:
-            json.dump(cleaned_summary, f, indent=2)
+        _write_json(summary, file_path)
 
         logger.info(f"Saved summary report to {file_path}")
         return file_path
@@ -250,31 +447,58 @@ class DataStorage:
         fig,
         figure_name: str,
         analysis_name: str,
-        format: str = 'png'
-    ) -> Path:
+        format: str = 'png',
+        dpi: Optional[int] = None
+    ) -> Future:
         """
-        Save matplotlib figure.
+        Save matplotlib figure in the background.
+
+        The figure must not be modified or closed until the save completes;
+        wait_for_figures() blocks until every pending save is written.
 
         Args:
             fig: Matplotlib figure object
             figure_name: Name for the figure
             analysis_name: Name of analysis
             format: Image format (png, pdf, svg)
+            dpi: Resolution (defaults to 'visualization.dpi')
 
         Returns:
-            Path to saved figure
+            Future resolving to the path of the saved figure
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if dpi is None:
+            dpi = self.config.get('visualization.dpi', 150)
+
+        timestamp = self._timestamp()
         filename = f"{figure_name}_{analysis_name}_{timestamp}.{format}"
 
         file_path = self.processed_dir / "figures" / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
-        fig.savefig(file_path, dpi=300, bbox_inches='tight')
-        logger.info(f"Saved figure to {file_path}")
+        future = self._fig_executor.submit(self._write_figure, fig, file_path, dpi)
+        self._pending_figures.append(future)
+        return future
 
+    @staticmethod
+    def _write_figure(fig, file_path: Path, dpi: int) -> Path:
+        """Render a figure to disk (runs on the figure executor)."""
+        fig.savefig(file_path, dpi=dpi, bbox_inches='tight')
+        logger.info(f"Saved figure to {file_path}")
         return file_path
 
+    def wait_for_figures(self) -> List[Path]:
+        """
+        Block until every pending figure save has finished.
+
+        Returns:
+            Paths of the figures saved since the last wait
+
+        Raises:
+            Exception: The first error raised while saving a figure
+        """
+        pending, self._pending_figures = self._pending_figures, []
+        return [future.result() for future in pending]
+
     def get_latest_analysis(
         self,
         analysis_type: str = 'event_studies'
@@ -335,7 +559,7 @@ class DataStorage:
         Returns:
             Path to snapshot directory
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         snapshot_dir = self.processed_dir / "snapshots" / f"{analysis_name}_{timestamp}"
         snapshot_dir.mkdir(parents=True, exist_ok=True)
 
@@ -343,22 +567,21 @@ class DataStorage:
         results.to_csv(snapshot_dir / "event_study_results.csv", index=False)
         aggregated.to_csv(snapshot_dir / "aggregated_results.csv", index=False)
 
-        with open(snapshot_dir / "statistical_tests.json", 'w') as f:
-            json.dump(self._clean_for_json(statistical_tests), f, indent=2)
-
-        with open(snapshot_dir / "summary.json", 'w') as f:
-            json.dump(self._clean_for_json(summary), f, indent=2)
+        _write_json(statistical_tests, snapshot_dir / "statistical_tests.json")
+        _write_json(summary, snapshot_dir / "summary.json")
 
         # Save metadata
         metadata = {
             'analysis_name': analysis_name,
             'timestamp': timestamp,
             'num_events': len(results),
-            'num_valid_events': len(results[results['valid'] == True]) if 'valid' in results.columns else 0,
+            'num_valid_events': int(results['valid'].sum()) if 'valid' in results.columns else 0,
         }
 
-        with open(snapshot_dir / "metadata.json", 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata, snapshot_dir / "metadata.json")
+
+        # Figures saved during the run are part of the snapshot
+        self.wait_for_figures()
 
         logger.info(f"Created analysis snapshot at {snapshot_dir}")
         return snapshot_dir
@@ -373,23 +596,4 @@ class DataStorage:
         Returns:
             JSON-serializable object
         """
-        import numpy as np
-
-        if isinstance(obj, dict):
-            return {key: self._clean_for_json(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._clean_for_json(item) for item in obj]
-        elif isinstance(obj, (np.bool_, bool)):
-            return bool(obj)
-        elif isinstance(obj, (np.integer, np.int64, np.int32)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        elif pd.isna(obj):
-            return None
-        else:
-            return obj
+        return _clean_json_value(obj)
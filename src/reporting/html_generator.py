@@ -1,14 +1,19 @@
 """Generate interactive HTML reports from analysis results."""
 
+import hashlib
 import logging
+import math
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+from string import Template
 
 import pandas as pd
 import numpy as np
+import plotly
 import plotly.graph_objects as go
 import plotly.express as px
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 
 from ..config import get_config
@@ -16,252 +21,32 @@ from ..config import get_config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# plotly.js bundle matching the installed plotly, loaded once in the report <head>
+PLOTLY_CDN_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
 
-class HTMLReportGenerator:
-    """Generates interactive HTML reports with Plotly charts."""
-
-    def __init__(self):
-        """Initialize HTML report generator."""
-        self.config = get_config()
-
-    def create_interactive_car_plot(self, results: pd.DataFrame) -> str:
-        """Create interactive CAR distribution plot."""
-        valid_results = results[results['valid'] == True].copy()
-
-        if 'CAR_-5_5' not in valid_results.columns:
-            return ""
-
-        # Create histogram with event type colors
-        fig = px.histogram(
-            valid_results,
-            x='CAR_-5_5',
-            color='event_type' if 'event_type' in valid_results.columns else None,
-            nbins=50,
-            title='Distribution of Cumulative Abnormal Returns (-5, +5 days)',
-            labels={'CAR_-5_5': 'CAR (-5, +5) (%)', 'count': 'Frequency'},
-            barmode='overlay',
-            opacity=0.7
-        )
-
-        fig.update_xaxes(tickformat='.2%')
-        fig.add_vline(x=0, line_dash="dash", line_color="red", annotation_text="Zero CAR")
-        fig.update_layout(template='plotly_white', height=500)
-
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
-
-    def create_ar_comparison_plot(self, results: pd.DataFrame) -> str:
-        """Create interactive AR comparison by event type."""
-        valid_results = results[results['valid'] == True].copy()
-
-        if 'event_type' not in valid_results.columns or 'ar_day_0' not in valid_results.columns:
-            return ""
-
-        # Calculate statistics by event type
-        stats = valid_results.groupby('event_type')['ar_day_0'].agg([
-            'mean', 'median', 'std', 'count'
-        ]).reset_index()
-
-        stats['sem'] = stats['std'] / np.sqrt(stats['count'])
-
-        fig = go.Figure()
-
-        # Add bars with error bars
-        fig.add_trace(go.Bar(
-            x=stats['event_type'],
-            y=stats['mean'] * 100,
-            error_y=dict(type='data', array=stats['sem'] * 100),
-            name='Mean AR (Day 0)',
-            text=[f"{v:.3f}%" for v in stats['mean'] * 100],
-            textposition='outside'
-        ))
-
-        fig.update_layout(
-            title='Average Abnormal Returns by Event Type',
-            xaxis_title='Event Type',
-            yaxis_title='Mean AR Day 0 (%)',
-            template='plotly_white',
-            height=500,
-            showlegend=False
-        )
-
-        fig.add_hline(y=0, line_dash="dash", line_color="red")
-
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
-
-    def create_timeline_plot(self, events: pd.DataFrame, results: pd.DataFrame) -> str:
-        """Create interactive timeline of events and returns."""
-        merged = events.merge(
-            results[['ticker', 'event_date', 'ar_day_0']],
-            left_on=['ticker', 'date'],
-            right_on=['ticker', 'event_date'],
-            how='inner'
-        )
-
-        if merged.empty:
-            return ""
-
-        # Aggregate by month
-        monthly = merged.groupby([
-            pd.Grouper(key='date', freq='ME'),
-            'event_type'
-        ]).agg({
-            'ar_day_0': 'mean',
-            'ticker': 'count'
-        }).reset_index()
-
-        monthly.columns = ['date', 'event_type', 'mean_ar', 'event_count']
-
-        # Create subplot with two y-axes
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Event Frequency Over Time', 'Average Abnormal Returns Over Time'),
-            vertical_spacing=0.15
-        )
-
-        # Event counts by type
-        for event_type in monthly['event_type'].unique():
-            data = monthly[monthly['event_type'] == event_type]
-            fig.add_trace(
-                go.Bar(
-                    x=data['date'],
-                    y=data['event_count'],
-                    name=event_type,
-                    legendgroup=event_type
-                ),
-                row=1, col=1
-            )
-
-        # Average AR over time
-        ar_monthly = merged.groupby(pd.Grouper(key='date', freq='ME'))['ar_day_0'].mean().reset_index()
-        fig.add_trace(
-            go.Scatter(
-                x=ar_monthly['date'],
-                y=ar_monthly['ar_day_0'] * 100,
-                mode='lines+markers',
-                name='Mean AR',
-                line=dict(width=3),
-                showlegend=False
-            ),
-            row=2, col=1
-        )
-
-        fig.add_hline(y=0, line_dash="dash", line_color="red", row=2, col=1)
-
-        fig.update_xaxes(title_text="Date", row=2, col=1)
-        fig.update_yaxes(title_text="Number of Events", row=1, col=1)
-        fig.update_yaxes(title_text="Mean AR (%)", row=2, col=1)
-
-        fig.update_layout(template='plotly_white', height=800, barmode='stack')
+# Line traces with more points than this render with WebGL (Scattergl)
+WEBGL_POINT_THRESHOLD = 1000
 
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
+# Plot fragment cache version; bump it when a plot's rendering changes
+PLOT_CACHE_VERSION = 'v1'
 
-    def create_top_events_plot(self, results: pd.DataFrame, n: int = 20) -> str:
-        """Create interactive plot of top events."""
-        valid_results = results[results['valid'] == True].copy()
+# CSS class for each significance level (anything else is 'sig-none')
+_SIG_CLASS = {'***': 'sig-high', '**': 'sig-med', '*': 'sig-low'}
 
-        if 'CAR_-5_5' not in valid_results.columns:
-            return ""
-
-        # Top positive and negative
-        top_positive = valid_results.nlargest(n, 'CAR_-5_5')
-        top_negative = valid_results.nsmallest(n, 'CAR_-5_5')
-
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=(f'Top {n} Events (Positive CAR)', f'Top {n} Events (Negative CAR)')
-        )
-
-        # Positive
-        fig.add_trace(
-            go.Bar(
-                y=[f"{row['ticker']}<br>{pd.to_datetime(row['event_date']).strftime('%Y-%m-%d')}"
-                   for _, row in top_positive.iterrows()],
-                x=top_positive['CAR_-5_5'] * 100,
-                orientation='h',
-                marker_color='green',
-                name='Positive',
-                text=[f"{v:.2f}%" for v in top_positive['CAR_-5_5'] * 100],
-                textposition='outside',
-                showlegend=False
-            ),
-            row=1, col=1
-        )
-
-        # Negative
-        fig.add_trace(
-            go.Bar(
-                y=[f"{row['ticker']}<br>{pd.to_datetime(row['event_date']).strftime('%Y-%m-%d')}"
-                   for _, row in top_negative.iterrows()],
-                x=top_negative['CAR_-5_5'] * 100,
-                orientation='h',
-                marker_color='red',
-                name='Negative',
-                text=[f"{v:.2f}%" for v in top_negative['CAR_-5_5'] * 100],
-                textposition='outside',
-                showlegend=False
-            ),
-            row=1, col=2
-        )
-
-        fig.update_xaxes(title_text="CAR (-5,5) %")
-        fig.update_layout(template='plotly_white', height=600)
-
-        return fig.to_html(full_html=False, include_plotlyjs='cdn')
-
-    def generate_html_report(
-        self,
-        events: pd.DataFrame,
-        results: pd.DataFrame,
-        aggregated: pd.DataFrame,
-        statistical_tests: Dict,
-        summary: Dict,
-        output_path: Optional[Path] = None,
-        title: str = "CommitTrader Analysis Report"
-    ) -> Path:
-        """
-        Generate complete HTML report.
-
-        Args:
-            events: Events data
-            results: Event study results
-            aggregated: Aggregated results
-            statistical_tests: Statistical tests
-            summary: Summary dictionary
-            output_path: Output file path
-            title: Report title
-
-        Returns:
-            Path to generated HTML file
-        """
-        if output_path is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_path = self.config.processed_data_dir / "reports" / f"report_{timestamp}.html"
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate plots
-        car_plot = self.create_interactive_car_plot(results)
-        ar_plot = self.create_ar_comparison_plot(results)
-        timeline_plot = self.create_timeline_plot(events, results)
-        top_events_plot = self.create_top_events_plot(results)
-
-        # Generate statistics table
-        valid_results = results[results['valid'] == True]
-        stats_html = self._generate_stats_table(valid_results, summary)
-
-        # Generate significance table
-        sig_html = self._generate_significance_table(statistical_tests)
-
-        # Generate HTML
-        html_content = f"""
+# Report <head> up to the stylesheet
+_REPORT_HEAD = Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>$title</title>
+    <script src="$plotly_url"></script>""")
+
+# Report stylesheet, written verbatim into every report's <head>
+_REPORT_CSS = """
     <style>
-        :root {{
+        :root {
             --color-bg: #fafafa;
             --color-text: #1a1a1a;
             --color-text-light: #666;
@@ -269,30 +54,30 @@ class HTMLReportGenerator:
             --color-accent: #2c2c2c;
             --font-serif: 'Georgia', 'Times New Roman', serif;
             --font-sans: 'Helvetica Neue', Arial, sans-serif;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: var(--font-sans);
             line-height: 1.7;
             color: var(--color-text);
             background: var(--color-bg);
-        }}
+        }
 
-        .nav {{
+        .nav {
             background: white;
             border-bottom: 1px solid var(--color-border);
             position: sticky;
             top: 0;
             z-index: 100;
-        }}
+        }
 
-        .nav-content {{
+        .nav-content {
             max-width: 900px;
             margin: 0 auto;
             padding: 20px 40px;
@@ -300,62 +85,62 @@ class HTMLReportGenerator:
             gap: 35px;
             font-size: 0.95em;
             justify-content: center;
-        }}
+        }
 
-        .nav a {{
+        .nav a {
             color: var(--color-text);
             text-decoration: none;
             transition: opacity 0.4s ease;
             opacity: 0.6;
-        }}
+        }
 
-        .nav a:hover {{
+        .nav a:hover {
             opacity: 1;
-        }}
+        }
 
-        .header {{
+        .header {
             background: white;
             border-bottom: 1px solid var(--color-border);
             padding: 60px 50px;
             margin-bottom: 50px;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-family: var(--font-serif);
             font-size: 2.8em;
             font-weight: 400;
             color: var(--color-accent);
             margin-bottom: 15px;
             letter-spacing: -0.02em;
-        }}
+        }
 
-        .header .subtitle {{
+        .header .subtitle {
             color: var(--color-text-light);
             font-size: 1em;
             margin: 10px 0;
             font-weight: 300;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
             padding: 0 40px 80px;
-        }}
+        }
 
-        .section {{
+        .section {
             background: white;
             padding: 50px;
             margin-bottom: 30px;
             border: 1px solid var(--color-border);
             border-top: none;
-        }}
+        }
 
-        .section:first-of-type {{
+        .section:first-of-type {
             border-top: 1px solid var(--color-border);
-        }}
+        }
 
-        .section h2 {{
+        .section h2 {
             font-family: var(--font-serif);
             font-size: 1.8em;
             font-weight: 400;
@@ -364,130 +149,133 @@ class HTMLReportGenerator:
             padding-bottom: 15px;
             border-bottom: 1px solid var(--color-border);
             letter-spacing: -0.01em;
-        }}
+        }
 
-        .section h3 {{
+        .section h3 {
             font-family: var(--font-serif);
             font-size: 1.3em;
             font-weight: 400;
             color: var(--color-accent);
             margin: 30px 0 15px 0;
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
             gap: 1px;
             background: var(--color-border);
             border: 1px solid var(--color-border);
             margin: 30px 0;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 35px 25px;
             text-align: center;
             transition: background 0.4s ease;
-        }}
+        }
 
-        .stat-card:hover {{
+        .stat-card:hover {
             background: #fcfcfc;
-        }}
+        }
 
-        .stat-card .label {{
+        .stat-card .label {
             font-size: 0.75em;
             color: var(--color-text-light);
             margin-bottom: 12px;
             text-transform: uppercase;
             letter-spacing: 1.2px;
             font-weight: 500;
-        }}
+        }
 
-        .stat-card .value {{
+        .stat-card .value {
             font-size: 2em;
             font-weight: 300;
             color: var(--color-accent);
             font-family: var(--font-serif);
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 30px 0;
             border: 1px solid var(--color-border);
-        }}
+        }
 
-        th, td {{
+        th, td {
             padding: 16px 20px;
             text-align: left;
             border-bottom: 1px solid var(--color-border);
-        }}
+        }
 
-        th {{
+        th {
             background: #f9f9f9;
             color: var(--color-text);
             font-weight: 500;
             text-transform: uppercase;
             font-size: 0.75em;
             letter-spacing: 1px;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background: #fcfcfc;
-        }}
+        }
 
-        tr:last-child td {{
+        tr:last-child td {
             border-bottom: none;
-        }}
+        }
 
-        .significance {{
+        .significance {
             display: inline-block;
             padding: 3px 10px;
             font-size: 0.85em;
             font-weight: 400;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .sig-high {{
+        .sig-high {
             background: #1a1a1a;
             color: white;
-        }}
+        }
 
-        .sig-med {{
+        .sig-med {
             background: #666;
             color: white;
-        }}
+        }
 
-        .sig-low {{
+        .sig-low {
             background: #999;
             color: white;
-        }}
+        }
 
-        .sig-none {{
+        .sig-none {
             background: #e5e7eb;
             color: #6b7280;
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             margin-top: 40px;
             padding: 20px;
             color: #666;
             font-size: 0.9em;
-        }}
+        }
 
-        .methodology {{
+        .methodology {
             background: #f0f4ff;
             padding: 20px;
             border-left: 4px solid #667eea;
             margin: 20px 0;
-        }}
+        }
 
-        .plot-container {{
+        .plot-container {
             margin: 30px 0;
-        }}
+        }
     </style>
-</head>
+"""
+
+# Page header, executive summary, key findings and significance sections
+_REPORT_SUMMARY = Template("""</head>
 <body>
     <nav class="nav">
         <div class="nav-content">
@@ -500,12 +288,12 @@ class HTMLReportGenerator:
     </nav>
 
     <div class="header">
-        <h1>{title}</h1>
+        <h1>$title</h1>
         <div class="subtitle">
             Quantitative Analysis of GitHub Activity and Stock Price Relationships
         </div>
         <div class="subtitle">
-            Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+            Generated: $generated
         </div>
     </div>
 
@@ -515,23 +303,23 @@ class HTMLReportGenerator:
         <div class="stats-grid">
             <div class="stat-card">
                 <div class="label">Total Events Analyzed</div>
-                <div class="value">{summary.get('total_events', 0):,}</div>
+                <div class="value">$total_events</div>
             </div>
             <div class="stat-card">
                 <div class="label">Valid Event Studies</div>
-                <div class="value">{summary.get('valid_event_studies', 0):,}</div>
+                <div class="value">$valid_event_studies</div>
             </div>
             <div class="stat-card">
                 <div class="label">Companies Analyzed</div>
-                <div class="value">{summary.get('total_companies', 0)}</div>
+                <div class="value">$total_companies</div>
             </div>
             <div class="stat-card">
                 <div class="label">Repositories Tracked</div>
-                <div class="value">{summary.get('total_repositories', 0)}</div>
+                <div class="value">$total_repositories</div>
             </div>
         </div>
 
-        {stats_html}
+        $stats_html
     </div>
 
     <div class="section">
@@ -545,16 +333,16 @@ class HTMLReportGenerator:
 
             <h3>Main Results</h3>
             <ul>
-                <li><strong>Mean Abnormal Return (Day 0):</strong> {summary.get('overall_statistics', {}).get('mean_ar_day_0', 0)*100:.4f}%</li>
-                <li><strong>Mean CAR (-5, +5):</strong> {summary.get('overall_statistics', {}).get('mean_car_5_5', 0)*100:.4f}%</li>
-                <li><strong>Events with Positive Returns:</strong> {summary.get('overall_statistics', {}).get('pct_positive_ar', 0):.1f}%</li>
+                <li><strong>Mean Abnormal Return (Day 0):</strong> $mean_ar_day_0%</li>
+                <li><strong>Mean CAR (-5, +5):</strong> $mean_car_5_5%</li>
+                <li><strong>Events with Positive Returns:</strong> $pct_positive_ar%</li>
             </ul>
         </div>
     </div>
 
     <div class="section">
         <h2>Statistical Significance</h2>
-        {sig_html}
+        $sig_html
         <p style="margin-top: 20px; font-size: 0.9em; color: #666;">
             <strong>Significance Levels:</strong>
             <span class="significance sig-high">***</span> p < 0.01 (highly significant) |
@@ -563,35 +351,21 @@ class HTMLReportGenerator:
             <span class="significance sig-none">ns</span> not significant
         </p>
     </div>
+""")
 
+# Opening and closing markup around each plot section
+_PLOT_SECTION_OPEN = Template("""
     <div class="section">
-        <h2>Cumulative Abnormal Returns Distribution</h2>
-        <div class="plot-container">
-            {car_plot}
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>Abnormal Returns by Event Type</h2>
-        <div class="plot-container">
-            {ar_plot}
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>Event Timeline Analysis</h2>
-        <div class="plot-container">
-            {timeline_plot}
-        </div>
-    </div>
-
-    <div class="section">
-        <h2>Top Events</h2>
+        <h2>$heading</h2>
         <div class="plot-container">
-            {top_events_plot}
+""")
+_PLOT_SECTION_CLOSE = """
         </div>
     </div>
+"""
 
+# Static methodology section and footer closing every report
+_REPORT_FOOTER = """
     <div class="section">
         <h2>Methodology</h2>
         <div class="methodology">
@@ -626,9 +400,480 @@ class HTMLReportGenerator:
 </html>
 """
 
-        # Write file
+
+class HTMLReportGenerator:
+    """Generates interactive HTML reports with Plotly charts."""
+
+    def __init__(self):
+        """Initialize HTML report generator."""
+        self.config = get_config()
+
+    @staticmethod
+    def _fig_to_html(fig: go.Figure) -> str:
+        """Render a figure as a <div> that relies on the page's single plotly.js include."""
+        return fig.to_html(full_html=False, include_plotlyjs=False)
+
+    def _plot_cache_file(self, plot_name: str, *frames: pd.DataFrame) -> Optional[Path]:
+        """
+        Cache file for a plot's HTML fragment, keyed by a hash of its input data.
+
+        Args:
+            plot_name: Name of the plot
+            frames: DataFrames the plot is built from
+
+        Returns:
+            Path of the cache file, or None if caching is disabled or the data cannot be hashed
+        """
+        if not self.config.get('collection.cache_enabled'):
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{plot_name}|{PLOT_CACHE_VERSION}|{plotly.__version__}".encode())
+        try:
+            for frame in frames:
+                digest.update(repr((frame.shape, list(frame.columns))).encode())
+                digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        except TypeError:
+            return None
+        return self.config.processed_data_dir / "cache" / f"{plot_name}_{digest.hexdigest()}.html"
+
+    def _cached_plot(
+        self,
+        plot_name: str,
+        build: Callable[..., str],
+        *frames: pd.DataFrame,
+        key_columns: List[List[str]]
+    ) -> str:
+        """
+        Build a plot's HTML fragment, reusing the cached one when its input data is unchanged.
+
+        Only the columns the plot reads are hashed, so unhashable columns such as
+        the per-event metadata dicts do not disable caching.
+
+        Args:
+            plot_name: Name of the plot
+            build: Plot method taking the frames and returning an HTML fragment
+            frames: DataFrames the plot is built from
+            key_columns: Columns of each frame the plot reads
+
+        Returns:
+            HTML fragment
+        """
+        key_frames = [
+            frame[[col for col in columns if col in frame.columns]]
+            for frame, columns in zip(frames, key_columns)
+        ]
+        cache_file = self._plot_cache_file(plot_name, *key_frames)
+        if cache_file is not None and cache_file.exists():
+            logger.info(f"Loading {plot_name} plot from cache")
+            return cache_file.read_text(encoding='utf-8')
+
+        html = build(*frames)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(html, encoding='utf-8')
+        return html
+
+    def create_interactive_car_plot(self, valid_results: pd.DataFrame) -> str:
+        """Create interactive CAR distribution plot from valid event studies."""
+        if 'CAR_-5_5' not in valid_results.columns:
+            return ""
+
+        # Create histogram with event type colors
+        fig = px.histogram(
+            valid_results,
+            x='CAR_-5_5',
+            color='event_type' if 'event_type' in valid_results.columns else None,
+            nbins=50,
+            title='Distribution of Cumulative Abnormal Returns (-5, +5 days)',
+            labels={'CAR_-5_5': 'CAR (-5, +5) (%)', 'count': 'Frequency'},
+            barmode='overlay',
+            opacity=0.7
+        )
+
+        fig.update_xaxes(tickformat='.2%')
+        fig.add_vline(x=0, line_dash="dash", line_color="red", annotation_text="Zero CAR")
+        fig.update_layout(template='plotly_white', height=500)
+
+        return self._fig_to_html(fig)
+
+    def create_ar_comparison_plot(self, valid_results: pd.DataFrame) -> str:
+        """Create interactive AR comparison by event type from valid event studies."""
+        if 'event_type' not in valid_results.columns or 'ar_day_0' not in valid_results.columns:
+            return ""
+
+        # Calculate statistics by event type
+        stats = self._event_type_stats(valid_results['event_type'], valid_results['ar_day_0'])
+
+        fig = go.Figure()
+
+        # Add bars with error bars
+        fig.add_trace(go.Bar(
+            x=stats['event_type'],
+            y=stats['mean'] * 100,
+            error_y=dict(type='data', array=stats['sem'] * 100),
+            name='Mean AR (Day 0)',
+            texttemplate='%{y:.3f}%',
+            textposition='outside'
+        ))
+
+        fig.update_layout(
+            title='Average Abnormal Returns by Event Type',
+            xaxis_title='Event Type',
+            yaxis_title='Mean AR Day 0 (%)',
+            template='plotly_white',
+            height=500,
+            showlegend=False
+        )
+
+        fig.add_hline(y=0, line_dash="dash", line_color="red")
+
+        return self._fig_to_html(fig)
+
+    @staticmethod
+    def _event_type_stats(event_types: pd.Series, values: pd.Series) -> pd.DataFrame:
+        """
+        Mean, median, std, count and standard error of values per event type.
+
+        Args:
+            event_types: Event type per value
+            values: Values to summarize (NaN values are skipped)
+
+        Returns:
+            DataFrame with one row per event type, sorted by event type
+        """
+        from ..analysis._kernels import group_moments
+
+        codes, uniques = pd.factorize(event_types, sort=True)
+        values = values.to_numpy(dtype=np.float64)
+        finite = np.isfinite(values) & (codes >= 0)
+        codes, values = codes[finite].astype(np.int64), values[finite]
+        n_groups = len(uniques)
+
+        means, stds, counts = group_moments(codes, values, n_groups)
+
+        # Medians from one sort by (event type, value)
+        order = np.lexsort((values, codes))
+        sorted_values = values[order]
+        starts = np.cumsum(counts) - counts
+        medians = np.full(n_groups, np.nan)
+        has_values = counts > 0
+        lower = starts + (counts - 1) // 2
+        upper = starts + counts // 2
+        medians[has_values] = (sorted_values[lower[has_values]] + sorted_values[upper[has_values]]) / 2
+
+        return pd.DataFrame({
+            'event_type': uniques,
+            'mean': means,
+            'median': medians,
+            'std': stds,
+            'count': counts,
+            'sem': stds / np.sqrt(counts),
+        })
+
+    @staticmethod
+    def _monthly_event_stats(merged: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Aggregate events with returns by calendar month.
+
+        Args:
+            merged: Events joined with their results ('date', 'event_type', 'ar_day_0')
+
+        Returns:
+            Tuple of (monthly counts and mean AR per event type, mean AR per
+            month including empty months as NaN); months are labelled by
+            their last day
+        """
+        months = merged['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+        type_codes, event_types = pd.factorize(merged['event_type'], sort=True)
+        ar = merged['ar_day_0'].to_numpy(dtype=np.float64)
+
+        has_month = ~np.isnat(months)
+        month_index = months.astype(np.int64)
+        finite = np.isfinite(ar) & has_month
+        ar_values = np.where(finite, ar, 0.0)
+
+        def month_end(month_numbers: np.ndarray) -> np.ndarray:
+            next_month = (month_numbers + 1).astype('datetime64[M]').astype('datetime64[D]')
+            return (next_month - np.timedelta64(1, 'D')).astype('datetime64[ns]')
+
+        # Per (month, event type): one sort on a combined key, then reduceat
+        n_types = max(len(event_types), 1)
+        rows = np.flatnonzero(has_month & (type_codes >= 0))
+        key = month_index[rows] * n_types + type_codes[rows]
+        perm = np.argsort(key, kind='stable')
+        order, sorted_key = rows[perm], key[perm]
+        if len(sorted_key):
+            starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_key)) + 1))
+            group_key = sorted_key[starts]
+            event_count = np.diff(np.append(starts, len(sorted_key)))
+            ar_sum = np.add.reduceat(ar_values[order], starts)
+            ar_count = np.add.reduceat(finite[order].astype(np.int64), starts)
+        else:
+            group_key = event_count = ar_sum = ar_count = np.empty(0, dtype=np.int64)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            monthly = pd.DataFrame({
+                'date': month_end(group_key // n_types),
+                'event_type': np.asarray(event_types)[group_key % n_types],
+                'mean_ar': ar_sum / ar_count,
+                'event_count': event_count,
+            })
+
+        # Per month across types, covering every month between the first and last
+        if has_month.any():
+            first_month = month_index[has_month].min()
+            offsets = month_index[has_month] - first_month
+            n_months = offsets.max() + 1
+            month_sum = np.bincount(offsets, weights=ar_values[has_month], minlength=n_months)
+            month_count = np.bincount(offsets, weights=finite[has_month], minlength=n_months)
+            month_numbers = first_month + np.arange(n_months)
+        else:
+            month_sum = month_count = month_numbers = np.empty(0, dtype=np.int64)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ar_monthly = pd.DataFrame({
+                'date': month_end(month_numbers),
+                'ar_day_0': month_sum / month_count,
+            })
+
+        return monthly, ar_monthly
+
+    def create_timeline_plot(self, events: pd.DataFrame, results: pd.DataFrame) -> str:
+        """Create interactive timeline of events and returns."""
+        merged = events.merge(
+            results[['ticker', 'event_date', 'ar_day_0']],
+            left_on=['ticker', 'date'],
+            right_on=['ticker', 'event_date'],
+            how='inner'
+        )
+
+        if merged.empty:
+            return ""
+
+        # Aggregate by month
+        monthly, ar_monthly = self._monthly_event_stats(merged[['date', 'event_type', 'ar_day_0']])
+
+        # Create subplot with two y-axes
+        fig = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=('Event Frequency Over Time', 'Average Abnormal Returns Over Time'),
+            vertical_spacing=0.15
+        )
+
+        # Event counts by type
+        for event_type in monthly['event_type'].unique():
+            data = monthly[monthly['event_type'] == event_type]
+            fig.add_trace(
+                go.Bar(
+                    x=data['date'].to_numpy(),
+                    y=data['event_count'].to_numpy(dtype=np.int32),
+                    name=event_type,
+                    legendgroup=event_type
+                ),
+                row=1, col=1
+            )
+
+        # Average AR over time
+        scatter = go.Scattergl if len(ar_monthly) > WEBGL_POINT_THRESHOLD else go.Scatter
+        fig.add_trace(
+            scatter(
+                x=ar_monthly['date'].to_numpy(),
+                y=ar_monthly['ar_day_0'].to_numpy(dtype=np.float64) * 100,
+                mode='lines+markers',
+                name='Mean AR',
+                line=dict(width=3),
+                showlegend=False
+            ),
+            row=2, col=1
+        )
+
+        fig.add_hline(y=0, line_dash="dash", line_color="red", row=2, col=1)
+
+        fig.update_xaxes(title_text="Date", row=2, col=1)
+        fig.update_yaxes(title_text="Number of Events", row=1, col=1)
+        fig.update_yaxes(title_text="Mean AR (%)", row=2, col=1)
+
+        fig.update_layout(template='plotly_white', height=800, barmode='stack')
+
+        return self._fig_to_html(fig)
+
+    @staticmethod
+    def _top_n_positions(values: np.ndarray, n: int, largest: bool = True) -> np.ndarray:
+        """
+        Positions of the n largest (or smallest) finite values, best first.
+
+        Uses a partial selection instead of a full sort; ties keep the earlier
+        position first, as DataFrame.nlargest/nsmallest do.
+
+        Args:
+            values: Values to rank
+            n: Number of positions to return
+            largest: Select the largest values instead of the smallest
+
+        Returns:
+            Integer positions into values
+        """
+        positions = np.flatnonzero(np.isfinite(values))
+        keys = -values[positions] if largest else values[positions]
+        if n < len(positions):
+            # Keep every value tied with the n-th so ties resolve by position
+            nth = np.partition(keys, n - 1)[n - 1]
+            selected = keys <= nth
+            positions, keys = positions[selected], keys[selected]
+        order = np.lexsort((positions, keys))[:n]
+        return positions[order]
+
+    @staticmethod
+    def _event_labels(events: pd.DataFrame) -> np.ndarray:
+        """Build "ticker<br>YYYY-MM-DD" axis labels for a frame of events."""
+        tickers = events['ticker'].to_numpy(dtype=str)
+        dates = pd.to_datetime(events['event_date']).dt.strftime('%Y-%m-%d').to_numpy(dtype=str)
+        return np.char.add(np.char.add(tickers, '<br>'), dates)
+
+    def create_top_events_plot(self, valid_results: pd.DataFrame, n: int = 20) -> str:
+        """Create interactive plot of top events from valid event studies."""
+        if 'CAR_-5_5' not in valid_results.columns:
+            return ""
+
+        # Top positive and negative
+        car = valid_results['CAR_-5_5'].to_numpy(dtype=np.float64)
+        top_positive = valid_results.iloc[self._top_n_positions(car, n, largest=True)]
+        top_negative = valid_results.iloc[self._top_n_positions(car, n, largest=False)]
+
+        fig = make_subplots(
+            rows=1, cols=2,
+            subplot_titles=(f'Top {n} Events (Positive CAR)', f'Top {n} Events (Negative CAR)')
+        )
+
+        # Positive
+        fig.add_trace(
+            go.Bar(
+                y=self._event_labels(top_positive),
+                x=top_positive['CAR_-5_5'].to_numpy(dtype=np.float32) * 100,
+                orientation='h',
+                marker_color='green',
+                name='Positive',
+                texttemplate='%{x:.2f}%',
+                textposition='outside',
+                showlegend=False
+            ),
+            row=1, col=1
+        )
+
+        # Negative
+        fig.add_trace(
+            go.Bar(
+                y=self._event_labels(top_negative),
+                x=top_negative['CAR_-5_5'].to_numpy(dtype=np.float32) * 100,
+                orientation='h',
+                marker_color='red',
+                name='Negative',
+                texttemplate='%{x:.2f}%',
+                textposition='outside',
+                showlegend=False
+            ),
+            row=1, col=2
+        )
+
+        fig.update_xaxes(title_text="CAR (-5,5) %")
+        fig.update_layout(template='plotly_white', height=600)
+
+        return self._fig_to_html(fig)
+
+    def generate_html_report(
+        self,
+        events: pd.DataFrame,
+        results: pd.DataFrame,
+        aggregated: pd.DataFrame,
+        statistical_tests: Dict,
+        summary: Dict,
+        output_path: Optional[Path] = None,
+        title: str = "CommitTrader Analysis Report"
+    ) -> Path:
+        """
+        Generate complete HTML report.
+
+        Args:
+            events: Events data
+            results: Event study results
+            aggregated: Aggregated results
+            statistical_tests: Statistical tests
+            summary: Summary dictionary
+            output_path: Output file path
+            title: Report title
+
+        Returns:
+            Path to generated HTML file
+        """
+        if output_path is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_path = self.config.processed_data_dir / "reports" / f"report_{timestamp}.html"
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Valid event studies, selected once for every plot and table; returns
+        # are plotted in float32, which halves the arrays shipped to plotly.js
+        valid_results = results[results['valid']]
+        valid_results = valid_results.astype({
+            column: np.float32 for column in ('CAR_-5_5', 'ar_day_0') if column in valid_results.columns
+        })
+
+        # Generate plots
+        car_plot = self._cached_plot(
+            'car_distribution', self.create_interactive_car_plot, valid_results,
+            key_columns=[['CAR_-5_5', 'event_type']]
+        )
+        ar_plot = self._cached_plot(
+            'ar_comparison', self.create_ar_comparison_plot, valid_results,
+            key_columns=[['event_type', 'ar_day_0']]
+        )
+        timeline_plot = self._cached_plot(
+            'timeline', self.create_timeline_plot, events, results,
+            key_columns=[['ticker', 'date', 'event_type'], ['ticker', 'event_date', 'ar_day_0']]
+        )
+        top_events_plot = self._cached_plot(
+            'top_events', self.create_top_events_plot, valid_results,
+            key_columns=[['CAR_-5_5', 'ticker', 'event_date']]
+        )
+
+        # Generate statistics table
+        stats_html = self._generate_stats_table(valid_results, summary)
+
+        # Generate significance table
+        sig_html = self._generate_significance_table(statistical_tests)
+
+        # Write the page in order, streaming each plot fragment to the file
+        plot_sections = (
+            ('Cumulative Abnormal Returns Distribution', car_plot),
+            ('Abnormal Returns by Event Type', ar_plot),
+            ('Event Timeline Analysis', timeline_plot),
+            ('Top Events', top_events_plot),
+        )
+
+        overall = summary.get('overall_statistics', {})
+
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(_REPORT_HEAD.substitute(title=title, plotly_url=PLOTLY_CDN_URL))
+            f.write(_REPORT_CSS)
+            f.write(_REPORT_SUMMARY.substitute(
+                title=title,
+                generated=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+                total_events=f"{summary.get('total_events', 0):,}",
+                valid_event_studies=f"{summary.get('valid_event_studies', 0):,}",
+                total_companies=summary.get('total_companies', 0),
+                total_repositories=summary.get('total_repositories', 0),
+                stats_html=stats_html,
+                mean_ar_day_0=f"{overall.get('mean_ar_day_0', 0)*100:.4f}",
+                mean_car_5_5=f"{overall.get('mean_car_5_5', 0)*100:.4f}",
+                pct_positive_ar=f"{overall.get('pct_positive_ar', 0):.1f}",
+                sig_html=sig_html,
+            ))
+            for heading, plot_html in plot_sections:
+                f.write(_PLOT_SECTION_OPEN.substitute(heading=heading))
+                f.write(plot_html)
+                f.write(_PLOT_SECTION_CLOSE)
+            f.write(_REPORT_FOOTER)
 
         logger.info(f"HTML report generated: {output_path}")
         return output_path
@@ -681,17 +926,9 @@ class HTMLReportGenerator:
             p_value = result.get('p_value', np.nan)
             sig_level = result.get('significance_level', 'ns')
 
-            # CSS class for significance
-            if sig_level == '***':
-                css_class = 'sig-high'
-            elif sig_level == '**':
-                css_class = 'sig-med'
-            elif sig_level == '*':
-                css_class = 'sig-low'
-            else:
-                css_class = 'sig-none'
+            css_class = _SIG_CLASS.get(sig_level, 'sig-none')
 
-            if np.isnan(p_value):
+            if math.isnan(p_value):
                 p_value_display = "N/A"
             else:
                 p_value_display = f"{p_value:.4f}"
@@ -564,7 +564,7 @@ class WebsiteGenerator:
         <h2>Software</h2>
         <p>
             Analysis conducted using <strong>CommitTrader</strong>, an open-source quantitative research platform.
-            Key libraries: pandas, numpy, scipy, statsmodels, yfinance, PyGithub.
+            Key libraries: pandas, numpy, scipy, yfinance, PyGithub.
         </p>
     </div>
 </body>
@@ -49,7 +49,7 @@ class ResultsVisualizer:
         """
         fig, axes = plt.subplots(1, 2, figsize=self.figsize)
 
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid']].copy()
 
         if valid_results.empty or car_column not in valid_results.columns:
             logger.warning(f"No valid data for {car_column}")
@@ -105,7 +105,7 @@ class ResultsVisualizer:
         """
         fig, ax = plt.subplots(figsize=self.figsize)
 
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid']].copy()
 
         if valid_results.empty:
             return fig
@@ -165,7 +165,7 @@ class ResultsVisualizer:
         """
         fig, axes = plt.subplots(1, 2, figsize=self.figsize)
 
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid']].copy()
 
         if valid_results.empty or 'event_type' not in valid_results.columns:
             return fig
@@ -321,7 +321,7 @@ class ResultsVisualizer:
         """
         fig, axes = plt.subplots(1, 2, figsize=(14, 8))
 
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid']].copy()
 
         if valid_results.empty or metric not in valid_results.columns:
             return fig
@@ -373,7 +373,7 @@ class ResultsVisualizer:
         fig = plt.figure(figsize=(16, 12))
         gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
 
-        valid_results = results[results['valid'] == True].copy()
+        valid_results = results[results['valid']].copy()
 
         # 1. Overall CAR distribution
         ax1 = fig.add_subplot(gs[0, :2])
@@ -0,0 +1,65 @@
+"""Tests for the event study analysis."""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.event_study import EventStudy
+from src.config import get_config
+from src.data.stock_collector import StockCollector
+
+
+def _synthetic_prices():
+    """Daily closes for the market index and one stock over a few years."""
+    days = pd.bdate_range('2019-01-01', '2023-12-31')
+    rng = np.random.default_rng(0)
+    market_returns = rng.normal(0.0004, 0.01, len(days))
+    stock_returns = 0.0002 + 1.2 * market_returns + rng.normal(0, 0.015, len(days))
+    return {
+        get_config().market_index: pd.DataFrame({'close': 3000 * np.cumprod(1 + market_returns)}, index=days),
+        'AAA': pd.DataFrame({'close': 100 * np.cumprod(1 + stock_returns)}, index=days),
+    }
+
+
+class EventStudyParityTest(unittest.TestCase):
+    """Single-event and batched analyses must agree."""
+
+    def setUp(self):
+        prices = _synthetic_prices()
+
+        def get_stock_data(collector, ticker, start_date=None, end_date=None, use_cache=True):
+            data = prices.get(ticker)
+            if data is None:
+                return pd.DataFrame()
+            return data.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)].copy()
+
+        patcher = mock.patch.object(StockCollector, 'get_stock_data', get_stock_data)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_single_matches_batch_for_intraday_events(self):
+        # GitHub events carry a time of day; both paths must use the calendar day
+        rng = np.random.default_rng(1)
+        event_dates = (
+            pd.Timestamp('2020-06-01')
+            + pd.to_timedelta(rng.integers(0, 1000, 20), 'D')
+            + pd.to_timedelta(rng.integers(1, 86400, 20), 's')
+        )
+
+        batch = EventStudy().analyze_events_batch(
+            'AAA', event_dates.to_numpy(), np.full(len(event_dates), 'release', dtype=object)
+        )
+
+        study = EventStudy()
+        for i, event_date in enumerate(event_dates):
+            single = study.analyze_event('AAA', event_date, 'release')
+            self.assertTrue(single['valid'])
+            self.assertTrue(batch['valid'].iloc[i])
+            for column in ('ar_day_0', 'mean_ar', 'CAR_0_1', 'CAR_-5_5'):
+                self.assertAlmostEqual(single[column], batch[column].iloc[i], places=12, msg=column)
+
+
+if __name__ == '__main__':
+    unittest.main()